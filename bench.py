@@ -0,0 +1,540 @@
+"""Benchmarks for the bot's data managers against a generated league.
+
+Builds a synthetic league with the same schema the bot reads (proteam,
+proteamstandings, todaysgame, transactions, playerstats, goaliestats, players,
+trophywinners), points DatabaseManager at it and times every manager operation.
+Each operation is also run once under tracemalloc to report its peak
+allocation, and the number of SQL statements it issued is counted.
+
+By default the league lives in a temporary SQLite file, so nothing but the
+bot's own requirements is needed. Pass --backend mysql to load it into a
+scratch MySQL database instead (HOST, DBUSER and DBPASSWORD come from the
+environment like the bot; the database named by --mysql-database is dropped
+and recreated, and may not be the bot's own DATABASE).
+
+    python bench.py
+    python bench.py --teams 40 --seasons 30 --repeat 10 --output bench_output.txt
+    python bench.py --backend mysql --mysql-database simbot_bench --filter Trade
+"""
+import argparse
+import asyncio
+import os
+import random
+import re
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+import bot
+
+# Column definitions per table, in a subset of SQL both MySQL and SQLite accept
+SCHEMA = {
+    'proteam': [
+        ('Number', 'INT'), ('Name', 'VARCHAR(64)'), ('Division', 'VARCHAR(64)'), ('Conference', 'VARCHAR(64)'),
+    ],
+    'proteamstandings': [
+        ('Number', 'INT'), ('Season_ID', 'INT'), ('Point', 'INT'), ('GP', 'INT'), ('W', 'INT'), ('L', 'INT'),
+        ('OTW', 'INT'), ('OTL', 'INT'), ('SOW', 'INT'), ('SOL', 'INT'), ('GF', 'INT'), ('GA', 'INT'),
+    ],
+    'todaysgame': [
+        ('Date', 'DATETIME'), ('Type', 'VARCHAR(8)'), ('Season_ID', 'INT'),
+        ('VisitorTeam', 'VARCHAR(64)'), ('VisitorTeamScore', 'INT'),
+        ('HomeTeam', 'VARCHAR(64)'), ('HomeTeamScore', 'INT'),
+        ('VisitorTeamGoaler', 'VARCHAR(255)'), ('HomeTeamGoaler', 'VARCHAR(255)'),
+    ],
+    'transactions': [
+        ('T_ID', 'INT PRIMARY KEY'), ('DateCreated', 'DATETIME'), ('Team1', 'INT'), ('Team2', 'INT'),
+        ('Team1List', 'TEXT'), ('Team2List', 'TEXT'), ('Team1Approved', 'VARCHAR(8)'),
+        ('Team2Approved', 'VARCHAR(8)'), ('CommishApproved', 'VARCHAR(8)'), ('FutureConsiderations', 'TEXT'),
+    ],
+    'playerstats': [
+        ('Number', 'INT'), ('Name', 'VARCHAR(64)'), ('Team', 'INT'), ('Season_ID', 'INT'), ('ProGP', 'INT'),
+        ('ProShots', 'INT'), ('ProG', 'INT'), ('ProA', 'INT'), ('ProPoint', 'INT'), ('ProPlusMinus', 'INT'),
+        ('ProPim', 'INT'), ('ProShotsBlock', 'INT'), ('ProHits', 'INT'), ('ProGW', 'INT'), ('Active', 'VARCHAR(8)'),
+    ],
+    'goaliestats': [
+        ('Number', 'INT'), ('Name', 'VARCHAR(64)'), ('Team', 'INT'), ('Season_ID', 'INT'), ('ProGP', 'INT'),
+        ('ProMinPlay', 'INT'), ('ProW', 'INT'), ('ProL', 'INT'), ('ProOTL', 'INT'), ('ProShutouts', 'INT'),
+        ('ProGA', 'INT'), ('ProSA', 'INT'), ('Active', 'VARCHAR(8)'),
+    ],
+    'players': [
+        ('Number', 'INT'), ('Name', 'VARCHAR(64)'), ('PosC', 'VARCHAR(8)'), ('PosLW', 'VARCHAR(8)'),
+        ('PosRW', 'VARCHAR(8)'), ('PosD', 'VARCHAR(8)'),
+    ],
+    'trophywinners': [('T_ID', 'INT')] + [(award, 'INT') for award in (
+        'PlayoffMVP', 'TopScorer', 'MVP', 'GoalieOfTheYear', 'DefensemanOfTheYear', 'RookieOfTheYear',
+        'BestDefensiveForward', 'MostSportsmanlikePlayer', 'CoachOfTheYear', 'TopGoalScorer', 'LowestGAA',
+        'LowestPIM', 'GeneralManager', 'FarmPlayoffMVP', 'FarmTopScorer', 'FarmMVP', 'FarmGoalieOfTheYear',
+        'FarmDefensemanOfTheYear', 'FarmRookieOfTheYear', 'FarmBestDefensiveForward',
+        'FarmMostSportsmanlikePlayer', 'FarmCoachOfTheYear', 'FarmTopGoalScorer', 'FarmLowestGAA', 'FarmLowestPIM',
+    )] + [('Team', 'INT'), ('Season_ID', 'INT')],
+}
+
+DIVISIONS = [
+    ('Stefan Division', 'Western'), ('Bonsignore Division', 'Western'),
+    ('Brendl Division', 'Eastern'), ('Daigle Division', 'Eastern'),
+]
+
+POSITIONS = ['C', 'LW', 'RW', 'D']
+
+
+def team_names(teams: int) -> List[str]:
+    """Real team names first, then numbered expansion teams."""
+    names = list(bot.TEAM_ACRONYMS)[:teams]
+    return names + [f"Expansion {number}" for number in range(len(names) + 1, teams + 1)]
+
+
+def goalie_line(name: str, minutes: str, rng: random.Random) -> str:
+    """A goalie summary in the simulator's format, ending in the time played."""
+    shots = rng.randint(20, 45)
+    saves = shots - rng.randint(0, 6)
+    return f"{name} ({shots} shots, {saves} saves, {saves / shots:.3f} save pct, {minutes} minutes)"
+
+
+def generate_league(teams: int, seasons: int, games_per_team: int, players_per_team: int,
+                    goalies_per_team: int, trades_per_season: int, seed: int) -> Dict[str, List[Tuple]]:
+    """Generate every table's rows for a league with the given shape."""
+    rng = random.Random(seed)
+    names = team_names(teams)
+    tables: Dict[str, List[Tuple]] = {table: [] for table in SCHEMA}
+
+    for number, name in enumerate(names, 1):
+        division, conference = DIVISIONS[(number - 1) % len(DIVISIONS)]
+        tables['proteam'].append((number, name, division, conference))
+
+    skaters = players_per_team * teams
+    for number in range(skaters):
+        position = POSITIONS[number % len(POSITIONS)]
+        tables['players'].append((number, f"Skater {number}", *[str(position == p) for p in POSITIONS]))
+
+    first_day = datetime(2000, 10, 1)
+    trade_id = 0
+
+    for season in range(1, seasons + 1):
+        season_start = first_day + timedelta(days=365 * (season - 1))
+        standings = {number: dict(GP=0, W=0, L=0, OTW=0, OTL=0, SOW=0, SOL=0, GF=0, GA=0) for number in range(1, teams + 1)}
+
+        # Every team plays every other night until it has games_per_team games
+        for day in range(games_per_team):
+            game_date = season_start + timedelta(days=day)
+            order = list(range(1, teams + 1))
+            rng.shuffle(order)
+            for visitor, home in zip(order[::2], order[1::2]):
+                minutes = rng.choice(['60:00'] * 6 + ['63:27', '61:45', '65:00'])
+                visitor_score, home_score = rng.randint(0, 6), rng.randint(0, 6)
+                if visitor_score == home_score or minutes != '60:00':
+                    if rng.random() < 0.5:
+                        visitor_score = max(visitor_score, home_score) + 1
+                    else:
+                        home_score = max(visitor_score, home_score) + 1
+
+                for game_type, prefix in (('Pro', ''), ('Farm', 'Farm ')):
+                    tables['todaysgame'].append((
+                        game_date, game_type, season,
+                        prefix + names[visitor - 1], visitor_score, prefix + names[home - 1], home_score,
+                        goalie_line(f"Goalie {visitor}", minutes, rng), goalie_line(f"Goalie {home}", minutes, rng),
+                    ))
+
+                winner, loser = (visitor, home) if visitor_score > home_score else (home, visitor)
+                win_column, loss_column = {'60:00': ('W', 'L'), '65:00': ('SOW', 'SOL')}.get(minutes, ('OTW', 'OTL'))
+                standings[winner][win_column] += 1
+                standings[loser][loss_column] += 1
+                for number, scored, allowed in ((visitor, visitor_score, home_score), (home, home_score, visitor_score)):
+                    standings[number]['GP'] += 1
+                    standings[number]['GF'] += scored
+                    standings[number]['GA'] += allowed
+
+        for number, row in standings.items():
+            points = 2 * (row['W'] + row['OTW'] + row['SOW']) + row['OTL'] + row['SOL']
+            tables['proteamstandings'].append((
+                number, season, points, row['GP'], row['W'], row['L'], row['OTW'], row['OTL'],
+                row['SOW'], row['SOL'], row['GF'], row['GA'],
+            ))
+
+        # One stint per skater, plus extra stints for the ones traded mid-season
+        for number in range(skaters):
+            team = number % teams + 1
+            stints = [(team, 'True')]
+            if number % 17 == 0:
+                stints = [(team % teams + 1, 'False')] + stints
+            for stint_team, active in stints:
+                goals, assists = rng.randint(0, 40), rng.randint(0, 60)
+                tables['playerstats'].append((
+                    number, f"Skater {number}", stint_team, season, rng.randint(1, games_per_team),
+                    rng.randint(0, 300), goals, assists, goals + assists, rng.randint(-30, 30),
+                    rng.randint(0, 120), rng.randint(0, 150), rng.randint(0, 250), rng.randint(0, 10), active,
+                ))
+
+        for index in range(goalies_per_team * teams):
+            team = index % teams + 1
+            stints = [(team, 'True')] + ([(team % teams + 1, 'False')] if index % 5 == 0 else [])
+            for stint_team, active in stints:
+                games = rng.randint(1, games_per_team)
+                goals_against = rng.randint(games, games * 4)
+                tables['goaliestats'].append((
+                    100000 + index, f"Goalie {index}", stint_team, season, games, games * 3600,
+                    rng.randint(0, games), rng.randint(0, games), rng.randint(0, 5), rng.randint(0, 8),
+                    goals_against, goals_against + rng.randint(games * 20, games * 30), active,
+                ))
+
+        for _ in range(trades_per_season):
+            trade_id += 1
+            team1, team2 = rng.sample(range(1, teams + 1), 2)
+            outgoing = [f"Skater {rng.randrange(skaters)}" for _ in range(rng.randint(1, 3))]
+            incoming = [f"Skater {rng.randrange(skaters)}" for _ in range(rng.randint(1, 2))]
+            if rng.random() < 0.3:
+                incoming.append(f"{2000 + season} Round {rng.randint(1, 5)} Pick")
+            approved = rng.choice(['True', 'True', 'False'])
+            tables['transactions'].append((
+                trade_id, season_start + timedelta(days=rng.randrange(365)), team1, team2,
+                '<br>'.join(outgoing) + '<br>', '<br>'.join(incoming) + '<br>', 'True', 'True', approved, 'NULL',
+            ))
+
+        awards = [rng.randrange(skaters) for _ in range(25)]
+        tables['trophywinners'].append((season, *awards, rng.randint(1, teams), season))
+
+    return tables
+
+
+class SQLiteCursor:
+    """Adapts a sqlite3 cursor to the mysql-connector calls the bot makes."""
+
+    # Aggregates such as MAX(Date) come back from SQLite as text
+    DATETIME_TEXT = re.compile(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}')
+
+    def __init__(self, cursor: sqlite3.Cursor):
+        self._cursor = cursor
+
+    @property
+    def rowcount(self) -> int:
+        return self._cursor.rowcount
+
+    @property
+    def column_names(self) -> Tuple[str, ...]:
+        return tuple(column[0] for column in self._cursor.description or ())
+
+    def execute(self, query: str, params: Tuple = None) -> None:
+        self._cursor.execute(query.replace('%s', '?'), params or ())
+
+    def executemany(self, query: str, rows: List[Tuple]) -> None:
+        self._cursor.executemany(query.replace('%s', '?'), rows)
+
+    def fetchall(self) -> List[Tuple]:
+        return [
+            tuple(
+                datetime.fromisoformat(value)
+                if isinstance(value, str) and SQLiteCursor.DATETIME_TEXT.match(value) else value
+                for value in row
+            )
+            for row in self._cursor.fetchall()
+        ]
+
+    def close(self) -> None:
+        self._cursor.close()
+
+
+class SQLiteConnection:
+    """Adapts a sqlite3 connection to the mysql-connector calls the pool makes."""
+
+    def __init__(self, path: str):
+        self._connection = sqlite3.connect(path, check_same_thread=False, detect_types=sqlite3.PARSE_DECLTYPES)
+
+    def cursor(self, buffered: bool = True) -> SQLiteCursor:
+        return SQLiteCursor(self._connection.cursor())
+
+    def ping(self, reconnect: bool = False) -> None:
+        pass
+
+    def commit(self) -> None:
+        self._connection.commit()
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(' '))
+sqlite3.register_converter('DATETIME', lambda value: datetime.fromisoformat(value.decode()))
+
+
+def connect_backend(args: argparse.Namespace) -> Tuple[Callable[[], Any], Tuple[type, ...]]:
+    """Get a connection factory and its disconnect errors for the chosen backend."""
+    if args.backend == 'sqlite':
+        path = args.sqlite_path or os.path.join(tempfile.mkdtemp(prefix='simbot-bench-'), 'league.db')
+        return (lambda: SQLiteConnection(path)), (sqlite3.OperationalError,)
+
+    if args.mysql_database == bot.DATABASE:
+        sys.exit(f"Refusing to overwrite the bot's own database {bot.DATABASE!r}; pick another --mysql-database")
+
+    server = bot.mysql.connect(host=bot.HOST, user=bot.USER, password=bot.PASSWORD)
+    cursor = server.cursor()
+    cursor.execute(f"DROP DATABASE IF EXISTS `{args.mysql_database}`")
+    cursor.execute(f"CREATE DATABASE `{args.mysql_database}`")
+    server.close()
+
+    def connect():
+        return bot.mysql.connect(host=bot.HOST, user=bot.USER, password=bot.PASSWORD,
+                                 database=args.mysql_database, autocommit=True)
+
+    return connect, (bot.mysql.errors.OperationalError, bot.mysql.errors.InterfaceError)
+
+
+def load_league(connection: Any, tables: Dict[str, List[Tuple]], with_indexes: bool) -> None:
+    """Create the schema, insert the generated rows and add the bot's recommended indexes."""
+    cursor = connection.cursor()
+    for table, columns in SCHEMA.items():
+        cursor.execute(f"DROP TABLE IF EXISTS {table}")
+        cursor.execute(f"CREATE TABLE {table} ({', '.join(f'{name} {kind}' for name, kind in columns)})")
+        placeholders = ', '.join(['%s'] * len(columns))
+        rows = tables[table]
+        for start in range(0, len(rows), 5000):
+            cursor.executemany(f"INSERT INTO {table} VALUES ({placeholders})", rows[start:start + 5000])
+
+    if with_indexes:
+        for table, index_name, columns in bot.SchemaMaintenance.RECOMMENDED_INDEXES:
+            cursor.execute(f"CREATE INDEX {index_name} ON {table} ({', '.join(columns)})")
+
+    connection.commit()
+    cursor.close()
+
+
+def operations(tables: Dict[str, List[Tuple]]) -> Iterator[Tuple[str, str, Callable[[], Any]]]:
+    """Yield (manager, operation, coroutine function) for everything benchmarked."""
+    season_id = max(row[1] for row in tables['proteamstandings'])
+    team1, team2 = tables['proteam'][0][1], tables['proteam'][1][1]
+    busiest_day = str(tables['todaysgame'][-1][0].date())
+    traded_player = tables['transactions'][-1][4].split('<br>')[0]
+    trades = tables['transactions'][-50:]
+
+    async def standings_rows():
+        return await bot.StandingsManager.get_team_stats(season_id)
+
+    async def standings_model():
+        return await bot.StandingsManager.load()
+
+    async def standings_format():
+        model = await bot.StandingsManager.load()
+        return bot.StandingsManager.format_league_standings(model.league)
+
+    yield 'StandingsManager', 'get_team_stats', standings_rows
+    yield 'StandingsManager', 'load (model with every view)', standings_model
+    yield 'StandingsManager', 'load + format_league_standings', standings_format
+
+    async def scores_for_date():
+        return await bot.ScoresManager.get_games_for_date(busiest_day)
+
+    async def scores_formatted():
+        games, _ = await bot.ScoresManager.get_games_for_date(busiest_day)
+        return bot.ScoresManager.format_game_scores(games)
+
+    async def farm_scores_for_date():
+        return await bot.ScoresManager.get_farm_games_for_date(busiest_day)
+
+    async def team_games_season():
+        return await bot.ScoresManager.get_recent_games_for_team(team1, 'all', 10)
+
+    async def team_games_all_time():
+        games = await bot.ScoresManager.get_recent_games_for_team(team1, 'all', 82, True)
+        return bot.ScoresManager.format_games_list(games)
+
+    async def head_to_head_all_time():
+        games = await bot.ScoresManager.get_recent_games_for_team(team1, team2, 82, True)
+        return bot.ScoresManager.format_games_list(games)
+
+    yield 'ScoresManager', 'get_games_for_date', scores_for_date
+    yield 'ScoresManager', 'get_games_for_date + format_game_scores', scores_formatted
+    yield 'ScoresManager', 'get_farm_games_for_date', farm_scores_for_date
+    yield 'ScoresManager', 'recent games, this season', team_games_season
+    yield 'ScoresManager', 'recent 82 games, all time + format', team_games_all_time
+    yield 'ScoresManager', 'head-to-head 82 games, all time + format', head_to_head_all_time
+
+    async def record_book_build():
+        bot.RecordBook.reset()
+        return await bot.RecordBook.get_seasons(None)
+
+    async def team_record_all_time():
+        return await bot.RecordBook.describe(team1, 'all', None)
+
+    async def head_to_head_record_all_time():
+        return await bot.RecordBook.describe(team1, team2, None)
+
+    yield 'RecordBook', 'get_seasons, full build', record_book_build
+    yield 'RecordBook', 'describe team, all time', team_record_all_time
+    yield 'RecordBook', 'describe head-to-head, all time', head_to_head_record_all_time
+
+    async def trade_index_build():
+        bot.TradeIndex.reset()
+        await bot.TradeIndex.refresh()
+
+    async def trades_by_player():
+        return await bot.TradeManager.get_trades_by_player(traded_player, 50)
+
+    async def trades_by_team():
+        return await bot.TradeManager.get_trades_by_team(team1, 'all', 50)
+
+    async def trades_between_teams():
+        return await bot.TradeManager.get_trades_by_team(team1, team2, 50)
+
+    async def format_trades():
+        return [await bot.TradeManager.format_single_trade(trade, number) for number, trade in enumerate(trades, 1)]
+
+    yield 'TradeManager', 'TradeIndex full build', trade_index_build
+    yield 'TradeManager', 'get_trades_by_player', trades_by_player
+    yield 'TradeManager', 'get_trades_by_team, all', trades_by_team
+    yield 'TradeManager', 'get_trades_by_team, pair', trades_between_teams
+    yield 'TradeManager', 'format_single_trade x50', format_trades
+
+    async def awards_current():
+        return await bot.AwardsManager.get_award_winners()
+
+    async def awards_history():
+        awards = await bot.AwardsManager.get_award_winners('MVP', 'all')
+        return await bot.AwardsManager.format_awards(awards, 'MVP', 'all')
+
+    yield 'AwardsManager', 'get_award_winners, latest season', awards_current
+    yield 'AwardsManager', 'MVP history + format_awards', awards_history
+
+    async def player_stats():
+        return await bot.PlayerStatsManager.get_player_stats(season_id)
+
+    async def merged_player_stats():
+        return await bot.PlayerStatsManager.get_merged_player_stats(season_id)
+
+    async def python_merged_player_stats():
+        return bot.PlayerDataManager.merge_traded_players(await bot.PlayerStatsManager.get_player_stats(season_id))
+
+    async def skater_leaders():
+        table = bot.StatTable(await bot.PlayerStatsManager.get_merged_player_stats(season_id),
+                              bot.PlayerStatsManager.TABLE_COLUMNS)
+        leaders = bot.PlayerStatsManager.get_leaders(table, 'all', 'D', 'Points')
+        return bot.PlayerStatsManager.format_player_leaders(leaders, 'Points')
+
+    yield 'PlayerStatsManager', 'get_player_stats', player_stats
+    yield 'PlayerStatsManager', 'get_merged_player_stats', merged_player_stats
+    yield 'PlayerStatsManager', 'get_player_stats + merge_traded_players', python_merged_player_stats
+    yield 'PlayerStatsManager', 'merged + StatTable + leaders + format', skater_leaders
+
+    async def goalie_stats():
+        return await bot.GoalieStatsManager.get_goalie_stats(season_id)
+
+    async def merged_goalie_stats():
+        return await bot.GoalieStatsManager.get_merged_goalie_stats(season_id)
+
+    async def goalie_leaders():
+        goalies = bot.GoalieStatsManager.calculate_goalie_stats(
+            await bot.GoalieStatsManager.get_merged_goalie_stats(season_id)
+        )
+        table = bot.StatTable(goalies, bot.GoalieStatsManager.TABLE_COLUMNS)
+        leaders = bot.GoalieStatsManager.get_leaders(table, 'GAA', 10, 5)
+        return bot.GoalieStatsManager.format_goalie_leaders(leaders, 'GAA')
+
+    yield 'GoalieStatsManager', 'get_goalie_stats', goalie_stats
+    yield 'GoalieStatsManager', 'get_merged_goalie_stats', merged_goalie_stats
+    yield 'GoalieStatsManager', 'merged + calculate + leaders + format', goalie_leaders
+
+
+def query_count() -> int:
+    """Total statements recorded by the query profiler so far."""
+    return sum(entry['calls'] for entry in bot.QueryProfiler.top(len(bot.QueryProfiler._stats)))
+
+
+async def run_benchmarks(tables: Dict[str, List[Tuple]], repeat: int, name_filter: str) -> List[Dict[str, Any]]:
+    """Time each operation `repeat` times, then measure its peak allocation once."""
+    results = []
+
+    # Publish watermarks like the running bot's watcher does
+    await bot.DataVersion.poll()
+
+    for manager, operation, run in operations(tables):
+        if name_filter and name_filter.lower() not in f"{manager} {operation}".lower():
+            continue
+
+        # Warm up the pool, reference data and the trade index
+        await run()
+
+        before = query_count()
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            await run()
+            timings.append(time.perf_counter() - started)
+        queries = (query_count() - before) / repeat
+
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        await run()
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+        tracemalloc.stop()
+
+        results.append({
+            'manager': manager, 'operation': operation, 'queries': queries,
+            'min': min(timings), 'median': statistics.median(timings), 'max': max(timings),
+            'peak': peak,
+        })
+
+    return results
+
+
+def format_results(results: List[Dict[str, Any]], summary: str) -> str:
+    """Format the results as a fixed-width table."""
+    lines = [summary, '']
+    lines.append(f"{'manager':<20}{'operation':<44}{'queries':>8}{'min ms':>10}{'median ms':>11}{'max ms':>10}{'peak KiB':>10}")
+    for result in results:
+        lines.append(
+            f"{result['manager']:<20}{result['operation'][:43]:<44}{result['queries']:>8.1f}"
+            f"{result['min'] * 1000:>10.2f}{result['median'] * 1000:>11.2f}{result['max'] * 1000:>10.2f}"
+            f"{result['peak'] / 1024:>10.1f}"
+        )
+    return '\n'.join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the bot's data managers against a generated league")
+    parser.add_argument('--teams', type=int, default=32, help="teams in the league (default 32)")
+    parser.add_argument('--seasons', type=int, default=10, help="seasons of history (default 10)")
+    parser.add_argument('--games-per-team', type=int, default=82, help="regular season games per team (default 82)")
+    parser.add_argument('--players-per-team', type=int, default=25, help="skaters per team (default 25)")
+    parser.add_argument('--goalies-per-team', type=int, default=3, help="goalies per team (default 3)")
+    parser.add_argument('--trades-per-season', type=int, default=60, help="trades per season (default 60)")
+    parser.add_argument('--seed', type=int, default=1, help="random seed for the generated league")
+    parser.add_argument('--repeat', type=int, default=5, help="timed runs per operation (default 5)")
+    parser.add_argument('--filter', default='', help="only run operations whose manager or name contains this")
+    parser.add_argument('--no-indexes', action='store_true', help="skip the indexes from --ensure-indexes")
+    parser.add_argument('--backend', choices=('sqlite', 'mysql'), default='sqlite')
+    parser.add_argument('--sqlite-path', help="SQLite file to build (default: a temporary file)")
+    parser.add_argument('--mysql-database', default='simbot_bench', help="scratch MySQL database (dropped and recreated)")
+    parser.add_argument('--output', help="also write the report to this file")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    tables = generate_league(args.teams, args.seasons, args.games_per_team, args.players_per_team,
+                             args.goalies_per_team, args.trades_per_season, args.seed)
+    connect, disconnect_errors = connect_backend(args)
+    connection = connect()
+    load_league(connection, tables, not args.no_indexes)
+    connection.close()
+    built = time.perf_counter() - started
+
+    bot.DatabaseManager.set_pool(bot.ConnectionPool(connect, disconnect_errors=disconnect_errors))
+    results = asyncio.run(run_benchmarks(tables, args.repeat, args.filter))
+
+    summary = (
+        f"{args.backend}: {args.teams} teams, {args.seasons} seasons, "
+        f"{len(tables['todaysgame'])} games, {len(tables['playerstats'])} skater rows, "
+        f"{len(tables['transactions'])} trades (built in {built:.1f} s), "
+        f"{args.repeat} runs per operation{', no indexes' if args.no_indexes else ''}"
+    )
+    report = format_results(results, summary)
+    print(report)
+    if args.output:
+        with open(args.output, 'w') as output:
+            output.write(report + '\n')
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,26 @@
 import mysql.connector as mysql
-from discord.ext import commands
+import numpy as np
+from discord.ext import commands, tasks
 import discord
-from datetime import date
+from datetime import date, datetime, timedelta
 from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+import argparse
+import asyncio
+import contextvars
+import difflib
+import functools
+import logging
+import logging.handlers
 import os
-from typing import List, Dict, Any, Optional, Tuple
+import queue
+import re
+import sys
+import threading
+import time
+from typing import List, Dict, Any, Optional, Tuple, Callable
 
 # Load environment variables
 load_dotenv()
@@ -16,6 +32,65 @@ DATABASE = os.environ.get('DATABASE')
 USER = os.environ.get('DBUSER')
 PASSWORD = os.environ.get('DBPASSWORD')
 
+# Connection pool settings
+DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 5))
+DB_POOL_RECYCLE = float(os.environ.get('DB_POOL_RECYCLE', 3600))  # seconds idle before a connection is replaced
+DB_POOL_PING_AFTER = float(os.environ.get('DB_POOL_PING_AFTER', 30))  # seconds idle before a checkout is pinged
+DB_POOL_TIMEOUT = float(os.environ.get('DB_POOL_TIMEOUT', 10))  # seconds to wait for a free connection
+
+# Reference data (teams, divisions, current season) cache lifetime in seconds
+REFERENCE_CACHE_TTL = float(os.environ.get('REFERENCE_CACHE_TTL', 3600))
+
+# How often (seconds) the background watcher polls for newly simulated data
+DATA_WATCH_INTERVAL = float(os.environ.get('DATA_WATCH_INTERVAL', 30))
+
+# Maximum number of rendered command outputs kept in memory
+RENDER_CACHE_SIZE = int(os.environ.get('RENDER_CACHE_SIZE', 512))
+
+# Maximum number of results for finished days and past seasons kept in memory
+HISTORY_CACHE_SIZE = int(os.environ.get('HISTORY_CACHE_SIZE', 2048))
+
+# How long (seconds) paged messages keep responding to page-flip reactions
+PAGINATOR_TIMEOUT = float(os.environ.get('PAGINATOR_TIMEOUT', 180))
+
+# Number of recent invocations per command kept for latency percentiles
+PERF_WINDOW = int(os.environ.get('PERF_WINDOW', 1000))
+
+# Queries slower than this many seconds are logged with their parameters
+SLOW_QUERY_THRESHOLD = float(os.environ.get('SLOW_QUERY_THRESHOLD', 0.5))
+
+# Level for the bot's own loggers; DEBUG adds per-game and per-trade detail
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
+
+# One logger per component, all children of "simbot"
+log = logging.getLogger('simbot')
+db_log = logging.getLogger('simbot.db')
+data_log = logging.getLogger('simbot.data')
+scores_log = logging.getLogger('simbot.scores')
+trades_log = logging.getLogger('simbot.trades')
+
+
+def setup_logging() -> logging.handlers.QueueListener:
+    """Send log records through a queue to a stderr handler on a background thread.
+    
+    Logging calls only enqueue the record, so slow terminal or file I/O never
+    stalls the event loop. Returns the started listener; stop it on shutdown
+    to flush what is still queued.
+    """
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)-8s %(name)s: %(message)s'))
+    
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+    log.setLevel(LOG_LEVEL)
+    
+    listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
 # Team acronyms mapping
 TEAM_ACRONYMS = {
     'Wild': 'MIN', 'Ducks': 'ANA', 'Maple Leafs': 'TOR', 'Blackhawks': 'CHI', 
@@ -32,187 +107,646 @@ client = discord.Client()
 bot = commands.Bot(command_prefix='$')
 
 
+class ConnectionPool:
+    """Fixed-size pool of reusable database connections.
+
+    Connections are health checked when they are checked out after sitting idle,
+    recycled once they have been idle for longer than `recycle` seconds, and
+    discarded (rather than returned to the pool) when a query fails because the
+    connection itself has gone bad.
+    """
+    
+    def __init__(self, connect: Callable[[], Any], size: int = DB_POOL_SIZE,
+                 recycle: float = DB_POOL_RECYCLE, ping_after: float = DB_POOL_PING_AFTER,
+                 timeout: float = DB_POOL_TIMEOUT,
+                 disconnect_errors: Tuple = (mysql.errors.OperationalError, mysql.errors.InterfaceError)):
+        self._connect = connect
+        self.size = size
+        self.recycle = recycle
+        self.ping_after = ping_after
+        self.timeout = timeout
+        self.disconnect_errors = disconnect_errors
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+    
+    def acquire(self):
+        """Check out a healthy connection, opening a new one if none are idle."""
+        if not self._slots.acquire(timeout=self.timeout):
+            raise TimeoutError(f"Timed out waiting for a database connection (pool size {self.size})")
+        
+        try:
+            try:
+                connection, last_used = self._idle.get_nowait()
+            except queue.Empty:
+                return self._connect()
+            
+            idle_for = time.monotonic() - last_used
+            if idle_for > self.recycle:
+                # Idle too long: the server may already have dropped it (wait_timeout)
+                self._close(connection)
+                return self._connect()
+            
+            if idle_for > self.ping_after and not self._is_healthy(connection):
+                self._close(connection)
+                return self._connect()
+            
+            return connection
+        except BaseException:
+            self._slots.release()
+            raise
+    
+    def release(self, connection) -> None:
+        """Return a connection to the pool."""
+        self._idle.put((connection, time.monotonic()))
+        self._slots.release()
+    
+    def discard(self, connection) -> None:
+        """Close a broken connection and free its slot."""
+        self._close(connection)
+        self._slots.release()
+    
+    @contextmanager
+    def connection(self):
+        """Context manager that checks a connection out and back in."""
+        connection = self.acquire()
+        try:
+            yield connection
+        except self.disconnect_errors:
+            self.discard(connection)
+            raise
+        except BaseException:
+            self.release(connection)
+            raise
+        else:
+            self.release(connection)
+    
+    def close_all(self) -> None:
+        """Close every idle connection."""
+        while True:
+            try:
+                connection, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._close(connection)
+    
+    def _is_healthy(self, connection) -> bool:
+        """Ping the server to make sure the connection is still usable."""
+        try:
+            connection.ping(reconnect=False)
+            return True
+        except self.disconnect_errors:
+            return False
+    
+    @staticmethod
+    def _close(connection) -> None:
+        """Close a connection, ignoring errors from an already-dead socket."""
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+class QueryProfiler:
+    """Per-statement call counts, latency and row counts, grouped by fingerprint.
+    
+    A fingerprint is the statement with whitespace collapsed and literals and
+    IN (...) lists replaced, so calls that differ only in their values share
+    one entry. Statements slower than SLOW_QUERY_THRESHOLD are also logged.
+    """
+    
+    _LITERALS = re.compile(r"'(?:[^'\\]|\\.|'')*'|\b\d+(?:\.\d+)?\b")
+    _IN_LISTS = re.compile(r"\bIN\s*\((?:\s*(?:\?|%s)\s*,?)+\)", re.IGNORECASE)
+    
+    # fingerprint -> [calls, total seconds, max seconds, rows]
+    _stats: Dict[str, List[float]] = {}
+    _lock = threading.Lock()
+    
+    @staticmethod
+    def fingerprint(query: str) -> str:
+        """Normalize a statement so calls with different values group together."""
+        normalized = QueryProfiler._LITERALS.sub('?', ' '.join(query.split()))
+        return QueryProfiler._IN_LISTS.sub('IN (...)', normalized)
+    
+    @staticmethod
+    def record(query: str, params: Optional[Tuple], elapsed: float, rows: int) -> None:
+        """Add one execution to its fingerprint's totals."""
+        key = QueryProfiler.fingerprint(query)
+        with QueryProfiler._lock:
+            stats = QueryProfiler._stats.get(key)
+            if stats is None:
+                stats = QueryProfiler._stats[key] = [0, 0.0, 0.0, 0]
+            stats[0] += 1
+            stats[1] += elapsed
+            stats[2] = max(stats[2], elapsed)
+            stats[3] += rows
+        
+        if elapsed >= SLOW_QUERY_THRESHOLD:
+            db_log.warning("Slow query (%.0f ms, %d rows): %s params=%r", elapsed * 1000, rows, key, params)
+    
+    @staticmethod
+    def top(limit: int = 10, sort_by: str = 'total') -> List[Dict[str, Any]]:
+        """Get the worst fingerprints by 'total', 'max', 'calls' or 'rows'."""
+        with QueryProfiler._lock:
+            entries = [
+                {'query': key, 'calls': calls, 'total': total, 'max': longest, 'rows': rows,
+                 'mean': total / calls if calls else 0.0}
+                for key, (calls, total, longest, rows) in QueryProfiler._stats.items()
+            ]
+        entries.sort(key=lambda entry: entry[sort_by], reverse=True)
+        return entries[:limit]
+    
+    @staticmethod
+    def format_top(limit: int = 10, sort_by: str = 'total') -> List[str]:
+        """Format one line block per fingerprint, worst first."""
+        blocks = []
+        for entry in QueryProfiler.top(limit, sort_by):
+            blocks.append(
+                f"{entry['calls']} calls, total {entry['total'] * 1000:.1f} ms, "
+                f"mean {entry['mean'] * 1000:.1f} ms, max {entry['max'] * 1000:.1f} ms, "
+                f"{entry['rows']} rows\n{entry['query'][:300]}"
+            )
+        return blocks
+    
+    @staticmethod
+    def log_top(limit: int = 10) -> None:
+        """Write the top fingerprints by total time to the log."""
+        for block in QueryProfiler.format_top(limit):
+            db_log.info("Query profile: %s", block.replace('\n', ' | '))
+    
+    @staticmethod
+    def reset() -> None:
+        """Forget every recorded statement."""
+        with QueryProfiler._lock:
+            QueryProfiler._stats.clear()
+
+
 class DatabaseManager:
     """Handles database connections and operations."""
     
+    _pool: Optional[ConnectionPool] = None
+    _recorded: Optional[List[Tuple[str, Optional[Tuple]]]] = None
+    # One worker per pooled connection so a worker never waits on a pool slot
+    _executor = ThreadPoolExecutor(max_workers=DB_POOL_SIZE, thread_name_prefix='db')
+    
     @staticmethod
     def get_connection():
         """Create and return a database connection."""
+        # Pooled connections are long-lived, so autocommit keeps each SELECT from
+        # reading an old REPEATABLE READ snapshot
         return mysql.connect(
             host=HOST, 
             user=USER, 
             password=PASSWORD, 
-            database=DATABASE
+            database=DATABASE,
+            autocommit=True
         )
     
     @staticmethod
-    def execute_query(query: str, params: Tuple = None) -> List[Tuple]:
-        """Execute a query and return results."""
-        connection = DatabaseManager.get_connection()
-        cursor = connection.cursor(buffered=True)
+    def get_pool() -> ConnectionPool:
+        """Return the shared connection pool, creating it on first use."""
+        if DatabaseManager._pool is None:
+            DatabaseManager._pool = ConnectionPool(DatabaseManager.get_connection)
+        return DatabaseManager._pool
+    
+    @staticmethod
+    def set_pool(pool: ConnectionPool) -> None:
+        """Replace the shared connection pool (closing the old one's idle connections)."""
+        if DatabaseManager._pool is not None:
+            DatabaseManager._pool.close_all()
+        DatabaseManager._pool = pool
+    
+    @staticmethod
+    def execute_with_cursor(query: str, params: Optional[Tuple], handle: Callable[[Any], Any]) -> Any:
+        """Execute a statement on a pooled connection and return handle(cursor).
         
+        If the connection turns out to be dead the statement is retried once on
+        a fresh connection.
+        """
+        pool = DatabaseManager.get_pool()
+        if DatabaseManager._recorded is not None:
+            DatabaseManager._recorded.append((query, params))
+        
+        for attempt in range(2):
+            try:
+                with pool.connection() as connection:
+                    cursor = connection.cursor(buffered=True)
+                    try:
+                        started = time.perf_counter()
+                        if params:
+                            cursor.execute(query, params)
+                        else:
+                            cursor.execute(query)
+                        result = handle(cursor)
+                        rows = len(result) if isinstance(result, list) else max(cursor.rowcount, 0)
+                        QueryProfiler.record(query, params, time.perf_counter() - started, rows)
+                        return result
+                    finally:
+                        cursor.close()
+            except pool.disconnect_errors:
+                if attempt:
+                    raise
+    
+    @staticmethod
+    def execute_query(query: str, params: Tuple = None) -> List[Tuple]:
+        """Execute a query on a pooled connection and return results."""
+        return DatabaseManager.execute_with_cursor(query, params, lambda cursor: cursor.fetchall())
+    
+    @staticmethod
+    def execute_statement(query: str, params: Tuple = None) -> int:
+        """Execute a statement that returns no rows (e.g. DDL) and return the affected row count."""
+        return DatabaseManager.execute_with_cursor(query, params, lambda cursor: cursor.rowcount)
+    
+    @staticmethod
+    @contextmanager
+    def record_queries():
+        """Collect every (query, params) executed inside the block into the yielded list."""
+        recorded: List[Tuple[str, Optional[Tuple]]] = []
+        DatabaseManager._recorded = recorded
         try:
-            cursor.execute("select database();")
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
-            return cursor.fetchall()
+            yield recorded
         finally:
-            cursor.close()
-            connection.close()
+            DatabaseManager._recorded = None
+    
+    @staticmethod
+    def to_number(value: Any) -> Any:
+        """Convert a DECIMAL aggregate (e.g. SUM) to int when whole, float otherwise."""
+        if value is None:
+            return 0
+        return int(value) if value == int(value) else float(value)
+    
+    @staticmethod
+    async def execute_query_async(query: str, params: Tuple = None, permanent: bool = False) -> List[Tuple]:
+        """Execute a query on the database thread pool without blocking the event loop.
+        
+        Pass permanent=True for queries over data that can no longer change
+        (finished days, past seasons); their results are kept in HistoryCache.
+        """
+        if permanent:
+            return await HistoryCache.get_or_load(
+                ('query', query, params),
+                functools.partial(DatabaseManager.execute_query_async, query, params)
+            )
+        
+        loop = asyncio.get_running_loop()
+        with PerfMonitor.measure('db'):
+            return await loop.run_in_executor(
+                DatabaseManager._executor,
+                functools.partial(DatabaseManager.execute_query, query, params)
+            )
+
+
+class DataVersion:
+    """Publishes the watermarks that move whenever the simulator writes new data.
+    
+    A background task polls a handful of cheap watermarks in one query. When any
+    of them move, subscribed listeners are awaited with the previous and current
+    watermarks. Caches key their entries on only the
+    watermarks their data depends on (see key()), so a new trade does not throw
+    away standings and a new game day does not throw away trade lookups.
+    """
+    
+    WATERMARK_QUERY = """SELECT
+        (SELECT MAX(Date) FROM todaysgame),
+        (SELECT MAX(T_ID) FROM transactions),
+        (SELECT MAX(Season_ID) FROM proteamstandings),
+        (SELECT SUM(GP) FROM proteamstandings
+         WHERE Season_ID = (SELECT MAX(Season_ID) FROM proteamstandings))"""
+    
+    WATERMARK_NAMES = ('last_game_date', 'last_trade_id', 'season_id', 'games_played')
+    
+    # What each kind of cached data depends on
+    STATS_WATERMARKS = ('season_id', 'games_played')
+    GAME_WATERMARKS = ('season_id', 'games_played', 'last_game_date')
+    TRADE_WATERMARKS = ('last_trade_id',)
+    
+    watermarks: Dict[str, Any] = {}
+    _listeners: List[Callable[[Dict[str, Any], Dict[str, Any]], Any]] = []
+    
+    @staticmethod
+    def subscribe(listener: Callable[[Dict[str, Any], Dict[str, Any]], Any]) -> None:
+        """Register a coroutine function called as listener(previous, current) on each change."""
+        DataVersion._listeners.append(listener)
+    
+    @staticmethod
+    def key(names: Tuple[str, ...]) -> Tuple:
+        """The current values of the named watermarks, to tag cached data with."""
+        return tuple(DataVersion.watermarks.get(name) for name in names)
+    
+    @staticmethod
+    async def poll() -> bool:
+        """Read the watermarks and publish them if any moved. Returns True on change."""
+        result = await DatabaseManager.execute_query_async(DataVersion.WATERMARK_QUERY)
+        watermarks = dict(zip(DataVersion.WATERMARK_NAMES, result[0])) if result else {}
+        if watermarks == DataVersion.watermarks:
+            return False
+        
+        previous = DataVersion.watermarks
+        DataVersion.watermarks = watermarks
+        
+        for listener in DataVersion._listeners:
+            try:
+                await listener(previous, watermarks)
+            except Exception as e:
+                data_log.exception("Error handling data change in %s: %s", listener.__qualname__, e)
+        return True
+
+
+class TTLCache:
+    """In-memory key/value cache whose entries expire after a time-to-live."""
+    
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: Dict[Any, Tuple[float, Any]] = {}
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return default
+        return value
+    
+    def set(self, key: Any, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, expiring after ttl seconds (defaults to the cache TTL)."""
+        self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+    
+    def invalidate(self, key: Any = None) -> None:
+        """Drop a single entry, or every entry when no key is given."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+    
+    async def get_or_load(self, key: Any, loader: Callable[[], Any]) -> Any:
+        """Return the cached value for key, awaiting loader() to fill it on a miss."""
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            value = await loader()
+            self.set(key, value)
+        return value
+
+
+class HistoryCache:
+    """Results over data that can no longer change, e.g. finished game days and
+    past seasons.
+    
+    Entries never expire and survive watermark changes; the cache holds at
+    most HISTORY_CACHE_SIZE entries (least recently used are evicted first).
+    Anything touching the live season or the latest game day belongs in the
+    short-lived caches instead.
+    """
+    
+    _entries: 'OrderedDict[Tuple, Any]' = OrderedDict()
+    
+    @staticmethod
+    def get(key: Tuple, default: Any = None) -> Any:
+        """Return the cached value for key, or default."""
+        entries = HistoryCache._entries
+        if key not in entries:
+            return default
+        entries.move_to_end(key)
+        return entries[key]
+    
+    @staticmethod
+    def set(key: Tuple, value: Any) -> None:
+        """Store a value, evicting the least recently used entries past the size limit."""
+        entries = HistoryCache._entries
+        entries[key] = value
+        entries.move_to_end(key)
+        while len(entries) > HISTORY_CACHE_SIZE:
+            entries.popitem(last=False)
+    
+    @staticmethod
+    async def get_or_load(key: Tuple, loader: Callable[[], Any]) -> Any:
+        """Return the cached value for key, awaiting loader() to fill it on a miss."""
+        sentinel = object()
+        value = HistoryCache.get(key, sentinel)
+        if value is sentinel:
+            value = await loader()
+            HistoryCache.set(key, value)
+        return value
+
+
+class TeamResolver:
+    """Maps whatever users type for a team to the team's name.
+    
+    The alias table is built once from the proteam names and TEAM_ACRONYMS and
+    rebuilt whenever the teams are reloaded. Keys are normalized to lowercase
+    letters and digits, so "Maple_Leafs", "maple leafs" and "TOR" are each a
+    single dict lookup. Near misses such as "Olers" fall back to difflib over
+    the longer keys; acronyms are too short to guess at, and a near miss that
+    is equally close to two teams is not resolved.
+    """
+    
+    # Spellings that are neither a team name nor its TEAM_ACRONYMS code
+    EXTRA_ALIASES = {'leafs': 'Maple Leafs', 'wings': 'Red Wings', 'cgy': 'Flames', 'mtl': 'Canadiens'}
+    
+    # How similar a near miss must be (difflib ratio) to be accepted; short input needs to be closer
+    FUZZY_CUTOFF = 0.8
+    SHORT_FUZZY_CUTOFF = 0.85
+    SHORT_INPUT_LENGTH = 6
+    
+    # Keys shorter than this (acronyms, 'all') are only matched exactly
+    MIN_FUZZY_KEY_LENGTH = 4
+    
+    _aliases: Dict[str, str] = {}
+    _fuzzy_keys: List[str] = []
+    
+    @staticmethod
+    def normalize(team_name: str) -> str:
+        """Lowercase and drop everything but letters and digits."""
+        return re.sub(r'[^a-z0-9]', '', team_name.lower())
+    
+    @staticmethod
+    def build(team_names: List[str]) -> None:
+        """Build the alias table from the league's team names."""
+        aliases = {'all': 'all'}
+        
+        def add(alias: str, team_name: str) -> None:
+            aliases.setdefault(TeamResolver.normalize(alias), team_name)
+        
+        # Actual team names win over acronyms and extra spellings
+        for team_name in team_names:
+            add(team_name, team_name)
+        for team_name, acronym in TEAM_ACRONYMS.items():
+            add(team_name, team_name)
+            add(acronym, team_name)
+        for alias, team_name in TeamResolver.EXTRA_ALIASES.items():
+            add(alias, team_name)
+        
+        TeamResolver._aliases = aliases
+        TeamResolver._fuzzy_keys = [key for key in aliases if len(key) >= TeamResolver.MIN_FUZZY_KEY_LENGTH]
+    
+    @staticmethod
+    def resolve(team_name: str) -> str:
+        """Return the team name for a user's input, or the input with underscores as spaces if nothing matches."""
+        if not TeamResolver._aliases:
+            # Not loaded from proteam yet; the acronym table covers the league
+            TeamResolver.build([])
+        
+        key = TeamResolver.normalize(team_name)
+        resolved = TeamResolver._aliases.get(key)
+        if resolved is not None:
+            return resolved
+        
+        cutoff = TeamResolver.FUZZY_CUTOFF if len(key) >= TeamResolver.SHORT_INPUT_LENGTH else TeamResolver.SHORT_FUZZY_CUTOFF
+        close = difflib.get_close_matches(key, TeamResolver._fuzzy_keys, n=2, cutoff=cutoff)
+        if close:
+            resolved = TeamResolver._aliases[close[0]]
+            # Two different teams equally close is a guess, not a match
+            if len(close) > 1 and TeamResolver._aliases[close[1]] != resolved and (
+                    difflib.SequenceMatcher(None, key, close[0]).ratio() == difflib.SequenceMatcher(None, key, close[1]).ratio()):
+                return team_name.replace('_', ' ')
+            log.debug("Resolved team %r to %r by fuzzy match", team_name, resolved)
+            return resolved
+        return team_name.replace('_', ' ')
 
 
 class TeamDataManager:
     """Handles team-related data operations."""
     
+    # Teams, divisions and the current season change a few times a year at most
+    _cache = TTLCache(REFERENCE_CACHE_TTL)
+    
+    @staticmethod
+    async def _load_teams() -> List[Tuple]:
+        """Load every team's number, name, division and conference, and rebuild the name resolver."""
+        teams = await DatabaseManager.execute_query_async(
+            "SELECT Number, Name, Division, Conference FROM proteam"
+        )
+        TeamResolver.build([team[1] for team in teams])
+        return teams
+    
+    @staticmethod
+    async def _load_current_season_id() -> int:
+        """Load the current season ID from the standings table."""
+        result = await DatabaseManager.execute_query_async("select MAX(Season_ID) from proteamstandings")
+        return result[0][0] if result else 0
+    
+    @staticmethod
+    async def get_teams() -> List[Tuple]:
+        """Get (Number, Name, Division, Conference) for every team."""
+        return await TeamDataManager._cache.get_or_load('teams', TeamDataManager._load_teams)
+    
     @staticmethod
-    def get_team_id_mapping() -> Dict[int, str]:
+    async def get_team_id_mapping() -> Dict[int, str]:
         """Get mapping of team IDs to team names."""
-        teams_data = DatabaseManager.execute_query("SELECT Number, Name FROM proteam")
-        return {team[0]: team[1] for team in teams_data}
+        teams = await TeamDataManager.get_teams()
+        return {team[0]: team[1] for team in teams}
+    
+    @staticmethod
+    async def get_team_number(team_name: str) -> Optional[int]:
+        """Get a team's number from its exact name (case-insensitive), or None."""
+        teams = await TeamDataManager.get_teams()
+        numbers = {team[1].lower(): team[0] for team in teams}
+        return numbers.get(team_name.lower())
     
     @staticmethod
-    def get_current_season_id() -> int:
+    async def get_current_season_id() -> int:
         """Get the current season ID."""
-        result = DatabaseManager.execute_query("select MAX(Season_ID) from proteamstandings")
-        return result[0][0] if result else 0
+        return await TeamDataManager._cache.get_or_load('season_id', TeamDataManager._load_current_season_id)
+    
+    @staticmethod
+    async def is_past_season(season_id: int) -> bool:
+        """Whether a season is over, so its stats can no longer change."""
+        return int(season_id) < int(await TeamDataManager.get_current_season_id())
+    
+    @staticmethod
+    def invalidate_reference_data() -> None:
+        """Forget cached teams and season so the next lookup reloads them."""
+        TeamDataManager._cache.invalidate()
+    
+    @staticmethod
+    async def on_data_change(previous: Dict[str, Any], current: Dict[str, Any]) -> None:
+        """Pick up a new season from the watermarks without another query."""
+        if previous.get('season_id') != current.get('season_id'):
+            TeamDataManager.invalidate_reference_data()
+            if current.get('season_id') is not None:
+                TeamDataManager._cache.set('season_id', current['season_id'])
+    
+    @staticmethod
+    async def warm_up() -> None:
+        """Load reference data ahead of the first command."""
+        TeamDataManager.invalidate_reference_data()
+        await asyncio.gather(TeamDataManager.get_teams(), TeamDataManager.get_current_season_id())
     
     @staticmethod
     def clean_team_name(team_name: str) -> str:
-        """Clean team name by replacing underscores with spaces and handling common variations."""
-        # First, replace any underscores with spaces for all inputs
-        cleaned = team_name.replace('_', ' ')
-        
-        # Handle specific underscore replacements (for backward compatibility)
-        replacements = {
-            'Red_Wings': 'Red Wings',
-            'Blue_Jackets': 'Blue Jackets',
-            'North_Stars': 'North Stars',
-            'Maple_Leafs': 'Maple Leafs',
-            'Golden_Knights': 'Golden Knights'
-        }
-        
-        # Apply underscore replacements if exact match (for backward compatibility)
-        if team_name in replacements:
-            cleaned = replacements[team_name]
-        
-        # Handle common case variations and abbreviations
-        team_variations = {
-            'panthers': 'Panthers',
-            'rangers': 'Rangers',
-            'oilers': 'Oilers',
-            'flames': 'Flames',
-            'canucks': 'Canucks',
-            'bruins': 'Bruins',
-            'leafs': 'Maple Leafs',
-            'maple leafs': 'Maple Leafs',
-            'kings': 'Kings',
-            'ducks': 'Ducks',
-            'sharks': 'Sharks',
-            'jets': 'Jets',
-            'blues': 'Blues',
-            'wild': 'Wild',
-            'avalanche': 'Avalanche',
-            'stars': 'Stars',
-            'blackhawks': 'Blackhawks',
-            'predators': 'Predators',
-            'lightning': 'Lightning',
-            'capitals': 'Capitals',
-            'islanders': 'Islanders',
-            'devils': 'Devils',
-            'flyers': 'Flyers',
-            'penguins': 'Penguins',
-            'senators': 'Senators',
-            'sabres': 'Sabres',
-            'red wings': 'Red Wings',
-            'blue jackets': 'Blue Jackets',
-            'golden knights': 'Golden Knights',
-            'coyotes': 'Coyotes',
-            'kraken': 'Kraken'
-        }
-        
-        # Check for variations (case-insensitive)
-        for variation, official_name in team_variations.items():
-            if cleaned.lower() == variation.lower():
-                return official_name
-        
-        return cleaned
+        """Resolve what a user typed for a team (name, acronym, underscores, near misses) to its team name."""
+        return TeamResolver.resolve(team_name)
 
 
 class PlayerDataManager:
     """Handles player-related data operations."""
     
+    # Position bits; any forward position also sets F
+    POSITION_BITS = {'C': 1, 'LW': 2, 'RW': 4, 'D': 8, 'F': 16}
+    
     @staticmethod
-    def get_player_positions() -> Dict[str, List[str]]:
-        """Get player positions from database."""
-        players_data = DatabaseManager.execute_query(
-            "SELECT Name, PosC, PosLW, PosRW, PosD FROM players"
-        )
-        
-        positions = {}
-        for player in players_data:
-            name, pos_c, pos_lw, pos_rw, pos_d = player
-            positions[name] = []
-            
-            if pos_c == 'True':
-                positions[name].extend(['C', 'F'])
-            if pos_lw == 'True':
-                positions[name].extend(['LW', 'F'])
-            if pos_rw == 'True':
-                positions[name].extend(['RW', 'F'])
-            if pos_d == 'True':
-                positions[name].append('D')
-        
-        return positions
+    def position_mask(pos_c: str, pos_lw: str, pos_rw: str, pos_d: str) -> int:
+        """Pack the players table's PosC/PosLW/PosRW/PosD flags into a position bitmask."""
+        bits = PlayerDataManager.POSITION_BITS
+        mask = 0
+        
+        if pos_c == 'True':
+            mask |= bits['C'] | bits['F']
+        if pos_lw == 'True':
+            mask |= bits['LW'] | bits['F']
+        if pos_rw == 'True':
+            mask |= bits['RW'] | bits['F']
+        if pos_d == 'True':
+            mask |= bits['D']
+        
+        return mask
+    
+    # Counting stats that are summed across a player's stints
+    SUMMED_STATS = ['GP', 'Shots', 'Goals', 'Assists', 'Points', '+/-', 'Pims',
+                    'ShotsBlocked', 'Hits', 'GWG']
     
     @staticmethod
-    def add_positions_to_players(players: List[Dict]) -> List[Dict]:
-        """Add position information to player data."""
-        positions = PlayerDataManager.get_player_positions()
+    def merge_stints(rows: List[Dict], summed_stats: List[str]) -> List[Dict]:
+        """Fold every previous-team stint (currentTeam 'False') into the current-team row.
         
-        for player in players:
-            player['Position'] = positions.get(player['Name'], [])
+        One pass totals previous stints by name and a second pass adds them to
+        each current row, so any number of trades is merged in linear time.
+        Rows with no current-team stint are dropped.
+        """
+        previous_stints: Dict[str, Dict[str, Any]] = {}
+        for row in rows:
+            if row['currentTeam'] == 'False':
+                totals = previous_stints.get(row['Name'])
+                if totals is None:
+                    previous_stints[row['Name']] = {stat: row[stat] for stat in summed_stats}
+                else:
+                    for stat in summed_stats:
+                        totals[stat] += row[stat]
         
-        return players
+        merged_rows = []
+        for row in rows:
+            if row['currentTeam'] != 'True':
+                continue
+            
+            merged_row = row.copy()
+            totals = previous_stints.get(row['Name'])
+            if totals:
+                for stat in summed_stats:
+                    merged_row[stat] += totals[stat]
+            merged_rows.append(merged_row)
+        
+        return merged_rows
     
     @staticmethod
     def merge_traded_players(players: List[Dict]) -> List[Dict]:
         """Merge stats for players who were traded."""
-        current_players = [p for p in players if p['currentTeam'] == 'True']
-        traded_players = [p for p in players if p['currentTeam'] == 'False']
-        
-        merged_players = []
+        merged_players = PlayerDataManager.merge_stints(players, PlayerDataManager.SUMMED_STATS)
         
-        for current_player in current_players:
-            # Find if this player was traded
-            traded_player = next(
-                (p for p in traded_players if p['Name'] == current_player['Name']), 
-                None
-            )
-            
-            if traded_player:
-                # Merge stats
-                merged_player = {
-                    'Name': current_player['Name'],
-                    'Team': current_player['Team'],
-                    'GP': current_player['GP'] + traded_player['GP'],
-                    'Shots': current_player['Shots'] + traded_player['Shots'],
-                    'Goals': current_player['Goals'] + traded_player['Goals'],
-                    'Assists': current_player['Assists'] + traded_player['Assists'],
-                    'Points': current_player['Points'] + traded_player['Points'],
-                    '+/-': current_player['+/-'] + traded_player['+/-'],
-                    'Pims': current_player['Pims'] + traded_player['Pims'],
-                    'ShotsBlocked': current_player['ShotsBlocked'] + traded_player['ShotsBlocked'],
-                    'Hits': current_player['Hits'] + traded_player['Hits'],
-                    'GWG': current_player['GWG'] + traded_player['GWG'],
-                    'currentTeam': current_player['currentTeam']
-                }
-            else:
-                merged_player = current_player.copy()
-            
+        for merged_player in merged_players:
             merged_player['P/G'] = round(merged_player['Points'] / merged_player['GP'], 2)
-            merged_players.append(merged_player)
         
         return merged_players
 
@@ -245,35 +779,85 @@ class FormattingUtils:
 class StandingsManager:
     """Handles standings-related operations."""
     
+    # Command aliases -> (field, value) for conference and division views
+    VIEW_ALIASES = {
+        "western": ('Conference', 'Western'),
+        "eastern": ('Conference', 'Eastern'),
+        "pacific": ('Division', 'Bonsignore Division'),
+        "bonsignore": ('Division', 'Bonsignore Division'),
+        "northeast": ('Division', 'Brendl Division'),
+        "metro": ('Division', 'Brendl Division'),
+        "metropolitan": ('Division', 'Brendl Division'),
+        "brendl": ('Division', 'Brendl Division'),
+        "atlantic": ('Division', 'Daigle Division'),
+        "daigle": ('Division', 'Daigle Division'),
+        "central": ('Division', 'Stefan Division'),
+        "stefan": ('Division', 'Stefan Division')
+    }
+    
+    # Wildcard views -> the two divisions whose leaders are shown
+    WILDCARD_DIVISIONS = {
+        "western_wildcard": ('Stefan Division', 'Bonsignore Division'),
+        "eastern_wildcard": ('Brendl Division', 'Daigle Division')
+    }
+    
+    _model: Optional['StandingsModel'] = None
+    _lock = asyncio.Lock()
+    
     @staticmethod
-    def get_team_stats(season_id: int, team_numbers: Optional[Tuple] = None) -> List[Dict]:
-        """Get team statistics for standings."""
-        team_mapping = TeamDataManager.get_team_id_mapping()
-        
-        if team_numbers:
-            query = """SELECT Number, Point, GP, W, L, OTW, OTL, SOW, SOL, GF, GA 
-                      FROM proteamstandings WHERE Season_ID = (%s) AND Number IN ({})""".format(
-                ','.join(['%s'] * len(team_numbers))
-            )
-            params = (season_id,) + team_numbers
-        else:
-            query = """SELECT Number, Point, GP, W, L, OTW, OTL, SOW, SOL, GF, GA 
-                      FROM proteamstandings WHERE Season_ID = (%s)"""
-            params = (season_id,)
-        
-        results = DatabaseManager.execute_query(query, params)
+    async def get_team_stats(season_id: int) -> List[Dict]:
+        """Get every team's standings row joined with its name, division and conference."""
+        results = await DatabaseManager.execute_query_async(
+            """SELECT t.Number, t.Name, t.Division, t.Conference, s.Point, s.GP, s.W, s.L,
+                      s.OTW, s.OTL, s.SOW, s.SOL, s.GF, s.GA
+               FROM proteam t JOIN proteamstandings s ON s.Number = t.Number
+               WHERE s.Season_ID = (%s)""",
+            (season_id,),
+            permanent=await TeamDataManager.is_past_season(season_id)
+        )
         
         team_stats = []
         for team in results:
             team_stats.append({
-                'teamName': team_mapping[team[0]],
-                'points': team[1], 'GP': team[2], 'W': team[3], 'L': team[4],
-                'OTW': team[5], 'OTL': team[6], 'SOW': team[7], 'SOL': team[8],
-                'GF': team[9], 'GA': team[10]
+                'Number': team[0], 'teamName': team[1], 'Division': team[2], 'Conference': team[3],
+                'points': team[4], 'GP': team[5], 'W': team[6], 'L': team[7],
+                'OTW': team[8], 'OTL': team[9], 'SOW': team[10], 'SOL': team[11],
+                'GF': team[12], 'GA': team[13]
             })
         
         return team_stats
     
+    @staticmethod
+    async def load() -> 'StandingsModel':
+        """Build the current season's standings model with one joined query."""
+        version = DataVersion.key(DataVersion.STATS_WATERMARKS)
+        season_id = await TeamDataManager.get_current_season_id()
+        team_stats = await StandingsManager.get_team_stats(season_id)
+        with PerfMonitor.measure('processing'):
+            return StandingsModel(season_id, team_stats, version)
+    
+    @staticmethod
+    async def get_model() -> 'StandingsModel':
+        """Return the standings model, reloading it if the season or games played moved."""
+        model = StandingsManager._model
+        if model is not None and model.version == DataVersion.key(DataVersion.STATS_WATERMARKS):
+            return model
+        
+        async with StandingsManager._lock:
+            model = StandingsManager._model
+            if model is None or model.version != DataVersion.key(DataVersion.STATS_WATERMARKS):
+                model = await StandingsManager.load()
+                StandingsManager._model = model
+            return model
+    
+    @staticmethod
+    async def on_data_change(previous: Dict[str, Any], current: Dict[str, Any]) -> None:
+        """Rebuild an already-loaded model as soon as new standings are written."""
+        if StandingsManager._model is not None and (
+                previous.get('games_played') != current.get('games_played')
+                or previous.get('season_id') != current.get('season_id')):
+            await StandingsManager.get_model()
+    
     @staticmethod
     def sort_standings(teams: List[Dict]) -> List[Dict]:
         """Sort teams by standings criteria."""
@@ -316,65 +900,133 @@ class StandingsManager:
         return standings
 
 
+class StandingsModel:
+    """Every standings view for one season, computed in a single pass.
+    
+    Teams are sorted once for the league table. Conference, division and
+    wildcard views are filtered from that order, so each stays sorted without
+    another sort.
+    """
+    
+    def __init__(self, season_id: int, teams: List[Dict], version: Tuple):
+        self.season_id = season_id
+        self.version = version
+        self.league = StandingsManager.sort_standings(teams)
+        
+        self.conferences: Dict[str, List[Dict]] = {}
+        self.divisions: Dict[str, List[Dict]] = {}
+        for team in self.league:
+            self.conferences.setdefault(team['Conference'], []).append(team)
+            self.divisions.setdefault(team['Division'], []).append(team)
+        
+        # Wildcard view: top 3 of each division, then everyone else in the two divisions
+        self.wildcards: Dict[str, Tuple[List[List[Dict]], List[Dict]]] = {}
+        for view, division_names in StandingsManager.WILDCARD_DIVISIONS.items():
+            leaders = [self.divisions.get(name, [])[:3] for name in division_names]
+            leader_numbers = {team['Number'] for division in leaders for team in division}
+            wildcard_teams = [
+                team for team in self.league
+                if team['Division'] in division_names and team['Number'] not in leader_numbers
+            ]
+            self.wildcards[view] = (leaders, wildcard_teams)
+    
+    def get_view(self, field: str, value: str) -> List[Dict]:
+        """Get the sorted teams for a conference or division."""
+        views = self.conferences if field == 'Conference' else self.divisions
+        return views.get(value, [])
+
+
 class ScoresManager:
     """Handles scores-related operations."""
     
+    # Season filters taking the current season ID: games that can still change (this season,
+    # no season or a later one; pass it twice) and games of finished seasons, which never change
+    LIVE_SEASONS_FILTER = "(Season_ID = %s OR Season_ID IS NULL OR Season_ID > %s)"
+    PAST_SEASONS_FILTER = "Season_ID < %s"
+    
+    # Accepted spellings for a date argument, e.g. 2020-03-29 or 2020/03/29
+    DATE_FORMATS = ('%Y-%m-%d', '%Y/%m/%d', '%Y.%m.%d', '%Y%m%d')
+    
+    # How a game ended, stored as one small int per game; labels shown next to the loser's score
+    OUTCOME_REGULATION, OUTCOME_OVERTIME, OUTCOME_SHOOTOUT = 0, 1, 2
+    OUTCOME_LABELS = ('', 'OT', 'SO')
+    
+    # A MM:SS time in a goalie line such as "... 65:00 minutes"
+    GOALIE_TIME = re.compile(r'(\d+(?:\.\d+)?):(\d+(?:\.\d+)?)')
+    
+    # Games on a day, or on the latest game day if that day has none, in one round trip.
+    # Both branches are plain (Type, Date) range/equality lookups so an index can serve them.
+    GAMES_FOR_DAY_QUERY = """SELECT Date, VisitorTeam, VisitorTeamScore, HomeTeam, HomeTeamScore
+        FROM todaysgame WHERE Type = %s AND Date >= %s AND Date < %s
+        UNION ALL
+        SELECT Date, VisitorTeam, VisitorTeamScore, HomeTeam, HomeTeamScore
+        FROM todaysgame
+        WHERE Type = %s AND Date = (SELECT MAX(Date) FROM todaysgame WHERE Type = %s)
+          AND NOT EXISTS (SELECT 1 FROM todaysgame WHERE Type = %s AND Date >= %s AND Date < %s)"""
+    
     @staticmethod
-    def get_games_for_date(selected_date: str) -> Tuple[List[Tuple], str]:
-        """Get games for a specific date. If no games found for selected_date, 
-        return games from the most recent date available in the database."""
-        games = DatabaseManager.execute_query(
-            """SELECT VisitorTeam, VisitorTeamScore, HomeTeam, HomeTeamScore 
-               FROM todaysgame WHERE Type = 'Pro' AND SUBSTR(Date, 1, 10) = (%s)""",
-            (selected_date,)
+    def parse_date(selected_date: str) -> date:
+        """Parse a date argument in any of DATE_FORMATS."""
+        for date_format in ScoresManager.DATE_FORMATS:
+            try:
+                return datetime.strptime(selected_date.strip(), date_format).date()
+            except ValueError:
+                continue
+        raise ValueError(f"could not understand the date '{selected_date}', use YYYY-MM-DD or YYYY/MM/DD")
+    
+    @staticmethod
+    async def get_games_for_day(game_type: str, selected_date: str) -> Tuple[List[Tuple], str]:
+        """Get games of a type ('Pro' or 'Farm') for a date. If there are none on that
+        date, return the games from the most recent game day instead."""
+        day = ScoresManager.parse_date(selected_date)
+        cached = HistoryCache.get(('games_for_day', game_type, day))
+        if cached is not None:
+            return cached
+        
+        day_start = datetime(day.year, day.month, day.day)
+        day_end = day_start + timedelta(days=1)
+        
+        rows = await DatabaseManager.execute_query_async(
+            ScoresManager.GAMES_FOR_DAY_QUERY,
+            (game_type, day_start, day_end, game_type, game_type, game_type, day_start, day_end)
         )
         
-        # If no games found for selected_date, get the most recent date available
-        if not games:
-            max_date_result = DatabaseManager.execute_query("SELECT MAX(Date) FROM todaysgame WHERE Type = 'Pro'")
-            max_date = max_date_result[0][0] if max_date_result else None
-            
-            if max_date:
-                games = DatabaseManager.execute_query(
-                    """SELECT VisitorTeam, VisitorTeamScore, HomeTeam, HomeTeamScore 
-                       FROM todaysgame WHERE Type = 'Pro' AND Date = (%s)""",
-                    (max_date,)
-                )
-                return games, str(max_date.date())
-            else:
-                return [], selected_date
+        if not rows:
+            return [], str(day)
         
-        return games, selected_date
+        # Rows either all fall on the requested day or all on the latest game day
+        game_date = rows[0][0]
+        game_day = game_date.date() if hasattr(game_date, 'date') else str(game_date)[:10]
+        result = ([row[1:] for row in rows], str(game_day))
+        
+        # A day's games are final once a later day has been simulated
+        if str(game_day) == str(day) and ScoresManager.is_final_date(day):
+            HistoryCache.set(('games_for_day', game_type, day), result)
+        return result
+    
+    @staticmethod
+    def is_final_date(day: date) -> bool:
+        """Whether every game on a day is final: it is before the latest game day and before today."""
+        last_game_date = DataVersion.watermarks.get('last_game_date')
+        if last_game_date is None:
+            return False
+        last_game_day = last_game_date.date() if hasattr(last_game_date, 'date') else ScoresManager.parse_date(str(last_game_date)[:10])
+        return day < last_game_day and day < date.today()
+    
+    @staticmethod
+    async def get_games_for_date(selected_date: str) -> Tuple[List[Tuple], str]:
+        """Get games for a specific date. If no games found for selected_date, 
+        return games from the most recent date available in the database."""
+        return await ScoresManager.get_games_for_day('Pro', selected_date)
     
     @staticmethod
-    def get_farm_games_for_date(selected_date: str) -> Tuple[List[Tuple], str]:
+    async def get_farm_games_for_date(selected_date: str) -> Tuple[List[Tuple], str]:
         """Get farm games for a specific date. If no games found for selected_date,
         return games from the most recent farm date available in the database."""
-        games = DatabaseManager.execute_query(
-            """SELECT VisitorTeam, VisitorTeamScore, HomeTeam, HomeTeamScore
-               FROM todaysgame WHERE Type = 'Farm' AND SUBSTR(Date, 1, 10) = (%s)""",
-            (selected_date,)
-        )
-
-        # If no games found for selected_date, get the most recent farm date available
-        if not games:
-            max_date_result = DatabaseManager.execute_query("SELECT MAX(Date) FROM todaysgame WHERE Type = 'Farm'")
-            max_date = max_date_result[0][0] if max_date_result else None
-
-            if max_date:
-                games = DatabaseManager.execute_query(
-                    """SELECT VisitorTeam, VisitorTeamScore, HomeTeam, HomeTeamScore
-                       FROM todaysgame WHERE Type = 'Farm' AND Date = (%s)""",
-                    (max_date,)
-                )
-                return games, str(max_date.date())
-            else:
-                return [], selected_date
-
-        return games, selected_date
+        return await ScoresManager.get_games_for_day('Farm', selected_date)
     
     @staticmethod
-    def get_recent_games_for_team(team1: str, team2: str = "all", limit: int = 10, force_all_seasons: bool = False) -> List[Tuple]:
+    async def get_recent_games_for_team(team1: str, team2: str = "all", limit: int = 10, force_all_seasons: bool = False) -> List[Tuple]:
         """Return most recent games for team1 (optionally against team2) limited to `limit` games.
         
         Args:
@@ -383,65 +1035,53 @@ class ScoresManager:
             limit: Maximum number of games to return
             force_all_seasons: If True, ignore season filter (for when user specifies exact count)
         
-        Returns list ordered newest -> oldest with fields (Date, VisitorTeam, VisitorScore, HomeTeam, HomeScore).
+        Returns list ordered newest -> oldest with fields (Date, VisitorTeam, VisitorScore, HomeTeam, HomeScore, Outcome),
+        where Outcome is one of the OUTCOME_* flags.
         """
         # Clean names (handle underscores)
         team1 = TeamDataManager.clean_team_name(team1)
         team2 = TeamDataManager.clean_team_name(team2)
 
         # Get current season ID for filtering
-        current_season_id = TeamDataManager.get_current_season_id()
+        current_season_id = await TeamDataManager.get_current_season_id()
         
         if team2 != "all":
             # Head-to-head games
-            if force_all_seasons:
-                # Show all-time head-to-head games
-                query = (
-                    """SELECT Date, VisitorTeam, VisitorTeamScore, HomeTeam, HomeTeamScore, 
-                              VisitorTeamGoaler, HomeTeamGoaler """
-                    "FROM todaysgame "
-                    "WHERE ((VisitorTeam = %s AND HomeTeam = %s) OR (VisitorTeam = %s AND HomeTeam = %s)) "
-                    "ORDER BY Date DESC LIMIT %s"""
-                )
-                params = (team1, team2, team2, team1, limit)
-            else:
-                # Show only current season head-to-head games
-                query = (
-                    """SELECT Date, VisitorTeam, VisitorTeamScore, HomeTeam, HomeTeamScore, 
-                              VisitorTeamGoaler, HomeTeamGoaler """
-                    "FROM todaysgame "
-                    "WHERE ((VisitorTeam = %s AND HomeTeam = %s) OR (VisitorTeam = %s AND HomeTeam = %s)) "
-                    "AND Season_ID = %s "
-                    "ORDER BY Date DESC LIMIT %s"""
-                )
-                params = (team1, team2, team2, team1, current_season_id, limit)
+            teams_filter = "((VisitorTeam = %s AND HomeTeam = %s) OR (VisitorTeam = %s AND HomeTeam = %s))"
+            teams_params = (team1, team2, team2, team1)
         else:
             # All opponents
-            if force_all_seasons:
-                # Show all-time games
-                query = (
-                    """SELECT Date, VisitorTeam, VisitorTeamScore, HomeTeam, HomeTeamScore, 
-                              VisitorTeamGoaler, HomeTeamGoaler """
-                    "FROM todaysgame "
-                    "WHERE VisitorTeam = %s OR HomeTeam = %s "
-                    "ORDER BY Date DESC LIMIT %s"""
-                )
-                params = (team1, team1, limit)
-            else:
-                # Show only current season games
-                query = (
-                    """SELECT Date, VisitorTeam, VisitorTeamScore, HomeTeam, HomeTeamScore, 
-                              VisitorTeamGoaler, HomeTeamGoaler """
-                    "FROM todaysgame "
-                    "WHERE (VisitorTeam = %s OR HomeTeam = %s) AND Season_ID = %s "
-                    "ORDER BY Date DESC LIMIT %s"""
-                )
-                params = (team1, team1, current_season_id, limit)
-
-        return DatabaseManager.execute_query(query, params)
+            teams_filter = "(VisitorTeam = %s OR HomeTeam = %s)"
+            teams_params = (team1, team1)
+        
+        query = (
+            """SELECT Date, VisitorTeam, VisitorTeamScore, HomeTeam, HomeTeamScore, 
+                      VisitorTeamGoaler, HomeTeamGoaler """
+            "FROM todaysgame "
+            f"WHERE {teams_filter} AND {{}} "
+            "ORDER BY Date DESC LIMIT %s"
+        )
+        
+        if not force_all_seasons:
+            # Show only current season games
+            return GameLog.with_outcomes(await DatabaseManager.execute_query_async(
+                query.format("Season_ID = %s"), teams_params + (current_season_id, limit)
+            ))
+        
+        # All time: games that can still change are read live, finished seasons are cached permanently
+        live_games, past_games = await asyncio.gather(
+            DatabaseManager.execute_query_async(
+                query.format(ScoresManager.LIVE_SEASONS_FILTER), teams_params + (current_season_id, current_season_id, limit)
+            ),
+            DatabaseManager.execute_query_async(
+                query.format(ScoresManager.PAST_SEASONS_FILTER), teams_params + (current_season_id, limit), permanent=True
+            )
+        )
+        games = sorted(live_games + past_games, key=lambda game: game[0], reverse=True)
+        return GameLog.with_outcomes(games[:limit])
 
     @staticmethod
-    def format_games_list(games: List[Tuple], team1: str = None, team2: str = None) -> str:
+    def format_games_list(games: List[Tuple]) -> str:
         """Format a list of games into a readable string with proper alignment."""
         if not games:
             return "No games found."
@@ -451,12 +1091,8 @@ class ScoresManager:
         result += "--------------------------------------------------\n"
         
         for game in games:
-            # Unpack game data - now includes goalie information
-            if len(game) >= 7:  # New format with goalie fields
-                date_val, v_team, v_score, h_team, h_score, v_goalie, h_goalie = game
-            else:  # Fallback to old format
-                date_val, v_team, v_score, h_team, h_score = game
-                v_goalie, h_goalie = None, None
+            # Unpack game data with how the game ended
+            date_val, v_team, v_score, h_team, h_score, outcome = ScoresManager.unpack_game(game)
             
             # Format date - extract just the date part if it's a timestamp
             if hasattr(date_val, 'strftime'):
@@ -471,12 +1107,9 @@ class ScoresManager:
             v_acronym = TEAM_ACRONYMS.get(v_team, v_team)
             h_acronym = TEAM_ACRONYMS.get(h_team, h_team)
             
-            # Check if this was an overtime game
-            is_ot, overtime_type = ScoresManager.is_overtime_game(v_goalie, h_goalie) if v_goalie and h_goalie else (False, "")
-            
-            # Debug output for display formatting
-            if v_goalie and h_goalie:
-                print(f"DEBUG: Display formatting - Game: {v_team} vs {h_team}, Overtime: {is_ot}, Type: {overtime_type}")
+            # OT or SO label for games that went past regulation
+            overtime_type = ScoresManager.OUTCOME_LABELS[outcome]
+            scores_log.debug("Display formatting - Game: %s vs %s, Outcome: %s", v_team, h_team, overtime_type)
             
             # Format scores with OT indicator if applicable - convert to integers
             v_score_int = int(float(v_score))
@@ -485,7 +1118,7 @@ class ScoresManager:
             v_score_display = f"{v_acronym} {v_score_int}"
             h_score_display = f"{h_acronym} {h_score_int}"
             
-            if is_ot and overtime_type:
+            if overtime_type:
                 # Add (OT) or (SO) to the losing team's score
                 if v_score_int > h_score_int:
                     h_score_display += f"({overtime_type})"
@@ -495,18 +1128,9 @@ class ScoresManager:
             # Format with proper alignment
             result += f"{date_str:<16} {v_score_display:<20} {h_score_display}\n"
         
-        # Add separator line
+        # Add separator line; records come from RecordBook
         result += "--------------------------------------------------\n"
         
-        # Add head-to-head record if both teams are specified, or overall record if only one team
-        if team1 and team2 and team2 != 'all':
-            record = ScoresManager.calculate_head_to_head_record(games, team1, team2)
-            result += f"Record: {record}\n"
-        elif team1 and team2 == 'all':
-            # Show overall record for the single team
-            record = ScoresManager.calculate_team_overall_record(games, team1)
-            result += f"Record: {record}\n"
-        
         return result
     
     @staticmethod
@@ -520,302 +1144,362 @@ class ScoresManager:
         return game_scores
 
     @staticmethod
-    def calculate_head_to_head_record(games: List[Tuple], team1: str, team2: str) -> str:
-        """Calculate head-to-head record between two teams from the given games using NHL W-L-OTL format."""
-        team1_wins = 0
-        team1_losses = 0
-        team1_otl = 0
-        team2_wins = 0
-        team2_losses = 0
-        team2_otl = 0
-        
-        # Clean team names for comparison (handle case and underscores)
-        team1_clean = TeamDataManager.clean_team_name(team1.lower())
-        team2_clean = TeamDataManager.clean_team_name(team2.lower())
-        
-        print(f"DEBUG: Looking for teams: '{team1}' -> cleaned to '{team1_clean}' and '{team2}' -> cleaned to '{team2_clean}'")
-        print(f"DEBUG: First few games to see actual database team names:")
-        for i, game in enumerate(games[:3]):
-            if len(game) >= 5:
-                print(f"DEBUG: Game {i+1}: '{game[1]}' vs '{game[3]}'")
-        
-        print(f"DEBUG: Total games to process: {len(games)}")
-        
-        for game in games:
-            # Unpack game data - now includes goalie information
-            if len(game) >= 7:  # New format with goalie fields
-                date_val, v_team, v_score, h_team, h_score, v_goalie, h_goalie = game
-            else:  # Fallback to old format
-                date_val, v_team, v_score, h_team, h_score = game
-                v_goalie, h_goalie = None, None
-            
-            v_score_int, h_score_int = int(v_score), int(h_score)
-            
-            # Clean the team names from the database for comparison
-            v_team_clean = v_team.lower()
-            h_team_clean = h_team.lower()
-            
-            print(f"DEBUG: Game: '{v_team}' vs '{h_team}' (scores: {v_score_int}-{h_score_int})")
-            print(f"DEBUG: Comparing '{v_team_clean}' == '{team1_clean.lower()}' and '{h_team_clean}' == '{team2_clean.lower()}'")
-            
-            # Check if overtime game first
-            is_ot, overtime_type = ScoresManager.is_overtime_game(v_goalie, h_goalie)
-            
-            # Determine which team is which (case-insensitive comparison)
-            if v_team_clean == team1_clean.lower() and h_team_clean == team2_clean.lower():
-                print(f"DEBUG: MATCH! team1 ({team1_clean}) is away, team2 ({team2_clean}) is home")
-                # team1 is away, team2 is home
-                if v_score_int > h_score_int:
-                    # team1 wins, team2 loses
-                    team1_wins += 1
-                    if is_ot:
-                        team2_otl += 1
-                        print(f"DEBUG: team1 wins, team2 gets OTL ({overtime_type})")
-                    else:
-                        team2_losses += 1
-                        print(f"DEBUG: team1 wins, team2 gets regular loss")
-                elif v_score_int < h_score_int:
-                    # team2 wins, team1 loses
-                    team2_wins += 1
-                    if is_ot:
-                        team1_otl += 1
-                        print(f"DEBUG: team2 wins, team1 gets OTL ({overtime_type})")
-                    else:
-                        team1_losses += 1
-                        print(f"DEBUG: team2 wins, team1 gets regular loss")
-                else:
-                    # Tie - this shouldn't happen in modern NHL, but handle it as OTL
-                    team1_otl += 1
-                    team2_otl += 1
-                    print(f"DEBUG: tie, both get OTL")
-            elif v_team_clean == team2_clean.lower() and h_team_clean == team1_clean.lower():
-                print(f"DEBUG: MATCH! team2 ({team2_clean}) is away, team1 ({team1_clean}) is home")
-                # team2 is away, team1 is home
-                if v_score_int > h_score_int:
-                    # team2 wins, team1 loses
-                    team2_wins += 1
-                    if is_ot:
-                        team1_otl += 1
-                        print(f"DEBUG: team2 wins, team1 gets OTL ({overtime_type})")
-                    else:
-                        team1_losses += 1
-                        print(f"DEBUG: team2 wins, team1 gets regular loss")
-                elif v_score_int < h_score_int:
-                    # team1 wins, team2 loses
-                    team1_wins += 1
-                    if is_ot:
-                        team2_otl += 1
-                        print(f"DEBUG: team1 wins, team2 gets OTL ({overtime_type})")
-                    else:
-                        team2_losses += 1
-                        print(f"DEBUG: team1 wins, team2 gets regular loss")
-                else:
-                    # Tie - this shouldn't happen in modern NHL, but handle it as OTL
-                    team1_otl += 1
-                    team2_otl += 1
-                    print(f"DEBUG: tie, both get OTL")
-            else:
-                print(f"DEBUG: NO MATCH for team1 ({team1_clean.lower()}) or team2 ({team2_clean.lower()})")
+    def parse_goalie_minutes(goalie_data: str) -> float:
+        """Parse goalie data string to extract minutes played (the last MM:SS before "minutes")."""
+        if not goalie_data or goalie_data == "None":
+            return 0
         
-        print(f"DEBUG: Final record: team1 {team1_clean}: {team1_wins}-{team1_losses}-{team1_otl}, team2 {team2_clean}: {team2_wins}-{team2_losses}-{team2_otl}")
+        minutes_index = goalie_data.rfind("minutes")
+        if minutes_index <= 0:
+            return 0
         
-        # Format the record using NHL W-L-OTL format
-        team1_acronym = TEAM_ACRONYMS.get(team1, team1)
-        team2_acronym = TEAM_ACRONYMS.get(team2, team2)
+        times = ScoresManager.GOALIE_TIME.findall(goalie_data, 0, minutes_index)
+        if not times:
+            return 0
         
-        return f"{team1_acronym}: {team1_wins}-{team1_losses}-{team1_otl} vs {team2_acronym}: {team2_wins}-{team2_losses}-{team2_otl}"
+        minutes, seconds = times[-1]
+        return float(minutes) + float(seconds) / 60.0
     
     @staticmethod
-    def calculate_team_overall_record(games: List[Tuple], team: str) -> str:
-        """Calculate overall record for a single team from the given games using NHL W-L-OTL format."""
-        wins = 0
-        losses = 0
-        otl = 0
+    def game_outcome(visitor_goalie: str, home_goalie: str) -> int:
+        """Work out how a game ended from the goalies' minutes played.
         
-        # Clean team name for comparison
-        team_clean = TeamDataManager.clean_team_name(team.lower())
-        
-        print(f"DEBUG: Looking for team: '{team}' -> cleaned to '{team_clean}'")
-        print(f"DEBUG: First few games to see actual database team names:")
-        for i, game in enumerate(games[:3]):
-            if len(game) >= 5:
-                print(f"DEBUG: Game {i+1}: '{game[1]}' vs '{game[3]}'")
+        Returns OUTCOME_REGULATION, OUTCOME_OVERTIME or OUTCOME_SHOOTOUT. Exactly
+        60:00 is regulation; a shootout game shows exactly 65:00.
+        """
+        if not visitor_goalie or not home_goalie:
+            return ScoresManager.OUTCOME_REGULATION
+        
+        max_minutes = max(ScoresManager.parse_goalie_minutes(visitor_goalie),
+                          ScoresManager.parse_goalie_minutes(home_goalie))
+        if max_minutes <= 60:
+            return ScoresManager.OUTCOME_REGULATION
+        if abs(max_minutes - 65.0) < 0.01:  # Allow for small floating point differences
+            return ScoresManager.OUTCOME_SHOOTOUT
+        return ScoresManager.OUTCOME_OVERTIME
+    
+    @staticmethod
+    def unpack_game(game: Tuple) -> Tuple[Any, str, Any, str, Any, int]:
+        """Unpack a game row into (date, visitor, visitor score, home, home score, outcome).
         
-        for game in games:
-            # Unpack game data - now includes goalie information
-            if len(game) >= 7:  # New format with goalie fields
-                date_val, v_team, v_score, h_team, h_score, v_goalie, h_goalie = game
-            else:  # Fallback to old format
-                date_val, v_team, v_score, h_team, h_score = game
-                v_goalie, h_goalie = None, None
-            
-            v_score_int, h_score_int = int(float(v_score)), int(float(h_score))
-            
-            # Clean the team names from the database for comparison
-            v_team_clean = v_team.lower()
-            h_team_clean = h_team.lower()
-            
-            print(f"DEBUG: Game: '{v_team}' vs '{h_team}' (scores: {v_score_int}-{h_score_int})")
-            print(f"DEBUG: Comparing '{v_team_clean}' == '{team_clean.lower()}' and '{h_team_clean}' == '{team_clean.lower()}'")
-            
-            # Check if this team is in the game
-            if v_team_clean == team_clean.lower():
-                print(f"DEBUG: MATCH! team ({team_clean}) is away")
-                # Team is away
-                if v_score_int > h_score_int:
-                    wins += 1
-                    print(f"DEBUG: team wins")
-                elif v_score_int < h_score_int:
-                    # Check if this was an OTL
-                    if ScoresManager.is_overtime_game(v_goalie, h_goalie)[0]: # Check if it was OT
-                        otl += 1
-                        print(f"DEBUG: team loses in OT")
-                    else:
-                        losses += 1
-                        print(f"DEBUG: team loses in regulation")
-                else:
-                    # Tie - treat as OTL
-                    otl += 1
-                    print(f"DEBUG: tie, team gets OTL")
-            elif h_team_clean == team_clean.lower():
-                print(f"DEBUG: MATCH! team ({team_clean}) is home")
-                # Team is home
-                if h_score_int > v_score_int:
-                    wins += 1
-                    print(f"DEBUG: team wins")
-                elif h_score_int < v_score_int:
-                    # Check if this was an OTL
-                    if ScoresManager.is_overtime_game(v_goalie, h_goalie)[0]: # Check if it was OT
-                        otl += 1
-                        print(f"DEBUG: team loses in OT")
-                    else:
-                        losses += 1
-                        print(f"DEBUG: team loses in regulation")
-                else:
-                    # Tie - treat as OTL
-                    otl += 1
-                    print(f"DEBUG: tie, team gets OTL")
-            else:
-                print(f"DEBUG: NO MATCH for team ({team_clean.lower()})")
+        Accepts rows carrying an outcome flag (from get_recent_games_for_team), rows
+        with the raw goalie fields, or plain score rows (counted as regulation).
+        """
+        if len(game) == 6:
+            return game
+        if len(game) >= 7:
+            date_val, v_team, v_score, h_team, h_score, v_goalie, h_goalie = game[:7]
+            return date_val, v_team, v_score, h_team, h_score, GameLog.outcome(date_val, v_team, v_goalie, h_goalie)
+        date_val, v_team, v_score, h_team, h_score = game
+        return date_val, v_team, v_score, h_team, h_score, ScoresManager.OUTCOME_REGULATION
+
+
+class GameLog:
+    """How each game ended, worked out once per game and kept in memory.
+    
+    Parsing the goalie lines for minutes played is the expensive part of
+    listing games, and a game's result never changes once it is written, so
+    the outcome flag is stored per (date, visitor team).
+    """
+    
+    _outcomes: Dict[Tuple[Any, str], int] = {}
+    
+    @staticmethod
+    def outcome(game_date: Any, visitor_team: str, visitor_goalie: str, home_goalie: str) -> int:
+        """Return the game's outcome flag, parsing the goalie lines the first time it is seen."""
+        key = (game_date, visitor_team)
+        outcome = GameLog._outcomes.get(key)
+        if outcome is None:
+            outcome = ScoresManager.game_outcome(visitor_goalie, home_goalie)
+            GameLog._outcomes[key] = outcome
+        return outcome
+    
+    @staticmethod
+    def with_outcomes(rows: List[Tuple]) -> List[Tuple]:
+        """Replace the goalie fields of (Date, Visitor, VScore, Home, HScore, VGoalie, HGoalie)
+        rows with the outcome flag."""
+        outcome = GameLog.outcome
+        return [
+            (game_date, v_team, v_score, h_team, h_score, outcome(game_date, v_team, v_goalie, h_goalie))
+            for game_date, v_team, v_score, h_team, h_score, v_goalie, h_goalie in rows
+        ]
+
+
+class RecordBook:
+    """W-L-OTL counts for every pair of teams, per season, held in memory.
+    
+    Each season maps team -> opponent -> result counts from the team's point of
+    view, plus the team's totals under 'all', filled from one pass over that
+    season's games. Finished seasons are read once; the current season, and
+    games with no season or a later one, are recounted when new games are
+    written. A team's or a pair's record over any span is then a sum of a few
+    small lists, with no game rows fetched.
+    """
+    
+    # Result columns: WINS/LOSSES + an OUTCOME_* flag for regulation, OT and SO results
+    WINS, LOSSES, TIES = 0, 3, 6
+    RESULTS = 7
+    
+    GAMES_QUERY = """SELECT COALESCE(Season_ID, 0), Date, VisitorTeam, VisitorTeamScore, HomeTeam, HomeTeamScore,
+                            VisitorTeamGoaler, HomeTeamGoaler
+                     FROM todaysgame WHERE {}"""
+    
+    _seasons: Dict[int, Dict[str, Dict[str, List[int]]]] = {}
+    # Games outside the current and finished seasons (NULL or later Season_ID), only in all-time spans
+    _unseasoned: List[Dict[str, Dict[str, List[int]]]] = []
+    _current_version: Optional[Tuple] = None
+    _past_loaded = False
+    _lock = asyncio.Lock()
+    
+    @staticmethod
+    def reset() -> None:
+        """Forget every count so the next lookup reads the games again."""
+        RecordBook._seasons = {}
+        RecordBook._unseasoned = []
+        RecordBook._current_version = None
+        RecordBook._past_loaded = False
+    
+    @staticmethod
+    def add_game(season: Dict[str, Dict[str, List[int]]], v_team: str, v_score: Any, h_team: str, h_score: Any, outcome: int) -> None:
+        """Count one game for both teams, against each other and in their totals."""
+        v_key, h_key = v_team.lower(), h_team.lower()
+        v_opponents = season.setdefault(v_key, {})
+        h_opponents = season.setdefault(h_key, {})
+        
+        v_score_int, h_score_int = int(float(v_score)), int(float(h_score))
+        if v_score_int > h_score_int:
+            v_result, h_result = RecordBook.WINS + outcome, RecordBook.LOSSES + outcome
+        elif v_score_int < h_score_int:
+            v_result, h_result = RecordBook.LOSSES + outcome, RecordBook.WINS + outcome
+        else:
+            # Tie - counted as an OTL for both, as in the game listings
+            v_result = h_result = RecordBook.TIES
+        
+        for opponents, opponent, result in ((v_opponents, h_key, v_result), (h_opponents, v_key, h_result)):
+            for key in (opponent, 'all'):
+                counts = opponents.get(key)
+                if counts is None:
+                    counts = opponents[key] = [0] * RecordBook.RESULTS
+                counts[result] += 1
+    
+    @staticmethod
+    async def load(where: str, params: Tuple) -> Dict[int, Dict[str, Dict[str, List[int]]]]:
+        """Count the games matching a Season_ID filter, grouped by season."""
+        rows = await DatabaseManager.execute_query_async(RecordBook.GAMES_QUERY.format(where), params)
+        
+        with PerfMonitor.measure('processing'):
+            seasons: Dict[int, Dict[str, Dict[str, List[int]]]] = {}
+            for season_id, game_date, v_team, v_score, h_team, h_score, v_goalie, h_goalie in rows:
+                if v_score is None or h_score is None:
+                    continue
+                outcome = GameLog.outcome(game_date, v_team, v_goalie, h_goalie)
+                RecordBook.add_game(seasons.setdefault(season_id, {}), v_team, v_score, h_team, h_score, outcome)
+            return seasons
+    
+    @staticmethod
+    async def get_seasons(seasons: Optional[int] = 1) -> List[Dict[str, Dict[str, List[int]]]]:
+        """Get the counts of the last `seasons` seasons up to the current one, or of all seasons for None."""
+        current_season_id = await TeamDataManager.get_current_season_id()
+        
+        # The current season only needs recounting when games were written
+        def current_version() -> Tuple:
+            return (current_season_id, DataVersion.watermarks.get('last_game_date'), DataVersion.watermarks.get('games_played'))
+        
+        if RecordBook._current_version != current_version() or (seasons != 1 and not RecordBook._past_loaded):
+            async with RecordBook._lock:
+                # Another command may have counted them while we waited
+                if RecordBook._current_version != current_version():
+                    version = current_version()
+                    # Same span as the live part of ScoresManager.get_recent_games_for_team
+                    counted = await RecordBook.load(ScoresManager.LIVE_SEASONS_FILTER, (current_season_id, current_season_id))
+                    RecordBook._seasons[current_season_id] = counted.pop(current_season_id, {})
+                    RecordBook._unseasoned = list(counted.values())
+                    RecordBook._current_version = version
+                
+                if seasons != 1 and not RecordBook._past_loaded:
+                    # Finished seasons never change, so all of history is read once
+                    counted = await RecordBook.load(ScoresManager.PAST_SEASONS_FILTER, (current_season_id,))
+                    RecordBook._seasons.update(counted)
+                    RecordBook._past_loaded = True
+        
+        season_ids = sorted((season_id for season_id in RecordBook._seasons if season_id <= current_season_id), reverse=True)
+        if seasons is not None:
+            return [RecordBook._seasons[season_id] for season_id in season_ids[:seasons]]
+        return [RecordBook._seasons[season_id] for season_id in season_ids] + RecordBook._unseasoned
+    
+    @staticmethod
+    async def get_record(team: str, opponent: str = 'all', seasons: Optional[int] = 1) -> List[int]:
+        """Count a team's results, against one opponent or everyone, over the last `seasons`
+        seasons including the current one (None for all time).
         
-        print(f"DEBUG: Final record: team {team_clean}: {wins}-{losses}-{otl}")
+        Returns a list of RESULTS counts indexed by WINS/LOSSES + outcome and TIES.
+        """
+        team_key = TeamDataManager.clean_team_name(team).lower()
+        opponent_key = TeamDataManager.clean_team_name(opponent).lower() if opponent != 'all' else 'all'
+        
+        totals = [0] * RecordBook.RESULTS
+        for season in await RecordBook.get_seasons(seasons):
+            counts = season.get(team_key, {}).get(opponent_key)
+            if counts:
+                totals = [total + count for total, count in zip(totals, counts)]
+        return totals
+    
+    @staticmethod
+    def format_record(counts: List[int]) -> str:
+        """Format counts as NHL W-L-OTL, splitting out OT and SO results when there were any."""
+        wins = sum(counts[RecordBook.WINS:RecordBook.WINS + 3])
+        losses = counts[RecordBook.LOSSES + ScoresManager.OUTCOME_REGULATION]
+        otl = counts[RecordBook.LOSSES + ScoresManager.OUTCOME_OVERTIME] + counts[RecordBook.LOSSES + ScoresManager.OUTCOME_SHOOTOUT] + counts[RecordBook.TIES]
+        record = f"{wins}-{losses}-{otl}"
+        
+        splits = []
+        for outcome in (ScoresManager.OUTCOME_OVERTIME, ScoresManager.OUTCOME_SHOOTOUT):
+            won, lost = counts[RecordBook.WINS + outcome], counts[RecordBook.LOSSES + outcome]
+            if won or lost:
+                splits.append(f"{ScoresManager.OUTCOME_LABELS[outcome]} {won}-{lost}")
+        if splits:
+            record += f" ({', '.join(splits)})"
+        return record
+    
+    @staticmethod
+    async def describe(team1: str, team2: str = 'all', seasons: Optional[int] = 1) -> str:
+        """Format team1's record, or both teams' head-to-head records, over a span of seasons."""
+        team1_name = TeamDataManager.clean_team_name(team1)
+        team1_record = RecordBook.format_record(await RecordBook.get_record(team1, team2, seasons))
+        if team2 == 'all':
+            return f"{TEAM_ACRONYMS.get(team1_name, team1_name)}: {team1_record}"
         
-        # Format the record using NHL W-L-OTL format
-        team_acronym = TEAM_ACRONYMS.get(team, team)
-        return f"{team_acronym}: {wins}-{losses}-{otl}"
+        team2_name = TeamDataManager.clean_team_name(team2)
+        team2_record = RecordBook.format_record(await RecordBook.get_record(team2, team1, seasons))
+        return (f"{TEAM_ACRONYMS.get(team1_name, team1_name)}: {team1_record} vs "
+                f"{TEAM_ACRONYMS.get(team2_name, team2_name)}: {team2_record}")
+    
+    @staticmethod
+    async def on_data_change(previous: Dict[str, Any], current: Dict[str, Any]) -> None:
+        """Start over on a new season; recount an already-counted current season when games are written."""
+        if previous.get('season_id') != current.get('season_id'):
+            RecordBook.reset()
+        elif RecordBook._current_version is not None and (
+                previous.get('games_played') != current.get('games_played')
+                or previous.get('last_game_date') != current.get('last_game_date')):
+            await RecordBook.get_seasons(1)
+
 
+class TradeIndex:
+    """In-memory inverted index from player name to the trades that moved them.
+    
+    Built once by parsing the <br>-separated Team1List/Team2List of every trade,
+    then extended with only the trades above the highest T_ID seen so far.
+    Each full name is indexed, and so is each word of it, so "backlund" still
+    finds "Mikael Backlund" without matching parts of words.
+    """
+    
+    _trade_ids: Dict[str, set] = {}
+    _token_ids: Dict[str, set] = {}
+    _last_trade_id = 0
+    _lock = asyncio.Lock()
+    
     @staticmethod
-    def parse_goalie_minutes(goalie_data: str) -> int:
-        """Parse goalie data string to extract minutes played."""
-        if not goalie_data or goalie_data == "None":
-            return 0
+    def normalize_name(name: str) -> str:
+        """Normalize a player name for exact matching (case, underscores, spacing)."""
+        return ' '.join(name.replace('_', ' ').lower().split())
+    
+    @staticmethod
+    def parse_trade_list(trade_list: Optional[str]) -> List[str]:
+        """Split a <br>-separated trade list into normalized entries."""
+        if not trade_list:
+            return []
         
-        try:
-            print(f"DEBUG: Raw goalie data: '{goalie_data}'")
-            
-            # Look for pattern like "65:00 minutes" at the end of the string
-            if "minutes" in goalie_data:
-                # Find the last occurrence of "minutes" and extract everything before it
-                minutes_index = goalie_data.rfind("minutes")
-                if minutes_index > 0:
-                    # Get the part before "minutes" and trim
-                    before_minutes = goalie_data[:minutes_index].strip()
-                    print(f"DEBUG: Before 'minutes': '{before_minutes}'")
-                    
-                    # Look for the last time pattern (MM:SS) in the string
-                    # Split by spaces and find the last part that contains ":"
-                    parts = before_minutes.split()
-                    time_part = None
-                    
-                    # Look backwards through the parts to find the time
-                    for part in reversed(parts):
-                        if ":" in part and len(part.split(":")) == 2:
-                            time_part = part
-                            break
-                    
-                    if time_part:
-                        print(f"DEBUG: Found time part: '{time_part}'")
-                        minutes, seconds = time_part.split(":")
-                        # Trim whitespace and convert
-                        total_minutes = float(minutes.strip()) + float(seconds.strip()) / 60.0
-                        print(f"DEBUG: Parsed goalie data '{goalie_data}' -> {total_minutes} minutes")
-                        return total_minutes
-                    else:
-                        print(f"DEBUG: No time pattern found in parts: {parts}")
-                else:
-                    print(f"DEBUG: 'minutes' found but at position 0")
-            else:
-                print(f"DEBUG: No 'minutes' found in goalie data")
-            
-            return 0
-        except Exception as e:
-            print(f"DEBUG: Error parsing goalie data '{goalie_data}': {e}")
-            return 0
+        entries = []
+        for entry in trade_list.split('<br>'):
+            name = TradeIndex.normalize_name(entry)
+            if name:
+                entries.append(name)
+        return entries
     
     @staticmethod
-    def is_overtime_game(visitor_goalie: str, home_goalie: str) -> tuple[bool, str]:
-        """Check if a game went to overtime or shootout based on goalie minutes played.
-        Returns (is_overtime, overtime_type) where overtime_type is 'OT' or 'SO'."""
-        if not visitor_goalie or not home_goalie:
-            print(f"DEBUG: Missing goalie data - visitor: '{visitor_goalie}', home: '{home_goalie}'")
-            return False, ""
-        
-        v_minutes = ScoresManager.parse_goalie_minutes(visitor_goalie)
-        h_minutes = ScoresManager.parse_goalie_minutes(home_goalie)
-        
-        print(f"DEBUG: Goalie minutes - visitor: {v_minutes}, home: {h_minutes}")
-        print(f"DEBUG: Overtime threshold: 60 minutes")
-        
-        # Check if either goalie played more than 60 minutes
-        max_minutes = max(v_minutes, h_minutes)
-        if max_minutes > 60:  # Exactly 60:00 is regulation time, not overtime
-            # Determine if it's a shootout (exactly 65:00) or overtime (more than 65:00)
-            if abs(max_minutes - 65.0) < 0.01:  # Allow for small floating point differences
-                print(f"DEBUG: Is shootout game: True (exactly 65 minutes)")
-                return True, "SO"
-            else:
-                print(f"DEBUG: Is overtime game: True (more than 60 minutes)")
-                return True, "OT"
-        else:
-            print(f"DEBUG: Is overtime game: False")
-            return False, ""
+    def reset() -> None:
+        """Forget every indexed trade so the next refresh indexes them all again."""
+        TradeIndex._trade_ids = {}
+        TradeIndex._token_ids = {}
+        TradeIndex._last_trade_id = 0
+    
+    @staticmethod
+    async def refresh() -> None:
+        """Index any trades newer than the last one indexed."""
+        latest = DataVersion.watermarks.get('last_trade_id')
+        if latest is not None and latest < TradeIndex._last_trade_id:
+            # Trades were deleted, start over
+            TradeIndex.reset()
+        elif latest is not None and latest == TradeIndex._last_trade_id:
+            return
+        
+        async with TradeIndex._lock:
+            rows = await DatabaseManager.execute_query_async(
+                "SELECT T_ID, Team1List, Team2List FROM transactions WHERE T_ID > %s ORDER BY T_ID",
+                (TradeIndex._last_trade_id,)
+            )
+            for t_id, team1_list, team2_list in rows:
+                for name in TradeIndex.parse_trade_list(team1_list) + TradeIndex.parse_trade_list(team2_list):
+                    TradeIndex._trade_ids.setdefault(name, set()).add(t_id)
+                    for token in name.split():
+                        TradeIndex._token_ids.setdefault(token, set()).add(t_id)
+                TradeIndex._last_trade_id = max(TradeIndex._last_trade_id, t_id)
+    
+    @staticmethod
+    async def get_trade_ids(player_name: str) -> List[int]:
+        """Get the IDs of every trade listing this player: by full name, or else by every word given."""
+        await TradeIndex.refresh()
+        name = TradeIndex.normalize_name(player_name)
+        trade_ids = TradeIndex._trade_ids.get(name)
+        if trade_ids is None:
+            # Partial names such as a surname: trades listing someone with all of the words
+            token_sets = [TradeIndex._token_ids.get(token, set()) for token in name.split()]
+            trade_ids = set.intersection(*token_sets) if token_sets else set()
+        return sorted(trade_ids)
+    
+    @staticmethod
+    async def on_data_change(previous: Dict[str, Any], current: Dict[str, Any]) -> None:
+        """Index new trades as soon as the watcher sees them."""
+        if TradeIndex._last_trade_id and previous.get('last_trade_id') != current.get('last_trade_id'):
+            await TradeIndex.refresh()
 
 
 class TradeManager:
     """Handles trade-related data operations."""
     
     @staticmethod
-    def get_trades_by_player(player_name: str, limit: int = 5) -> List[Tuple]:
+    async def get_trades_by_player(player_name: str, limit: int = 5) -> List[Tuple]:
         """Get all trades involving a specific player, limited to specified number."""
-        # Clean player name for search (handle underscores and case)
-        cleaned_name = player_name.replace('_', ' ').lower()
+        # Name lookup in the trade index instead of a LIKE scan of every trade
+        trade_ids = await TradeIndex.get_trade_ids(player_name)
+        if not trade_ids:
+            return []
         
-        query = """
+        placeholders = ', '.join(['%s'] * len(trade_ids))
+        query = f"""
         SELECT T_ID, DateCreated, Team1, Team2, Team1List, Team2List, 
                Team1Approved, Team2Approved, CommishApproved, FutureConsiderations
         FROM transactions 
-        WHERE (LOWER(Team1List) LIKE %s OR LOWER(Team2List) LIKE %s)
+        WHERE T_ID IN ({placeholders})
         ORDER BY DateCreated DESC
         LIMIT %s
         """
         
-        search_pattern = f"%{cleaned_name}%"
-        return DatabaseManager.execute_query(query, (search_pattern, search_pattern, limit))
+        return await DatabaseManager.execute_query_async(query, (*trade_ids, limit))
     
     @staticmethod
-    def get_trades_by_team(team1: str, team2: str = 'all', limit: int = 5) -> List[Tuple]:
+    async def get_trades_by_team(team1: str, team2: str = 'all', limit: int = 5) -> List[Tuple]:
         """Get trades involving a specific team, optionally filtered by another team, limited to specified number."""
         # Clean team names for search
         team1_clean = TeamDataManager.clean_team_name(team1.lower())
         team2_clean = TeamDataManager.clean_team_name(team2.lower()) if team2 != 'all' else 'all'
         
-        # Get team ID for team1
-        team1_result = DatabaseManager.execute_query("SELECT Number FROM proteam WHERE LOWER(Name) = %s", (team1_clean.lower(),))
-        if not team1_result:
+        # Get team ID for team1 from the cached team directory
+        team1_id = await TeamDataManager.get_team_number(team1_clean)
+        if team1_id is None:
             return []
         
-        team1_id = team1_result[0][0]
-        
         if team2 == 'all':
             # Get all trades involving team1
             query = """
@@ -826,15 +1510,13 @@ class TradeManager:
             ORDER BY DateCreated DESC
             LIMIT %s
             """
-            return DatabaseManager.execute_query(query, (team1_id, team1_id, limit))
+            return await DatabaseManager.execute_query_async(query, (team1_id, team1_id, limit))
         else:
             # Get team2 ID
-            team2_result = DatabaseManager.execute_query("SELECT Number FROM proteam WHERE LOWER(Name) = %s", (team2_clean.lower(),))
-            if not team2_result:
+            team2_id = await TeamDataManager.get_team_number(team2_clean)
+            if team2_id is None:
                 return []
             
-            team2_id = team2_result[0][0]
-            
             # Get trades between team1 and team2
             query = """
             SELECT T_ID, DateCreated, Team1, Team2, Team1List, Team2List, 
@@ -844,16 +1526,16 @@ class TradeManager:
             ORDER BY DateCreated DESC
             LIMIT %s
             """
-            return DatabaseManager.execute_query(query, (team1_id, team2_id, team2_id, team1_id, limit))
+            return await DatabaseManager.execute_query_async(query, (team1_id, team2_id, team2_id, team1_id, limit))
     
     @staticmethod
-    def get_team_name(team_id: int) -> str:
-        """Get team name from team ID."""
-        result = DatabaseManager.execute_query("SELECT Name FROM proteam WHERE Number = %s", (team_id,))
-        return result[0][0] if result else f"Team {team_id}"
+    async def get_team_name(team_id: int) -> str:
+        """Get team name from team ID using the cached team directory."""
+        team_names = await TeamDataManager.get_team_id_mapping()
+        return team_names.get(team_id, f"Team {team_id}")
     
     @staticmethod
-    def format_trade_history(trades: List[Tuple], player_name: str) -> str:
+    async def format_trade_history(trades: List[Tuple], player_name: str) -> str:
         """Format trade history for display."""
         if not trades:
             return f"No trades found for {player_name.title()}."
@@ -866,8 +1548,8 @@ class TradeManager:
             team1_approved, team2_approved, commish_approved, future_considerations = trade
             
             # Get team names
-            team1_name = TradeManager.get_team_name(team1_id)
-            team2_name = TradeManager.get_team_name(team2_id)
+            team1_name = await TradeManager.get_team_name(team1_id)
+            team2_name = await TradeManager.get_team_name(team2_id)
             
             # Format date
             date_str = str(date_created).split(' ')[0] if date_created else "Unknown"
@@ -905,21 +1587,21 @@ class TradeManager:
         return cleaned
     
     @staticmethod
-    def format_single_trade(trade: Tuple, trade_number: int) -> str:
+    async def format_single_trade(trade: Tuple, trade_number: int) -> str:
         """Formats a single trade into a readable string."""
         t_id, date_created, team1_id, team2_id, team1_list, team2_list, \
         team1_approved, team2_approved, commish_approved, future_considerations = trade
         
         # Debug output to see what we're getting from database
-        print(f"DEBUG: Trade #{t_id} - Team1 ID: {team1_id}, Team2 ID: {team2_id}")
-        print(f"DEBUG: Team1List: '{team1_list}'")
-        print(f"DEBUG: Team2List: '{team2_list}'")
+        trades_log.debug("Trade #%s - Team1 ID: %s, Team2 ID: %s", t_id, team1_id, team2_id)
+        trades_log.debug("Team1List: '%s'", team1_list)
+        trades_log.debug("Team2List: '%s'", team2_list)
         
         # Get team names
-        team1_name = TradeManager.get_team_name(team1_id)
-        team2_name = TradeManager.get_team_name(team2_id)
+        team1_name = await TradeManager.get_team_name(team1_id)
+        team2_name = await TradeManager.get_team_name(team2_id)
         
-        print(f"DEBUG: Team1 Name: '{team1_name}', Team2 Name: '{team2_name}'")
+        trades_log.debug("Team1 Name: '%s', Team2 Name: '%s'", team1_name, team2_name)
         
         # Format date
         date_str = str(date_created).split(' ')[0] if date_created else "Unknown"
@@ -960,7 +1642,7 @@ class AwardsManager:
     """Handles award-related data operations."""
     
     @staticmethod
-    def get_award_winners(award_name: str = None, season_id: str = None) -> List[Tuple]:
+    async def get_award_winners(award_name: str = None, season_id: str = None) -> List[Tuple]:
         """Get award winners for a specific award and season, or all awards for a season."""
         if season_id == "all" and award_name:
             # Get all historical winners for a specific award
@@ -975,7 +1657,7 @@ class AwardsManager:
             WHERE Season_ID IS NOT NULL
             ORDER BY Season_ID DESC
             """
-            return DatabaseManager.execute_query(query)
+            return await DatabaseManager.execute_query_async(query)
         elif season_id and season_id != "all":
             # Get all awards for a specific season
             query = """
@@ -988,10 +1670,10 @@ class AwardsManager:
             FROM trophywinners 
             WHERE Season_ID = %s
             """
-            return DatabaseManager.execute_query(query, (season_id,))
+            return await DatabaseManager.execute_query_async(query, (season_id,))
         else:
             # Get the most recent season ID if not provided
-            season_result = DatabaseManager.execute_query("SELECT MAX(Season_ID) FROM trophywinners")
+            season_result = await DatabaseManager.execute_query_async("SELECT MAX(Season_ID) FROM trophywinners")
             season_id = season_result[0][0] if season_result else 0
             
             # Get all awards for the most recent season
@@ -1005,25 +1687,25 @@ class AwardsManager:
             FROM trophywinners 
             WHERE Season_ID = %s
             """
-            return DatabaseManager.execute_query(query, (season_id,))
+            return await DatabaseManager.execute_query_async(query, (season_id,))
     
     @staticmethod
-    def get_player_name(player_id: int) -> str:
+    async def get_player_name(player_id: int) -> str:
         """Get player name from player ID."""
         if player_id == 0 or player_id is None:
             return "No Award Given"
         
-        result = DatabaseManager.execute_query("SELECT Name FROM playerstats WHERE Number = %s LIMIT 1", (player_id,))
+        result = await DatabaseManager.execute_query_async("SELECT Name FROM playerstats WHERE Number = %s LIMIT 1", (player_id,))
         return result[0][0] if result else f"Player #{player_id}"
     
     @staticmethod
-    def get_team_name(team_id: int) -> str:
+    async def get_team_name(team_id: int) -> str:
         """Get team name from team ID."""
-        result = DatabaseManager.execute_query("SELECT Name FROM proteam WHERE Number = %s", (team_id,))
+        result = await DatabaseManager.execute_query_async("SELECT Name FROM proteam WHERE Number = %s", (team_id,))
         return result[0][0] if result else f"Team {team_id}"
     
     @staticmethod
-    def format_awards(awards: List[Tuple], award_name: str = None, season_id: str = None) -> str:
+    async def format_awards(awards: List[Tuple], award_name: str = None, season_id: str = None) -> str:
         """Format awards for display."""
         if not awards:
             if season_id == "all":
@@ -1046,7 +1728,7 @@ class AwardsManager:
                 team, season_id = award
                 
                 # Get team name
-                team_name = AwardsManager.get_team_name(team) if team else "Unknown Team"
+                team_name = await AwardsManager.get_team_name(team) if team else "Unknown Team"
                 
                 # Find the specific award winner
                 winner_id = None
@@ -1078,7 +1760,7 @@ class AwardsManager:
                     winner_id = general_manager
                 
                 if winner_id and winner_id != 0:
-                    winner_name = AwardsManager.get_player_name(winner_id)
+                    winner_name = await AwardsManager.get_player_name(winner_id)
                     result += f"**Season {season_id}:** {winner_name} ({team_name})\n"
                 
             return result
@@ -1094,7 +1776,7 @@ class AwardsManager:
             team, season_id = award
             
             # Get team name
-            team_name = AwardsManager.get_team_name(team) if team else "Unknown Team"
+            team_name = await AwardsManager.get_team_name(team) if team else "Unknown Team"
             
             result = f"**Awards for Season {season_id}**\n"
             result += f"**Team:** {team_name}\n"
@@ -1103,74 +1785,142 @@ class AwardsManager:
             # NHL Awards
             result += "**🏆 NHL Awards:**\n"
             if playoff_mvp and playoff_mvp != 0:
-                result += f"**Playoff MVP:** {AwardsManager.get_player_name(playoff_mvp)}\n"
+                result += f"**Playoff MVP:** {await AwardsManager.get_player_name(playoff_mvp)}\n"
             if mvp and mvp != 0:
-                result += f"**MVP:** {AwardsManager.get_player_name(mvp)}\n"
+                result += f"**MVP:** {await AwardsManager.get_player_name(mvp)}\n"
             if top_scorer and top_scorer != 0:
-                result += f"**Top Scorer:** {AwardsManager.get_player_name(top_scorer)}\n"
+                result += f"**Top Scorer:** {await AwardsManager.get_player_name(top_scorer)}\n"
             if goalie_of_year and goalie_of_year != 0:
-                result += f"**Goalie of the Year:** {AwardsManager.get_player_name(goalie_of_year)}\n"
+                result += f"**Goalie of the Year:** {await AwardsManager.get_player_name(goalie_of_year)}\n"
             if defenseman_of_year and defenseman_of_year != 0:
-                result += f"**Defenseman of the Year:** {AwardsManager.get_player_name(defenseman_of_year)}\n"
+                result += f"**Defenseman of the Year:** {await AwardsManager.get_player_name(defenseman_of_year)}\n"
             if rookie_of_year and rookie_of_year != 0:
-                result += f"**Rookie of the Year:** {AwardsManager.get_player_name(rookie_of_year)}\n"
+                result += f"**Rookie of the Year:** {await AwardsManager.get_player_name(rookie_of_year)}\n"
             if best_defensive_forward and best_defensive_forward != 0:
-                result += f"**Best Defensive Forward:** {AwardsManager.get_player_name(best_defensive_forward)}\n"
+                result += f"**Best Defensive Forward:** {await AwardsManager.get_player_name(best_defensive_forward)}\n"
             if most_sportsmanlike and most_sportsmanlike != 0:
-                result += f"**Most Sportsmanlike Player:** {AwardsManager.get_player_name(most_sportsmanlike)}\n"
+                result += f"**Most Sportsmanlike Player:** {await AwardsManager.get_player_name(most_sportsmanlike)}\n"
             if coach_of_year and coach_of_year != 0:
-                result += f"**Coach of the Year:** {AwardsManager.get_player_name(coach_of_year)}\n"
+                result += f"**Coach of the Year:** {await AwardsManager.get_player_name(coach_of_year)}\n"
             if top_goal_scorer and top_goal_scorer != 0:
-                result += f"**Top Goal Scorer:** {AwardsManager.get_player_name(top_goal_scorer)}\n"
+                result += f"**Top Goal Scorer:** {await AwardsManager.get_player_name(top_goal_scorer)}\n"
             if lowest_gaa and lowest_gaa != 0:
-                result += f"**Lowest GAA:** {AwardsManager.get_player_name(lowest_gaa)}\n"
+                result += f"**Lowest GAA:** {await AwardsManager.get_player_name(lowest_gaa)}\n"
             if lowest_pim and lowest_pim != 0:
-                result += f"**Lowest PIM:** {AwardsManager.get_player_name(lowest_pim)}\n"
+                result += f"**Lowest PIM:** {await AwardsManager.get_player_name(lowest_pim)}\n"
             if general_manager and general_manager != 0:
-                result += f"**General Manager:** {AwardsManager.get_player_name(general_manager)}\n"
+                result += f"**General Manager:** {await AwardsManager.get_player_name(general_manager)}\n"
             
             result += "\n**🏆 Farm Team Awards:**\n"
             if farm_playoff_mvp and farm_playoff_mvp != 0:
-                result += f"**Farm Playoff MVP:** {AwardsManager.get_player_name(farm_playoff_mvp)}\n"
+                result += f"**Farm Playoff MVP:** {await AwardsManager.get_player_name(farm_playoff_mvp)}\n"
             if farm_mvp and farm_mvp != 0:
-                result += f"**Farm MVP:** {AwardsManager.get_player_name(farm_mvp)}\n"
+                result += f"**Farm MVP:** {await AwardsManager.get_player_name(farm_mvp)}\n"
             if farm_top_scorer and farm_top_scorer != 0:
-                result += f"**Farm Top Scorer:** {AwardsManager.get_player_name(farm_top_scorer)}\n"
+                result += f"**Farm Top Scorer:** {await AwardsManager.get_player_name(farm_top_scorer)}\n"
             if farm_goalie_of_year and farm_goalie_of_year != 0:
-                result += f"**Farm Goalie of the Year:** {AwardsManager.get_player_name(farm_goalie_of_year)}\n"
+                result += f"**Farm Goalie of the Year:** {await AwardsManager.get_player_name(farm_goalie_of_year)}\n"
             if farm_defenseman_of_year and farm_defenseman_of_year != 0:
-                result += f"**Farm Defenseman of the Year:** {AwardsManager.get_player_name(farm_defenseman_of_year)}\n"
+                result += f"**Farm Defenseman of the Year:** {await AwardsManager.get_player_name(farm_defenseman_of_year)}\n"
             if farm_rookie_of_year and farm_rookie_of_year != 0:
-                result += f"**Farm Rookie of the Year:** {AwardsManager.get_player_name(farm_rookie_of_year)}\n"
+                result += f"**Farm Rookie of the Year:** {await AwardsManager.get_player_name(farm_rookie_of_year)}\n"
             if farm_best_defensive_forward and farm_best_defensive_forward != 0:
-                result += f"**Farm Best Defensive Forward:** {AwardsManager.get_player_name(farm_best_defensive_forward)}\n"
+                result += f"**Farm Best Defensive Forward:** {await AwardsManager.get_player_name(farm_best_defensive_forward)}\n"
             if farm_most_sportsmanlike and farm_most_sportsmanlike != 0:
-                result += f"**Farm Most Sportsmanlike Player:** {AwardsManager.get_player_name(farm_most_sportsmanlike)}\n"
+                result += f"**Farm Most Sportsmanlike Player:** {await AwardsManager.get_player_name(farm_most_sportsmanlike)}\n"
             if farm_coach_of_year and farm_coach_of_year != 0:
-                result += f"**Farm Coach of the Year:** {AwardsManager.get_player_name(farm_coach_of_year)}\n"
+                result += f"**Farm Coach of the Year:** {await AwardsManager.get_player_name(farm_coach_of_year)}\n"
             if farm_top_goal_scorer and farm_top_goal_scorer != 0:
-                result += f"**Farm Top Goal Scorer:** {AwardsManager.get_player_name(farm_top_goal_scorer)}\n"
+                result += f"**Farm Top Goal Scorer:** {await AwardsManager.get_player_name(farm_top_goal_scorer)}\n"
             if farm_lowest_gaa and farm_lowest_gaa != 0:
-                result += f"**Farm Lowest GAA:** {AwardsManager.get_player_name(farm_lowest_gaa)}\n"
+                result += f"**Farm Lowest GAA:** {await AwardsManager.get_player_name(farm_lowest_gaa)}\n"
             if farm_lowest_pim and farm_lowest_pim != 0:
-                result += f"**Farm Lowest PIM:** {AwardsManager.get_player_name(farm_lowest_pim)}\n"
+                result += f"**Farm Lowest PIM:** {await AwardsManager.get_player_name(farm_lowest_pim)}\n"
             
             return result
 
 
+class StatTable:
+    """Column-oriented stats table for leaderboards.
+    
+    Each stat is held in its own NumPy array, with boolean masks per team built
+    once up front and positions held as bitmasks. Filtering is a mask
+    combination plus a bit test and top-k uses a partial selection, so a
+    leaderboard query never loops over players in Python.
+    """
+    
+    def __init__(self, rows: List[Dict], columns: List[str]):
+        self.rows = rows
+        self.columns = {
+            column: np.array([row[column] for row in rows], dtype=np.float64)
+            for column in columns
+        }
+        
+        teams = np.array([row['Team'] for row in rows], dtype=object)
+        self._team_masks = {team: teams == team for team in set(teams.tolist())}
+        
+        # Position bitmasks (PlayerDataManager.POSITION_BITS), when the rows have them
+        self._positions = None
+        if rows and 'Position' in rows[0]:
+            self._positions = np.array([row['Position'] for row in rows], dtype=np.uint8)
+    
+    def __len__(self) -> int:
+        return len(self.rows)
+    
+    def mask(self, team: str = 'all', position: str = 'all', min_games: int = 0) -> np.ndarray:
+        """Build a row mask for a team, position and minimum games played."""
+        mask = np.ones(len(self.rows), dtype=bool)
+        empty = np.zeros(len(self.rows), dtype=bool)
+        
+        if team != 'all':
+            mask &= self._team_masks.get(team, empty)
+        if position != 'all':
+            bit = PlayerDataManager.POSITION_BITS.get(position)
+            if bit is None or self._positions is None:
+                mask &= empty
+            else:
+                mask &= (self._positions & bit) != 0
+        if min_games > 0:
+            mask &= self.columns['GP'] >= min_games
+        
+        return mask
+    
+    def top(self, column: str, k: int, mask: Optional[np.ndarray] = None, ascending: bool = False) -> List[Dict]:
+        """Return the k best rows by column among the masked rows.
+        
+        Ties keep their original row order, matching a stable full sort.
+        """
+        if k <= 0 or not self.rows:
+            return []
+        
+        keys = self.columns[column] if ascending else -self.columns[column]
+        candidates = np.flatnonzero(mask) if mask is not None else np.arange(len(self.rows))
+        
+        if len(candidates) > k:
+            candidate_keys = keys[candidates]
+            kth = np.partition(candidate_keys, k - 1)[k - 1]
+            better = candidates[candidate_keys < kth]
+            tied = candidates[candidate_keys == kth][:k - len(better)]
+            candidates = np.concatenate((better, tied))
+        
+        order = candidates[np.lexsort((candidates, keys[candidates]))]
+        return [self.rows[i] for i in order]
+
+
 class PlayerStatsManager:
     """Handles player statistics operations."""
     
     @staticmethod
-    def get_player_stats(season_id: int) -> List[Dict]:
+    async def get_player_stats(season_id: int) -> List[Dict]:
         """Get all player statistics."""
-        team_mapping = TeamDataManager.get_team_id_mapping()
+        team_mapping = await TeamDataManager.get_team_id_mapping()
         
-        players_data = DatabaseManager.execute_query(
+        players_data = await DatabaseManager.execute_query_async(
             """SELECT Name, Team, ProGP, ProShots, ProG, ProA, ProPoint, ProPlusMinus, 
                       ProPim, ProShotsBlock, ProHits, ProGW, Active 
                FROM playerstats WHERE Season_ID = (%s) AND proGP > 0""",
-            (season_id,)
+            (season_id,),
+            permanent=await TeamDataManager.is_past_season(season_id)
         )
         
         cleaned_stats = []
@@ -1187,29 +1937,65 @@ class PlayerStatsManager:
         return cleaned_stats
     
     @staticmethod
-    def filter_players_by_team_and_position(players: List[Dict], team: str, position: str) -> List[Dict]:
-        """Filter players by team and position."""
-        if team != 'all':
-            players = [p for p in players if p['Team'] == team]
+    async def get_merged_player_stats(season_id: int) -> List[Dict]:
+        """Get player statistics with traded stints already summed by MySQL.
         
-        if position != 'all':
-            players = [p for p in players if position in p['Position']]
+        Equivalent to merge_traded_players(get_player_stats(season_id)) but only
+        one row per player crosses the wire, and each row carries its position
+        bitmask (see PlayerDataManager.POSITION_BITS) from the players table.
+        """
+        team_mapping = await TeamDataManager.get_team_id_mapping()
+        
+        players_data = await DatabaseManager.execute_query_async(
+            """SELECT s.Name, s.Team, s.GP, s.Shots, s.G, s.A, s.Points, s.PlusMinus,
+                      s.Pim, s.ShotsBlock, s.Hits, s.GW, p.PosC, p.PosLW, p.PosRW, p.PosD
+               FROM (SELECT Name, MAX(CASE WHEN Active = 'True' THEN Team END) AS Team,
+                            SUM(ProGP) AS GP, SUM(ProShots) AS Shots, SUM(ProG) AS G, SUM(ProA) AS A,
+                            SUM(ProPoint) AS Points, SUM(ProPlusMinus) AS PlusMinus, SUM(ProPim) AS Pim,
+                            SUM(ProShotsBlock) AS ShotsBlock, SUM(ProHits) AS Hits, SUM(ProGW) AS GW
+                     FROM playerstats
+                     WHERE Season_ID = (%s) AND proGP > 0 AND Active IN ('True', 'False')
+                     GROUP BY Name
+                     HAVING SUM(CASE WHEN Active = 'True' THEN 1 ELSE 0 END) > 0) s
+               LEFT JOIN (SELECT Name, MAX(PosC) AS PosC, MAX(PosLW) AS PosLW,
+                                 MAX(PosRW) AS PosRW, MAX(PosD) AS PosD
+                          FROM players GROUP BY Name) p ON p.Name = s.Name""",
+            (season_id,),
+            permanent=await TeamDataManager.is_past_season(season_id)
+        )
         
-        return players
+        merged_players = []
+        for player in players_data:
+            stats = [DatabaseManager.to_number(value) for value in player[2:12]]
+            merged_players.append({
+                'Name': player[0],
+                'Team': team_mapping[int(player[1])],
+                'GP': stats[0], 'Shots': stats[1], 'Goals': stats[2],
+                'Assists': stats[3], 'Points': stats[4], '+/-': stats[5],
+                'Pims': stats[6], 'ShotsBlocked': stats[7], 'Hits': stats[8],
+                'GWG': stats[9], 'currentTeam': 'True',
+                'P/G': round(stats[4] / stats[0], 2),
+                'Position': PlayerDataManager.position_mask(*player[12:16])
+            })
+        
+        return merged_players
+    
+    # Command stat names -> StatTable columns
+    STAT_COLUMNS = {
+        'P/G': 'P/G', 'Goals': 'Goals', 'Assists': 'Assists', 'Points': 'Points',
+        'Shots': 'Shots', '+/-': '+/-', 'Pims': 'Pims', 'Shots_blocked': 'ShotsBlocked',
+        'GWG': 'GWG', 'Hits': 'Hits'
+    }
+    
+    TABLE_COLUMNS = ['GP', 'Shots', 'Goals', 'Assists', 'Points', '+/-', 'Pims',
+                     'ShotsBlocked', 'Hits', 'GWG', 'P/G']
     
     @staticmethod
-    def sort_players_by_stat(players: List[Dict], stat: str) -> List[Dict]:
-        """Sort players by specified statistic."""
-        stat_mapping = {
-            'P/G': 'P/G', 'Goals': 'Goals', 'Assists': 'Assists', 'Points': 'Points',
-            'Shots': 'Shots', '+/-': '+/-', 'Pims': 'Pims', 'Shots_blocked': 'ShotsBlocked',
-            'GWG': 'GWG', 'Hits': 'Hits'
-        }
-        
-        sort_key = stat_mapping.get(stat, 'Points')
-        reverse = sort_key != 'P/G'  # GAA sorts in ascending order
-        
-        return sorted(players, key=lambda k: (-k[sort_key] if reverse else k[sort_key]))
+    def get_leaders(table: 'StatTable', team: str, position: str, stat: str, limit: int = 10) -> List[Dict]:
+        """Get the top players for a stat, filtered by team and position."""
+        sort_key = PlayerStatsManager.STAT_COLUMNS.get(stat, 'Points')
+        mask = table.mask(team=team, position=position)
+        return table.top(sort_key, limit, mask, ascending=sort_key == 'P/G')
     
     @staticmethod
     def format_player_leaders(players: List[Dict], stat: str) -> str:
@@ -1227,15 +2013,16 @@ class GoalieStatsManager:
     """Handles goalie statistics operations."""
     
     @staticmethod
-    def get_goalie_stats(season_id: int) -> List[Dict]:
+    async def get_goalie_stats(season_id: int) -> List[Dict]:
         """Get all goalie statistics."""
-        team_mapping = TeamDataManager.get_team_id_mapping()
+        team_mapping = await TeamDataManager.get_team_id_mapping()
         
-        goalies_data = DatabaseManager.execute_query(
+        goalies_data = await DatabaseManager.execute_query_async(
             """SELECT Name, Team, ProGP, ProMinPlay, ProW, ProL, ProOTL, ProShutouts, 
                       ProGA, ProSA, Active 
                FROM goaliestats WHERE Season_ID = (%s) AND proGP > 0""",
-            (season_id,)
+            (season_id,),
+            permanent=await TeamDataManager.is_past_season(season_id)
         )
         
         cleaned_stats = []
@@ -1252,39 +2039,46 @@ class GoalieStatsManager:
         
         return cleaned_stats
     
+    # Counting stats that are summed across a goalie's stints
+    SUMMED_STATS = ['GP', 'Minutes', 'Wins', 'Losses', 'OTL', 'SO', 'GA', 'Saves', 'SA']
+    
     @staticmethod
     def merge_traded_goalies(goalies: List[Dict]) -> List[Dict]:
         """Merge stats for goalies who were traded."""
-        current_goalies = [g for g in goalies if g['currentTeam'] == 'True']
-        traded_goalies = [g for g in goalies if g['currentTeam'] == 'False']
+        return PlayerDataManager.merge_stints(goalies, GoalieStatsManager.SUMMED_STATS)
+    
+    @staticmethod
+    async def get_merged_goalie_stats(season_id: int) -> List[Dict]:
+        """Get goalie statistics with traded stints already summed by MySQL.
         
-        merged_goalies = []
+        Equivalent to merge_traded_goalies(get_goalie_stats(season_id)) but only
+        one row per goalie crosses the wire.
+        """
+        team_mapping = await TeamDataManager.get_team_id_mapping()
+        
+        goalies_data = await DatabaseManager.execute_query_async(
+            """SELECT Name, MAX(CASE WHEN Active = 'True' THEN Team END),
+                      SUM(ProGP), SUM(ProMinPlay), SUM(ProW), SUM(ProL), SUM(ProOTL),
+                      SUM(ProShutouts), SUM(ProGA), SUM(ProSA)
+               FROM goaliestats
+               WHERE Season_ID = (%s) AND proGP > 0 AND Active IN ('True', 'False')
+               GROUP BY Name
+               HAVING SUM(CASE WHEN Active = 'True' THEN 1 ELSE 0 END) > 0""",
+            (season_id,),
+            permanent=await TeamDataManager.is_past_season(season_id)
+        )
         
-        for current_goalie in current_goalies:
-            traded_goalie = next(
-                (g for g in traded_goalies if g['Name'] == current_goalie['Name']), 
-                None
-            )
-            
-            if traded_goalie:
-                merged_goalie = {
-                    'Name': current_goalie['Name'],
-                    'Team': current_goalie['Team'],
-                    'GP': current_goalie['GP'] + traded_goalie['GP'],
-                    'Minutes': current_goalie['Minutes'] + traded_goalie['Minutes'],
-                    'Wins': current_goalie['Wins'] + traded_goalie['Wins'],
-                    'Losses': current_goalie['Losses'] + traded_goalie['Losses'],
-                    'OTL': current_goalie['OTL'] + traded_goalie['OTL'],
-                    'SO': current_goalie['SO'] + traded_goalie['SO'],
-                    'GA': current_goalie['GA'] + traded_goalie['GA'],
-                    'Saves': current_goalie['Saves'] + traded_goalie['Saves'],
-                    'SA': current_goalie['SA'] + traded_goalie['SA'],
-                    'currentTeam': current_goalie['currentTeam']
-                }
-            else:
-                merged_goalie = current_goalie.copy()
-            
-            merged_goalies.append(merged_goalie)
+        merged_goalies = []
+        for goalie in goalies_data:
+            stats = [DatabaseManager.to_number(value) for value in goalie[2:]]
+            merged_goalies.append({
+                'Name': goalie[0],
+                'Team': team_mapping[int(goalie[1])],
+                'GP': stats[0], 'Minutes': stats[1], 'Wins': stats[2],
+                'Losses': stats[3], 'OTL': stats[4], 'SO': stats[5],
+                'GA': stats[6], 'Saves': int(stats[7]) - int(stats[6]), 'SA': int(stats[7]),
+                'currentTeam': 'True'
+            })
         
         return merged_goalies
     
@@ -1299,18 +2093,20 @@ class GoalieStatsManager:
         
         return goalies
     
+    # Command stat names -> StatTable columns
+    STAT_COLUMNS = {
+        'GAA': 'GAA', 'SV%': 'SVP', 'W': 'Wins', 'GP': 'GP',
+        'SO': 'SO', 'L': 'Losses', 'S': 'Saves'
+    }
+    
+    TABLE_COLUMNS = ['GP', 'Minutes', 'Wins', 'Losses', 'OTL', 'SO', 'GA', 'Saves', 'SA', 'SVP', 'GAA']
+    
     @staticmethod
-    def sort_goalies_by_stat(goalies: List[Dict], stat: str) -> List[Dict]:
-        """Sort goalies by specified statistic."""
-        stat_mapping = {
-            'GAA': 'GAA', 'SV%': 'SVP', 'W': 'Wins', 'GP': 'GP',
-            'SO': 'SO', 'L': 'Losses', 'S': 'Saves'
-        }
-        
-        sort_key = stat_mapping.get(stat, 'SVP')
-        reverse = sort_key != 'GAA'  # GAA sorts in ascending order
-        
-        return sorted(goalies, key=lambda k: (-k[sort_key] if reverse else k[sort_key]))
+    def get_leaders(table: 'StatTable', stat: str, limit: int = 10, min_games: int = 0) -> List[Dict]:
+        """Get the top goalies for a stat among those with at least min_games played."""
+        sort_key = GoalieStatsManager.STAT_COLUMNS.get(stat, 'SVP')
+        mask = table.mask(min_games=min_games)
+        return table.top(sort_key, limit, mask, ascending=sort_key == 'GAA')
     
     @staticmethod
     def format_goalie_leaders(goalies: List[Dict], stat: str) -> str:
@@ -1324,13 +2120,603 @@ class GoalieStatsManager:
         return leaders
 
 
+class SeasonSnapshot:
+    """Merged skater and goalie stats for one season, held in memory."""
+    
+    def __init__(self, season_id: int, skaters: List[Dict], goalies: List[Dict], version: Tuple):
+        self.season_id = season_id
+        self.skaters = StatTable(skaters, PlayerStatsManager.TABLE_COLUMNS)
+        self.goalies = StatTable(goalies, GoalieStatsManager.TABLE_COLUMNS)
+        self.version = version
+        self.loaded_at = time.time()
+
+
+class SnapshotManager:
+    """Keeps the current season's leaderboard data in memory.
+    
+    The snapshot is loaded once with traded stints merged and P/G, SV% and GAA
+    precomputed, and is rebuilt when the season or the games played move.
+    """
+    
+    _snapshot: Optional[SeasonSnapshot] = None
+    _lock = asyncio.Lock()
+    
+    @staticmethod
+    async def load() -> SeasonSnapshot:
+        """Build a snapshot of the current season from the database."""
+        version = DataVersion.key(DataVersion.STATS_WATERMARKS)
+        season_id = await TeamDataManager.get_current_season_id()
+        
+        # Traded stints are summed and positions joined in SQL, one row per player
+        skaters, goalies = await asyncio.gather(
+            PlayerStatsManager.get_merged_player_stats(season_id),
+            GoalieStatsManager.get_merged_goalie_stats(season_id)
+        )
+        
+        with PerfMonitor.measure('processing'):
+            goalies = GoalieStatsManager.calculate_goalie_stats(goalies)
+            return SeasonSnapshot(season_id, skaters, goalies, version)
+    
+    @staticmethod
+    async def get_snapshot() -> SeasonSnapshot:
+        """Return the current season's snapshot, reloading it if the season or games played moved."""
+        snapshot = SnapshotManager._snapshot
+        if snapshot is not None and snapshot.version == DataVersion.key(DataVersion.STATS_WATERMARKS):
+            return snapshot
+        
+        async with SnapshotManager._lock:
+            # Another command may have loaded it while we waited
+            snapshot = SnapshotManager._snapshot
+            if snapshot is None or snapshot.version != DataVersion.key(DataVersion.STATS_WATERMARKS):
+                snapshot = await SnapshotManager.load()
+                SnapshotManager._snapshot = snapshot
+            return snapshot
+    
+    @staticmethod
+    async def on_data_change(previous: Dict[str, Any], current: Dict[str, Any]) -> None:
+        """Rebuild an already-loaded snapshot as soon as new games are written."""
+        if SnapshotManager._snapshot is not None and (
+                previous.get('games_played') != current.get('games_played')
+                or previous.get('season_id') != current.get('season_id')):
+            await SnapshotManager.get_snapshot()
+
+
+# Reference data first so the rebuilt models see a new season
+DataVersion.subscribe(TeamDataManager.on_data_change)
+DataVersion.subscribe(SnapshotManager.on_data_change)
+DataVersion.subscribe(StandingsManager.on_data_change)
+DataVersion.subscribe(TradeIndex.on_data_change)
+DataVersion.subscribe(RecordBook.on_data_change)
+
+
+@tasks.loop(seconds=DATA_WATCH_INTERVAL)
+async def watch_data_changes():
+    """Background task that polls the watermarks and publishes their changes."""
+    try:
+        await DataVersion.poll()
+    except Exception as e:
+        data_log.error("Error polling for data changes: %s", e)
+
+
+class SingleFlight:
+    """Lets concurrent callers asking for the same key share one in-flight call.
+    
+    The first caller starts the call; everyone arriving before it finishes
+    awaits the same result (or exception). Keys should include the DataVersion
+    watermarks the call depends on, so a call started on old data is never
+    handed to someone asking after the simulator wrote new data.
+    """
+    
+    _in_flight: Dict[Tuple, asyncio.Future] = {}
+    
+    @staticmethod
+    async def run(key: Tuple, call: Callable[[], Any]) -> Any:
+        """Await call() or the identical call already in flight for key."""
+        future = SingleFlight._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(call())
+            SingleFlight._in_flight[key] = future
+            future.add_done_callback(lambda done: SingleFlight._in_flight.pop(key, None))
+        
+        # Shielded so one caller giving up does not cancel the others' result
+        return await asyncio.shield(future)
+
+
+class RenderCache:
+    """Finished message payloads per command and arguments.
+    
+    Entries are tagged with the game watermarks they were rendered under and
+    are only served while those are current, so a repeat request costs a dict
+    lookup and new trades leave them alone. The cache holds at most RENDER_CACHE_SIZE entries (least
+    recently used are evicted first).
+    """
+    
+    _entries: 'OrderedDict[Tuple, Tuple[Tuple, Dict[str, Any]]]' = OrderedDict()
+    
+    @staticmethod
+    async def get_or_render(key: Tuple, render: Callable[[], Any]) -> Dict[str, Any]:
+        """Return the cached payload for key, awaiting render() to build it on a miss."""
+        version = DataVersion.key(DataVersion.GAME_WATERMARKS)
+        entries = RenderCache._entries
+        
+        entry = entries.get(key)
+        if entry is not None and entry[0] == version:
+            entries.move_to_end(key)
+            return entry[1]
+        
+        async def render_and_store() -> Dict[str, Any]:
+            with PerfMonitor.measure('format'):
+                payload = await render()
+            entries[key] = (version, payload)
+            entries.move_to_end(key)
+            while len(entries) > RENDER_CACHE_SIZE:
+                entries.popitem(last=False)
+            return payload
+        
+        # Users asking for the same thing at the same moment share one render
+        return await SingleFlight.run(('render', key, version), render_and_store)
+
+
+class MessagePaginator:
+    """Packs formatted items into as few messages as fit Discord's size limit.
+    
+    The first page is sent as a normal message; when there is more, readers
+    flip pages with reactions on that same message. Pages are only formatted
+    when somebody first asks for them.
+    """
+    
+    MESSAGE_LIMIT = 2000
+    PREVIOUS = '\u25c0\ufe0f'
+    NEXT = '\u25b6\ufe0f'
+    FENCE = '```'
+    
+    # Room kept for the " - page N" suffix on the header
+    PAGE_SUFFIX_RESERVE = 16
+    
+    # Reaction watchers still running, kept so they are not garbage collected
+    _watchers: set = set()
+    
+    def __init__(self, header: str, items: List[Any], format_item: Callable[[Any, int], Any]):
+        self.header = header
+        self.items = items
+        self.format_item = format_item
+        self._pages: List[str] = []
+        self._next_item = 0
+        # A formatted item that did not fit on the previous page
+        self._carry: Optional[str] = None
+    
+    def _has_more(self) -> bool:
+        return self._carry is not None or self._next_item < len(self.items)
+    
+    @staticmethod
+    def truncate(text: str, limit: int) -> str:
+        """Cut text to at most limit characters with an ellipsis, closing a code block left open."""
+        closing = '\n' + MessagePaginator.FENCE
+        # Never end on part of a fence
+        cut = text[:limit - 1 - len(closing)].rstrip('`') + '\u2026'
+        if cut.count(MessagePaginator.FENCE) % 2:
+            cut += closing
+        return cut
+    
+    async def _build_next_page(self) -> bool:
+        """Format items until the next page is full. Returns False when none are left."""
+        if not self._has_more():
+            return False
+        
+        budget = self.MESSAGE_LIMIT - len(self.header) - self.PAGE_SUFFIX_RESERVE
+        parts: List[str] = []
+        size = 0
+        
+        while self._has_more():
+            if self._carry is not None:
+                text, self._carry = self._carry, None
+            else:
+                text = await self.format_item(self.items[self._next_item], self._next_item + 1)
+                self._next_item += 1
+                if len(text) > budget - 1:
+                    text = MessagePaginator.truncate(text, budget - 1)
+            
+            if parts and size + len(text) + 1 > budget:
+                self._carry = text
+                break
+            parts.append(text)
+            size += len(text) + 1
+        
+        number = len(self._pages) + 1
+        header = f"{self.header} - page {number}" if number > 1 or self._has_more() else self.header
+        self._pages.append(header + "\n" + "\n".join(parts))
+        return True
+    
+    async def get_page(self, index: int) -> Optional[str]:
+        """Return page index (0-based), formatting pages up to it if needed, or None past the end."""
+        with PerfMonitor.measure('format'):
+            while len(self._pages) <= index and await self._build_next_page():
+                pass
+        return self._pages[index] if 0 <= index < len(self._pages) else None
+    
+    async def send(self, ctx) -> None:
+        """Send the first page and, if there are more, start listening for page flips."""
+        message = await ctx.send(await self.get_page(0))
+        if not self._has_more():
+            return
+        
+        await message.add_reaction(self.PREVIOUS)
+        await message.add_reaction(self.NEXT)
+        
+        watcher = asyncio.ensure_future(self._watch_reactions(message))
+        MessagePaginator._watchers.add(watcher)
+        watcher.add_done_callback(MessagePaginator._watchers.discard)
+    
+    async def _watch_reactions(self, message) -> None:
+        """Flip pages on reactions until nobody has reacted for PAGINATOR_TIMEOUT seconds."""
+        def check(reaction, user):
+            return (reaction.message.id == message.id and not user.bot
+                    and str(reaction.emoji) in (self.PREVIOUS, self.NEXT))
+        
+        current = 0
+        while True:
+            try:
+                reaction, user = await bot.wait_for('reaction_add', timeout=PAGINATOR_TIMEOUT, check=check)
+            except asyncio.TimeoutError:
+                break
+            
+            step = 1 if str(reaction.emoji) == self.NEXT else -1
+            page = await self.get_page(current + step)
+            if page is not None:
+                current += step
+                await message.edit(content=page)
+            
+            # Needs Manage Messages; without it the reader just taps again
+            try:
+                await message.remove_reaction(reaction.emoji, user)
+            except discord.HTTPException:
+                pass
+        
+        try:
+            await message.clear_reactions()
+        except discord.HTTPException:
+            pass
+
+
+class CommandTrace:
+    """Timings of one command invocation, accumulated per phase in seconds.
+    
+    Wall-clock time is charged to the most recently opened phase that is still
+    open. Overlapping blocks of one phase (tasks gathered by the command share
+    the trace) therefore count once, and an outer phase is paused while a
+    nested one runs.
+    """
+    
+    def __init__(self, command: str):
+        self.command = command
+        self.started = time.perf_counter()
+        self.phases = {'db': 0.0, 'processing': 0.0, 'format': 0.0, 'send': 0.0}
+        self.error = False
+        self._open: List[str] = []
+        self._switched_at = self.started
+    
+    def _charge(self) -> None:
+        """Charge the time since the last open or close to the innermost open phase."""
+        now = time.perf_counter()
+        if self._open:
+            self.phases[self._open[-1]] += now - self._switched_at
+        self._switched_at = now
+    
+    def enter(self, phase: str) -> None:
+        """Open a block of a phase."""
+        self._charge()
+        self._open.append(phase)
+    
+    def exit(self, phase: str) -> None:
+        """Close a block of a phase; blocks from concurrent tasks can close out of order."""
+        self._charge()
+        for i in range(len(self._open) - 1, -1, -1):
+            if self._open[i] == phase:
+                del self._open[i]
+                break
+
+
+class PerfMonitor:
+    """Rolling per-command latency percentiles, split by phase, and error counts.
+    
+    Every command is traced from the bot's before/after invoke hooks. Database
+    waits, formatting and Discord sends are timed where they happen, as wall
+    clock time (see CommandTrace, so neither nested nor concurrent blocks are
+    counted twice); whatever is left of the total is processing. The last PERF_WINDOW invocations of each command are kept.
+    """
+    
+    PHASES = ('total', 'db', 'processing', 'format', 'send')
+    
+    _current: contextvars.ContextVar = contextvars.ContextVar('command_trace', default=None)
+    _samples: Dict[str, Dict[str, deque]] = {}
+    _calls: Dict[str, int] = {}
+    _errors: Dict[str, int] = {}
+    
+    @staticmethod
+    def start(command: str) -> CommandTrace:
+        """Begin tracing a command in the current task."""
+        trace = CommandTrace(command)
+        PerfMonitor._current.set(trace)
+        return trace
+    
+    @staticmethod
+    @contextmanager
+    def measure(phase: str):
+        """Add the time spent in the block to a phase of the current command, if any."""
+        trace = PerfMonitor._current.get()
+        if trace is None:
+            yield
+            return
+        
+        trace.enter(phase)
+        try:
+            yield
+        finally:
+            trace.exit(phase)
+    
+    @staticmethod
+    def mark_error() -> None:
+        """Count the current command as failed even though it handled the error itself."""
+        trace = PerfMonitor._current.get()
+        if trace is not None:
+            trace.error = True
+    
+    @staticmethod
+    def finish(failed: bool = False) -> None:
+        """Record the current command's timings and forget the trace."""
+        trace = PerfMonitor._current.get()
+        if trace is None:
+            return
+        PerfMonitor._current.set(None)
+        
+        total = time.perf_counter() - trace.started
+        timings = dict(trace.phases, total=total)
+        timings['processing'] += max(total - sum(trace.phases.values()), 0.0)
+        
+        samples = PerfMonitor._samples.setdefault(
+            trace.command, {phase: deque(maxlen=PERF_WINDOW) for phase in PerfMonitor.PHASES}
+        )
+        for phase in PerfMonitor.PHASES:
+            samples[phase].append(timings[phase])
+        
+        PerfMonitor._calls[trace.command] = PerfMonitor._calls.get(trace.command, 0) + 1
+        if failed or trace.error:
+            PerfMonitor._errors[trace.command] = PerfMonitor._errors.get(trace.command, 0) + 1
+    
+    @staticmethod
+    def percentiles(command: str) -> Dict[str, Tuple[float, float, float]]:
+        """Get (p50, p95, p99) in milliseconds for each phase of a command."""
+        result = {}
+        for phase, values in PerfMonitor._samples.get(command, {}).items():
+            if values:
+                p50, p95, p99 = np.percentile(np.fromiter(values, dtype=np.float64), [50, 95, 99]) * 1000
+                result[phase] = (p50, p95, p99)
+        return result
+    
+    @staticmethod
+    def format_report(command: str = None) -> List[str]:
+        """Format one block per command, slowest p95 total first."""
+        commands_seen = [command] if command else list(PerfMonitor._samples)
+        reports = [(name, PerfMonitor.percentiles(name)) for name in commands_seen if name in PerfMonitor._samples]
+        reports.sort(key=lambda report: report[1]['total'][1], reverse=True)
+        
+        blocks = []
+        for name, stats in reports:
+            block = f"${name}: {PerfMonitor._calls.get(name, 0)} calls, {PerfMonitor._errors.get(name, 0)} errors\n"
+            block += f"{'phase':<12}{'p50':>9}{'p95':>9}{'p99':>9}  (ms)\n"
+            for phase in PerfMonitor.PHASES:
+                p50, p95, p99 = stats[phase]
+                block += f"{phase:<12}{p50:>9.1f}{p95:>9.1f}{p99:>9.1f}\n"
+            blocks.append(f"```{block}```")
+        return blocks
+
+
+class SchemaMaintenance:
+    """Index bootstrap and query-plan checks, run with `python bot.py --ensure-indexes`."""
+    
+    # (table, index name, columns) for the filters the managers rely on
+    RECOMMENDED_INDEXES = [
+        ('todaysgame', 'idx_todaysgame_type_date', ('Type', 'Date')),
+        ('todaysgame', 'idx_todaysgame_visitor_season_date', ('VisitorTeam', 'Season_ID', 'Date')),
+        ('todaysgame', 'idx_todaysgame_home_season_date', ('HomeTeam', 'Season_ID', 'Date')),
+        ('todaysgame', 'idx_todaysgame_season', ('Season_ID',)),
+        ('transactions', 'idx_transactions_team1_team2_date', ('Team1', 'Team2', 'DateCreated')),
+        ('transactions', 'idx_transactions_team2_date', ('Team2', 'DateCreated')),
+        ('playerstats', 'idx_playerstats_season_gp', ('Season_ID', 'ProGP')),
+        ('goaliestats', 'idx_goaliestats_season', ('Season_ID',)),
+        ('proteamstandings', 'idx_proteamstandings_season', ('Season_ID', 'Number')),
+    ]
+    
+    # Prefix length used when an indexed column is TEXT/BLOB
+    TEXT_PREFIX_LENGTH = 32
+    
+    # Full scans of tables estimated smaller than this are not worth reporting
+    EXPLAIN_MIN_ROWS = 1000
+    
+    @staticmethod
+    def get_indexes(table: str) -> Dict[str, List[str]]:
+        """Get each index on a table with its columns in order."""
+        rows = DatabaseManager.execute_query(
+            """SELECT INDEX_NAME, COLUMN_NAME FROM information_schema.STATISTICS
+               WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+               ORDER BY INDEX_NAME, SEQ_IN_INDEX""",
+            (table,)
+        )
+        indexes: Dict[str, List[str]] = {}
+        for index_name, column_name in rows:
+            indexes.setdefault(index_name, []).append(column_name)
+        return indexes
+    
+    @staticmethod
+    def get_column_types(table: str) -> Dict[str, str]:
+        """Get the data type of each column in a table."""
+        rows = DatabaseManager.execute_query(
+            """SELECT COLUMN_NAME, DATA_TYPE FROM information_schema.COLUMNS
+               WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s""",
+            (table,)
+        )
+        return {column_name: data_type.lower() for column_name, data_type in rows}
+    
+    @staticmethod
+    def ensure_indexes() -> List[str]:
+        """Create any recommended index not already covered by an existing one.
+        
+        An existing index covers a recommendation when its leading columns are the
+        recommended columns, so running this repeatedly is a no-op. Returns the
+        names of the indexes created.
+        """
+        created = []
+        
+        for table, index_name, columns in SchemaMaintenance.RECOMMENDED_INDEXES:
+            existing = SchemaMaintenance.get_indexes(table)
+            wanted = [column.lower() for column in columns]
+            covered = any(
+                [column.lower() for column in index_columns[:len(wanted)]] == wanted
+                for index_columns in existing.values()
+            )
+            if covered:
+                print(f"ok       {table}({', '.join(columns)})")
+                continue
+            
+            column_types = SchemaMaintenance.get_column_types(table)
+            column_defs = []
+            for column in columns:
+                if column_types.get(column, '').endswith(('text', 'blob')):
+                    column_defs.append(f"`{column}`({SchemaMaintenance.TEXT_PREFIX_LENGTH})")
+                else:
+                    column_defs.append(f"`{column}`")
+            
+            DatabaseManager.execute_statement(
+                f"CREATE INDEX `{index_name}` ON `{table}` ({', '.join(column_defs)})"
+            )
+            created.append(index_name)
+            print(f"created  {table}({', '.join(columns)}) as {index_name}")
+        
+        return created
+    
+    @staticmethod
+    async def collect_manager_queries() -> List[Tuple[str, Optional[Tuple]]]:
+        """Run every manager's data access once and return the distinct queries it issued."""
+        teams = await TeamDataManager.get_teams()
+        team1 = teams[0][1] if teams else 'all'
+        team2 = teams[1][1] if len(teams) > 1 else 'all'
+        
+        with DatabaseManager.record_queries() as recorded:
+            await DataVersion.poll()
+            TeamDataManager.invalidate_reference_data()
+            season_id = await TeamDataManager.get_current_season_id()
+            await TeamDataManager.get_teams()
+            await StandingsManager.get_team_stats(season_id)
+            await PlayerStatsManager.get_player_stats(season_id)
+            await PlayerStatsManager.get_merged_player_stats(season_id)
+            await GoalieStatsManager.get_goalie_stats(season_id)
+            await GoalieStatsManager.get_merged_goalie_stats(season_id)
+            await ScoresManager.get_games_for_date(str(date.today()))
+            await ScoresManager.get_farm_games_for_date(str(date.today()))
+            for force_all_seasons in (False, True):
+                await ScoresManager.get_recent_games_for_team(team1, 'all', 10, force_all_seasons)
+                await ScoresManager.get_recent_games_for_team(team1, team2, 10, force_all_seasons)
+            await TradeManager.get_trades_by_player('smith', 5)
+            await TradeManager.get_trades_by_team(team1, 'all', 5)
+            await TradeManager.get_trades_by_team(team1, team2, 5)
+            await TradeManager.get_team_name(1)
+            # Only the current season: past seasons are deliberately read in full once
+            await RecordBook.get_record(team1, 'all', 1)
+        
+        distinct: Dict[str, Optional[Tuple]] = {}
+        for query, params in recorded:
+            distinct.setdefault(query, params)
+        return list(distinct.items())
+    
+    @staticmethod
+    def explain(query: str, params: Optional[Tuple]) -> List[Dict[str, Any]]:
+        """Run EXPLAIN on a query and return its plan rows as dicts."""
+        def read_plan(cursor):
+            return [dict(zip(cursor.column_names, row)) for row in cursor.fetchall()]
+        
+        return DatabaseManager.execute_with_cursor(f"EXPLAIN {query}", params, read_plan)
+    
+    @staticmethod
+    async def check_query_plans() -> int:
+        """EXPLAIN every manager query and print the ones that scan a large table.
+        
+        Returns the number of full scans found.
+        """
+        full_scans = 0
+        
+        for query, params in await SchemaMaintenance.collect_manager_queries():
+            summary = ' '.join(query.split())
+            for step in SchemaMaintenance.explain(query, params):
+                access_type = (step.get('type') or '').upper()
+                rows = step.get('rows') or 0
+                if access_type in ('ALL', 'INDEX') and rows >= SchemaMaintenance.EXPLAIN_MIN_ROWS:
+                    full_scans += 1
+                    print(f"FULL SCAN ({access_type}) of {step.get('table')} ~{rows} rows, "
+                          f"key={step.get('key')}, extra={step.get('Extra')}\n    {summary[:200]}")
+        
+        print(f"{full_scans} full scan(s) found")
+        return full_scans
+
+
 # Bot event handlers
 @client.event
 async def on_ready():
-    print(f'{client.user} has connected to Discord!')
+    log.info("%s has connected to Discord!", client.user)
+
+
+@bot.listen('on_ready')
+async def warm_caches():
+    """Preload reference data, the season snapshot, standings, the trade index and team records so the first commands skip the lookups."""
+    try:
+        await TeamDataManager.warm_up()
+        await DataVersion.poll()
+        await asyncio.gather(SnapshotManager.get_snapshot(), StandingsManager.get_model(), TradeIndex.refresh(),
+                             RecordBook.get_seasons(None))
+    except Exception as e:
+        # Commands load what they need on first use; the watcher still has to run
+        data_log.error("Error warming caches: %s", e)
+    finally:
+        if not watch_data_changes.is_running():
+            watch_data_changes.start()
+
+
+@bot.before_invoke
+async def start_command_trace(ctx):
+    """Trace every command, timing its Discord sends as their own phase."""
+    PerfMonitor.start(ctx.command.qualified_name)
+    
+    send = ctx.send
+    
+    async def timed_send(*args, **kwargs):
+        with PerfMonitor.measure('send'):
+            return await send(*args, **kwargs)
+    
+    ctx.send = timed_send
+
+
+@bot.after_invoke
+async def finish_command_trace(ctx):
+    """Record the finished command's timings."""
+    PerfMonitor.finish(ctx.command_failed)
 
 
 # Bot commands
+async def render_scores(selecteddate: str) -> Dict[str, Any]:
+    """Build the scores message for a date."""
+    games, game_date = await ScoresManager.get_games_for_date(selecteddate)
+    
+    if not games:
+        return {'content': "No games found for the specified date."}
+    
+    game_scores = ScoresManager.format_game_scores(games)
+    title_score = f"the scores for {game_date}"
+    scores_formatted = f"```{game_scores}```"
+    
+    embed = discord.Embed(title=title_score, url='http://mrfhl.com/pro_scores.php', color=0xeee657)
+    embed.add_field(name="Scores", value=scores_formatted)
+    return {'embed': embed}
+
+
 @bot.command(name='scores', help="type $scores followed by the date(ie. $scores 2020/03/29) to get the scores for a specific date")
 async def scoredate(ctx, selecteddate: str = None):
     """Display scores for a specific date."""
@@ -1339,254 +2725,191 @@ async def scoredate(ctx, selecteddate: str = None):
         selecteddate = str(date.today())
 
     try:
-        games, game_date = ScoresManager.get_games_for_date(selecteddate)
-        
-        if not games:
-            await ctx.send("No games found for the specified date.")
-            return
-        
-        game_scores = ScoresManager.format_game_scores(games)
-        title_score = f"the scores for {game_date}"
-        scores_formatted = f"```{game_scores}```"
-        
-        embed = discord.Embed(title=title_score, url='http://mrfhl.com/pro_scores.php', color=0xeee657)
-        embed.add_field(name="Scores", value=scores_formatted)
-        await ctx.send(embed=embed)
-        
+        # Normalize the date so 2020/03/29 and 2020-03-29 share a cache entry
+        selecteddate = str(ScoresManager.parse_date(selecteddate))
+        payload = await RenderCache.get_or_render(('scores', selecteddate), functools.partial(render_scores, selecteddate))
+        await ctx.send(**payload)
     except Exception as e:
+        PerfMonitor.mark_error()
         await ctx.send(f"Error retrieving scores: {str(e)}")
 
 
-@bot.command(name='standings', help="type $standings followed by the division of conference(ie. $standings Pacific, $standings Western) to get the scores for a division or conference. You can view wildcard standings with $standings Western_wildcard. Default is league standings")
-async def standings(ctx, div_con: Optional[str] = None):
-    """Display standings for league, conference, division, or wildcard."""
-    try:
-        season_id = TeamDataManager.get_current_season_id()
+async def render_standings(div_con: Optional[str]) -> Dict[str, Any]:
+    """Build the standings message for the league, a conference, a division or a wildcard view."""
+    # Every view comes precomputed from the standings model
+    model = await StandingsManager.get_model()
+    
+    if div_con is None:
+        # League standings
+        standings1, standings2 = StandingsManager.format_league_standings(model.league)
         
-        if div_con is None:
-            # League standings
-            team_stats = StandingsManager.get_team_stats(season_id)
-            sorted_teams = StandingsManager.sort_standings(team_stats)
-            standings1, standings2 = StandingsManager.format_league_standings(sorted_teams)
+        formatted_standings1 = FormattingUtils.replace_team_names(f"```{standings1}```")
+        formatted_standings2 = FormattingUtils.replace_team_names(f"```{standings2}```")
+        
+        embed = discord.Embed(title="League Standings", color=0xeee657)
+        embed.add_field(name="League Standings", value=formatted_standings1, inline=False)
+        embed.add_field(name="------------------------------", value=formatted_standings2, inline=False)
+    
+    else:
+        # Handle case-insensitive input
+        div_con_lower = div_con.lower()
+        
+        if div_con_lower in StandingsManager.WILDCARD_DIVISIONS:
+            # Wildcard standings
+            (div1_leaders, div2_leaders), wildcard_teams = model.wildcards[div_con_lower]
+            
+            # Format wildcard standings - split into multiple fields to avoid Discord's 1024 char limit
+            header = '    Team' + 'GP'.rjust(4) + "W".rjust(5) + "L".rjust(5) + "OTL".rjust(5) + "P".rjust(5) + '\n'
+            
+            # Format division leaders
+            div1_standings = header
+            for i, team in enumerate(div1_leaders, 1):
+                div1_standings += FormattingUtils.format_standings_row(i, team)
+            
+            div2_standings = header
+            for i, team in enumerate(div2_leaders, 1):
+                div2_standings += FormattingUtils.format_standings_row(i, team)
             
-            formatted_standings1 = FormattingUtils.replace_team_names(f"```{standings1}```")
-            formatted_standings2 = FormattingUtils.replace_team_names(f"```{standings2}```")
+            # Wildcard teams
+            wildcard_standings = header
+            for i, team in enumerate(wildcard_teams, 1):
+                if i == 3:
+                    wildcard_standings += '-----------------------\n'
+                wildcard_standings += FormattingUtils.format_standings_row(i, team)
             
-            embed = discord.Embed(title="League Standings", color=0xeee657)
-            embed.add_field(name="League Standings", value=formatted_standings1, inline=False)
-            embed.add_field(name="------------------------------", value=formatted_standings2, inline=False)
+            # Create embed with multiple fields
+            embed = discord.Embed(title=f"{div_con} Standings", color=0xeee657)
             
+            # Add division leaders
+            div1_name, div2_name = StandingsManager.WILDCARD_DIVISIONS[div_con_lower]
+            embed.add_field(name=f"{div1_name} Leaders", value=FormattingUtils.replace_team_names(f"```{div1_standings}```"), inline=False)
+            embed.add_field(name=f"{div2_name} Leaders", value=FormattingUtils.replace_team_names(f"```{div2_standings}```"), inline=False)
+            
+            # Add wildcard teams
+            embed.add_field(name="Wildcard Teams", value=FormattingUtils.replace_team_names(f"```{wildcard_standings}```"), inline=False)
+        
         else:
-            # Handle case-insensitive input
-            div_con_lower = div_con.lower()
+            # Conference/Division standings - case insensitive mapping
+            if div_con_lower not in StandingsManager.VIEW_ALIASES:
+                return {'content': "We could not find that division, please check spelling(Atlantic/Daigle, Central/Stefan, Northeast/Metro/Brendl, Pacific/Bonsignore, Western, Eastern, Western_wildcard, Eastern_wildcard)"}
             
-            if div_con_lower in ["western_wildcard", "eastern_wildcard"]:
-                # Wildcard standings
-                if div_con_lower == "western_wildcard":
-                    div1_query = "SELECT Number FROM proteam WHERE Division = 'Stefan Division'"
-                    div2_query = "SELECT Number FROM proteam WHERE Division = 'Bonsignore Division'"
-                else:  # Eastern_wildcard
-                    div1_query = "SELECT Number FROM proteam WHERE Division = 'Brendl Division'"
-                    div2_query = "SELECT Number FROM proteam WHERE Division = 'Daigle Division'"
-                
-                div1_teams = DatabaseManager.execute_query(div1_query)
-                div2_teams = DatabaseManager.execute_query(div2_query)
-                
-                div1_numbers = tuple(team[0] for team in div1_teams)
-                div2_numbers = tuple(team[0] for team in div2_teams)
-                
-                div1_stats = StandingsManager.get_team_stats(season_id, div1_numbers)
-                div2_stats = StandingsManager.get_team_stats(season_id, div2_numbers)
-                
-                sorted_div1 = StandingsManager.sort_standings(div1_stats)
-                sorted_div2 = StandingsManager.sort_standings(div2_stats)
-                
-                # Format wildcard standings - split into multiple fields to avoid Discord's 1024 char limit
-                header = '    Team' + 'GP'.rjust(4) + "W".rjust(5) + "L".rjust(5) + "OTL".rjust(5) + "P".rjust(5) + '\n'
-                
-                # Division leaders
-                div1_leaders = sorted_div1[:3]
-                div2_leaders = sorted_div2[:3]
-                
-                # Format division leaders
-                div1_standings = header
-                for i, team in enumerate(div1_leaders, 1):
-                    div1_standings += FormattingUtils.format_standings_row(i, team)
-                
-                div2_standings = header
-                for i, team in enumerate(div2_leaders, 1):
-                    div2_standings += FormattingUtils.format_standings_row(i, team)
-                
-                # Wildcard teams
-                wildcard_teams = sorted_div1[3:] + sorted_div2[3:]
-                wildcard_teams = StandingsManager.sort_standings(wildcard_teams)
+            sorted_teams = model.get_view(*StandingsManager.VIEW_ALIASES[div_con_lower])
+            
+            is_conference = div_con_lower in ["western", "eastern"]
+            
+            # Split standings into multiple fields to avoid Discord's 1024 char limit
+            header = '    Team' + 'GP'.rjust(4) + "W".rjust(5) + "L".rjust(5) + "OTL".rjust(5) + "P".rjust(5) + '\n'
+            
+            if is_conference:
+                # For conferences, split at 10 teams
+                standings1 = header
+                standings2 = header
                 
-                wildcard_standings = header
-                for i, team in enumerate(wildcard_teams, 1):
-                    if i == 3:
-                        wildcard_standings += '-----------------------\n'
-                    wildcard_standings += FormattingUtils.format_standings_row(i, team)
+                for i, team in enumerate(sorted_teams, 1):
+                    row = FormattingUtils.format_standings_row(i, team, False)
+                    if i <= 10:
+                        standings1 += row
+                    else:
+                        standings2 += row
                 
-                # Create embed with multiple fields
                 embed = discord.Embed(title=f"{div_con} Standings", color=0xeee657)
-                
-                # Add division leaders
-                if div_con_lower == "western_wildcard":
-                    embed.add_field(name="Stefan Division Leaders", value=FormattingUtils.replace_team_names(f"```{div1_standings}```"), inline=False)
-                    embed.add_field(name="Bonsignore Division Leaders", value=FormattingUtils.replace_team_names(f"```{div2_standings}```"), inline=False)
-                else:  # Eastern_wildcard
-                    embed.add_field(name="Brendl Division Leaders", value=FormattingUtils.replace_team_names(f"```{div1_standings}```"), inline=False)
-                    embed.add_field(name="Daigle Division Leaders", value=FormattingUtils.replace_team_names(f"```{div2_standings}```"), inline=False)
-                
-                # Add wildcard teams
-                embed.add_field(name="Wildcard Teams", value=FormattingUtils.replace_team_names(f"```{wildcard_standings}```"), inline=False)
-                
+                embed.add_field(name=f"{div_con} Standings (Top 10)", value=FormattingUtils.replace_team_names(f"```{standings1}```"), inline=False)
+                if len(sorted_teams) > 10:
+                    embed.add_field(name=f"{div_con} Standings (11+)", value=FormattingUtils.replace_team_names(f"```{standings2}```"), inline=False)
             else:
-                # Conference/Division standings - case insensitive mapping
-                division_queries = {
-                    "western": "SELECT Number FROM proteam WHERE Conference = 'Western'",
-                    "eastern": "SELECT Number FROM proteam WHERE Conference = 'Eastern'",
-                    "pacific": "SELECT Number FROM proteam WHERE Division = 'Bonsignore Division'",
-                    "bonsignore": "SELECT Number FROM proteam WHERE Division = 'Bonsignore Division'",
-                    "northeast": "SELECT Number FROM proteam WHERE Division = 'Brendl Division'",
-                    "metro": "SELECT Number FROM proteam WHERE Division = 'Brendl Division'",
-                    "metropolitan": "SELECT Number FROM proteam WHERE Division = 'Brendl Division'",
-                    "brendl": "SELECT Number FROM proteam WHERE Division = 'Brendl Division'",
-                    "atlantic": "SELECT Number FROM proteam WHERE Division = 'Daigle Division'",
-                    "daigle": "SELECT Number FROM proteam WHERE Division = 'Daigle Division'",
-                    "central": "SELECT Number FROM proteam WHERE Division = 'Stefan Division'",
-                    "stefan": "SELECT Number FROM proteam WHERE Division = 'Stefan Division'"
-                }
-                
-                if div_con_lower not in division_queries:
-                    await ctx.send("We could not find that division, please check spelling(Atlantic/Daigle, Central/Stefan, Northeast/Metro/Brendl, Pacific/Bonsignore, Western, Eastern, Western_wildcard, Eastern_wildcard)")
-                    return
+                # For divisions, split at 3 teams
+                standings1 = header
+                standings2 = header
                 
-                query = division_queries[div_con_lower]
-                team_numbers = DatabaseManager.execute_query(query)
-                team_numbers_tuple = tuple(team[0] for team in team_numbers)
-                
-                team_stats = StandingsManager.get_team_stats(season_id, team_numbers_tuple)
-                sorted_teams = StandingsManager.sort_standings(team_stats)
-                
-                is_conference = div_con_lower in ["western", "eastern"]
-                
-                # Split standings into multiple fields to avoid Discord's 1024 char limit
-                header = '    Team' + 'GP'.rjust(4) + "W".rjust(5) + "L".rjust(5) + "OTL".rjust(5) + "P".rjust(5) + '\n'
+                for i, team in enumerate(sorted_teams, 1):
+                    row = FormattingUtils.format_standings_row(i, team, True)
+                    if i <= 3:
+                        standings1 += row
+                    else:
+                        standings2 += row
                 
-                if is_conference:
-                    # For conferences, split at 10 teams
-                    standings1 = header
-                    standings2 = header
-                    
-                    for i, team in enumerate(sorted_teams, 1):
-                        row = FormattingUtils.format_standings_row(i, team, False)
-                        if i <= 10:
-                            standings1 += row
-                        else:
-                            standings2 += row
-                    
-                    embed = discord.Embed(title=f"{div_con} Standings", color=0xeee657)
-                    embed.add_field(name=f"{div_con} Standings (Top 10)", value=FormattingUtils.replace_team_names(f"```{standings1}```"), inline=False)
-                    if len(sorted_teams) > 10:
-                        embed.add_field(name=f"{div_con} Standings (11+)", value=FormattingUtils.replace_team_names(f"```{standings2}```"), inline=False)
-                else:
-                    # For divisions, split at 3 teams
-                    standings1 = header
-                    standings2 = header
-                    
-                    for i, team in enumerate(sorted_teams, 1):
-                        row = FormattingUtils.format_standings_row(i, team, True)
-                        if i <= 3:
-                            standings1 += row
-                        else:
-                            standings2 += row
-                    
-                    embed = discord.Embed(title=f"{div_con} Standings", color=0xeee657)
-                    embed.add_field(name=f"{div_con} Standings (Top 3)", value=FormattingUtils.replace_team_names(f"```{standings1}```"), inline=False)
-                    if len(sorted_teams) > 3:
-                        embed.add_field(name=f"{div_con} Standings (4+)", value=FormattingUtils.replace_team_names(f"```{standings2}```"), inline=False)
-        
-        await ctx.send(embed=embed)
-        
+                embed = discord.Embed(title=f"{div_con} Standings", color=0xeee657)
+                embed.add_field(name=f"{div_con} Standings (Top 3)", value=FormattingUtils.replace_team_names(f"```{standings1}```"), inline=False)
+                if len(sorted_teams) > 3:
+                    embed.add_field(name=f"{div_con} Standings (4+)", value=FormattingUtils.replace_team_names(f"```{standings2}```"), inline=False)
+    
+    return {'embed': embed}
+
+
+@bot.command(name='standings', help="type $standings followed by the division of conference(ie. $standings Pacific, $standings Western) to get the scores for a division or conference. You can view wildcard standings with $standings Western_wildcard. Default is league standings")
+async def standings(ctx, div_con: Optional[str] = None):
+    """Display standings for league, conference, division, or wildcard."""
+    try:
+        payload = await RenderCache.get_or_render(('standings', div_con), functools.partial(render_standings, div_con))
+        await ctx.send(**payload)
     except Exception as e:
+        PerfMonitor.mark_error()
         await ctx.send(f"Error retrieving standings: {str(e)}")
 
 
+async def render_scoring_leaders(team_selected: str, position: str, stat: str) -> Dict[str, Any]:
+    """Build the scoring leaders message."""
+    team_selected = TeamDataManager.clean_team_name(team_selected)
+    
+    # Merged player stats with positions come from the in-memory snapshot
+    snapshot = await SnapshotManager.get_snapshot()
+    
+    # Filter and take the top 10
+    top_players = PlayerStatsManager.get_leaders(snapshot.skaters, team_selected, position, stat, 10)
+    
+    if not top_players:
+        return {'content': "No players found matching the specified criteria."}
+    
+    # Format and display
+    player_leaders = PlayerStatsManager.format_player_leaders(top_players, stat)
+    players_formatted = f"```{player_leaders}```"
+    
+    embed = discord.Embed(title=f"{stat} Leaders", color=0xeee657)
+    embed.add_field(name="Players", value=players_formatted)
+    return {'embed': embed}
+
+
 @bot.command(name='scoring_leaders', help="type $scoring_leaders followed by the team you want to filter by, then the position, then the stat for example $scoring_leaders Flames D Goals will give you the flames Defence Goal leaders, $scoring_leaders all F Hits will give you the forward hit leaders for the entire league. positions are C, RW, LW, D. available stats are Points, Goals, Assists, Hits, Pims, +/-, Shots, ShotsBlocked, and GWG. If a team has a space in it's name it requires an underscore ie. $scoring_leaders Golden_Knights")
 async def scoring_leaders(ctx, team_selected: str = 'all', position: str = 'all', stat: str = 'Points'):
     """Display scoring leaders for specified criteria."""
     try:
-        season_id = TeamDataManager.get_current_season_id()
+        # "EDM", "oilers" and "Olers" all share one cached render
         team_selected = TeamDataManager.clean_team_name(team_selected)
-        
-        # Get player stats
-        player_stats = PlayerStatsManager.get_player_stats(season_id)
-        merged_players = PlayerDataManager.merge_traded_players(player_stats)
-        players_with_positions = PlayerDataManager.add_positions_to_players(merged_players)
-        
-        # Filter players
-        filtered_players = PlayerStatsManager.filter_players_by_team_and_position(
-            players_with_positions, team_selected, position
-        )
-        
-        # Sort players
-        sorted_players = PlayerStatsManager.sort_players_by_stat(filtered_players, stat)
-        
-        # Limit to top 10
-        amount_to_display = min(10, len(sorted_players))
-        top_players = sorted_players[:amount_to_display]
-        
-        if not top_players:
-            await ctx.send("No players found matching the specified criteria.")
-            return
-        
-        # Format and display
-        player_leaders = PlayerStatsManager.format_player_leaders(top_players, stat)
-        players_formatted = f"```{player_leaders}```"
-        
-        embed = discord.Embed(title=f"{stat} Leaders", color=0xeee657)
-        embed.add_field(name="Players", value=players_formatted)
-        await ctx.send(embed=embed)
-        
+        payload = await RenderCache.get_or_render(('scoring_leaders', team_selected, position, stat), functools.partial(render_scoring_leaders, team_selected, position, stat))
+        await ctx.send(**payload)
     except Exception as e:
+        PerfMonitor.mark_error()
         await ctx.send(f"Error retrieving scoring leaders: {str(e)}")
 
 
+async def render_goalie_leaders(stat: str, amount_wanted: int, games_wanted: int) -> Dict[str, Any]:
+    """Build the goalie leaders message."""
+    # Merged goalie stats with SV% and GAA come from the in-memory snapshot
+    snapshot = await SnapshotManager.get_snapshot()
+    
+    # Filter by games played and take the requested amount
+    top_goalies = GoalieStatsManager.get_leaders(snapshot.goalies, stat, amount_wanted, games_wanted)
+    
+    if not top_goalies:
+        return {'content': "No goalies found matching the specified criteria."}
+    
+    # Format and display
+    goalie_leaders = GoalieStatsManager.format_goalie_leaders(top_goalies, stat)
+    goalies_formatted = f"```{goalie_leaders}```"
+    
+    embed = discord.Embed(title=f"Goalie Leaders for {stat}", color=0xeee657)
+    embed.add_field(name="Goalies", value=goalies_formatted)
+    return {'embed': embed}
+
+
 @bot.command(name='goalie_leaders', help="type $goalie_leaders followed by the stat you wish to see(ie. $goalie_leaders GAA, SV%, W, GP, SO, L, S) to get the top ten goalies by a certain stat. you can add a second argument to get more goalies, and a third argument to filter by games played. The default stat is save percentage, the default games played is 0, and the default amount of goalies is ten. For example $goalie_leaders will give you the top ten goalies in save percentage out of all goalies. $goalie_leaders GAA 15 10 will give you the top 15 goalies in GAA who have played more than 10 games")
 async def goalie_leaders(ctx, stat: str = 'SV%', amount_wanted: int = 10, games_wanted: int = 0):
     """Display goalie leaders for specified criteria."""
     try:
-        season_id = TeamDataManager.get_current_season_id()
-        
-        # Get goalie stats
-        goalie_stats = GoalieStatsManager.get_goalie_stats(season_id)
-        merged_goalies = GoalieStatsManager.merge_traded_goalies(goalie_stats)
-        goalies_with_stats = GoalieStatsManager.calculate_goalie_stats(merged_goalies)
-        
-        # Filter by games played
-        filtered_goalies = [g for g in goalies_with_stats if g['GP'] >= games_wanted]
-        
-        # Sort goalies
-        sorted_goalies = GoalieStatsManager.sort_goalies_by_stat(filtered_goalies, stat)
-        
-        # Limit to requested amount
-        amount_to_display = min(amount_wanted, len(sorted_goalies))
-        top_goalies = sorted_goalies[:amount_to_display]
-        
-        if not top_goalies:
-            await ctx.send("No goalies found matching the specified criteria.")
-            return
-        
-        # Format and display
-        goalie_leaders = GoalieStatsManager.format_goalie_leaders(top_goalies, stat)
-        goalies_formatted = f"```{goalie_leaders}```"
-        
-        embed = discord.Embed(title=f"Goalie Leaders for {stat}", color=0xeee657)
-        embed.add_field(name="Goalies", value=goalies_formatted)
-        await ctx.send(embed=embed)
-        
+        payload = await RenderCache.get_or_render(('goalie_leaders', stat, amount_wanted, games_wanted), functools.partial(render_goalie_leaders, stat, amount_wanted, games_wanted))
+        await ctx.send(**payload)
     except Exception as e:
+        PerfMonitor.mark_error()
         await ctx.send(f"Error retrieving goalie leaders: {str(e)}")
 
 
@@ -1602,6 +2925,8 @@ async def scores_by_team(ctx, team1: str, team2: str = 'all', num_games: int = 1
             # third arg may override num_games
             # ctx.message.content split handled by discord.py but easier parse using *args; here we rely on signature default
             pass
+        team1 = TeamDataManager.clean_team_name(team1)
+        team2 = TeamDataManager.clean_team_name(team2)
         # Clamp
         num_games = min(max(int(num_games), 1), 82)
 
@@ -1610,24 +2935,33 @@ async def scores_by_team(ctx, team1: str, team2: str = 'all', num_games: int = 1
         # If user specified default 10, show only current season
         force_all_seasons = (num_games != 10) or (ctx.message.content.split()[-1].isdigit())
         
-        games = ScoresManager.get_recent_games_for_team(team1, team2, num_games, force_all_seasons)
+        games = await SingleFlight.run(
+            ('recent_games', team1.lower(), team2.lower(), num_games, force_all_seasons, DataVersion.key(DataVersion.GAME_WATERMARKS)),
+            functools.partial(ScoresManager.get_recent_games_for_team, team1, team2, num_games, force_all_seasons)
+        )
         if not games:
             season_context = "this season" if not force_all_seasons else "all time"
             await ctx.send(f"No games found for {team1.title()} {season_context} matching those criteria.")
             return
         
-        games_formatted = ScoresManager.format_games_list(games, team1, team2)
-        
-        # Create appropriate title based on context
-        if force_all_seasons:
-            embed_title = f"Last {len(games)} games: {team1.title()}" + (f" vs {team2.title()}" if team2 != 'all' else '') + " (all time)"
-        else:
-            embed_title = f"Last {len(games)} games: {team1.title()}" + (f" vs {team2.title()}" if team2 != 'all' else '') + " (this season)"
+        with PerfMonitor.measure('format'):
+            games_formatted = ScoresManager.format_games_list(games)
             
-        embed = discord.Embed(title=embed_title, color=0xeee657)
-        embed.add_field(name="Games", value=f"```{games_formatted}```", inline=False)
+            # Create appropriate title based on context
+            if force_all_seasons:
+                embed_title = f"Last {len(games)} games: {team1.title()}" + (f" vs {team2.title()}" if team2 != 'all' else '') + " (all time)"
+            else:
+                embed_title = f"Last {len(games)} games: {team1.title()}" + (f" vs {team2.title()}" if team2 != 'all' else '') + " (this season)"
+                
+            embed = discord.Embed(title=embed_title, color=0xeee657)
+            embed.add_field(name="Games", value=f"```{games_formatted}```", inline=False)
+        
+        # Record over the whole span, counted in memory rather than from the listed games
+        span_record = await RecordBook.describe(team1, team2, None if force_all_seasons else 1)
+        embed.add_field(name="All-time record" if force_all_seasons else "Season record", value=span_record, inline=False)
         await ctx.send(embed=embed)
     except Exception as e:
+        PerfMonitor.mark_error()
         await ctx.send(f"Error retrieving games: {str(e)}")
 
 
@@ -1638,20 +2972,20 @@ async def trades_by_player(ctx, player_name: str, limit: int = 5):
         # Clamp limit to reasonable range
         limit = min(max(int(limit), 1), 50)
         
-        trades = TradeManager.get_trades_by_player(player_name, limit)
+        trades = await SingleFlight.run(
+            ('trades_by_player', TradeIndex.normalize_name(player_name), limit, DataVersion.key(DataVersion.TRADE_WATERMARKS)),
+            functools.partial(TradeManager.get_trades_by_player, player_name, limit)
+        )
         if not trades:
             await ctx.send(f"No trade history found for {player_name.title()}.")
             return
         
-        # Send header message
-        await ctx.send(f"**Trade History for {player_name.title()}** ({len(trades)} trades found)")
-        
-        # Send each trade as a separate message
-        for i, trade in enumerate(trades, 1):
-            trade_message = TradeManager.format_single_trade(trade, i)
-            await ctx.send(trade_message)
+        # Pack as many trades as fit into each message, further pages on reactions
+        header = f"**Trade History for {player_name.title()}** ({len(trades)} trades found)"
+        await MessagePaginator(header, trades, TradeManager.format_single_trade).send(ctx)
             
     except Exception as e:
+        PerfMonitor.mark_error()
         await ctx.send(f"Error retrieving trade history: {str(e)}")
 
 
@@ -1663,11 +2997,16 @@ async def trades_by_team(ctx, team1: str, team2: str = 'all', limit: int = 5):
         if isinstance(team2, str) and team2.isdigit():
             limit = int(team2)
             team2 = 'all'
+        team1 = TeamDataManager.clean_team_name(team1)
+        team2 = TeamDataManager.clean_team_name(team2)
         
         # Clamp limit to reasonable range
         limit = min(max(int(limit), 1), 50)
         
-        trades = TradeManager.get_trades_by_team(team1, team2, limit)
+        trades = await SingleFlight.run(
+            ('trades_by_team', team1.lower(), team2.lower(), limit, DataVersion.key(DataVersion.TRADE_WATERMARKS)),
+            functools.partial(TradeManager.get_trades_by_team, team1, team2, limit)
+        )
         if not trades:
             if team2 == 'all':
                 await ctx.send(f"No trade history found for {team1.title()}.")
@@ -1675,18 +3014,16 @@ async def trades_by_team(ctx, team1: str, team2: str = 'all', limit: int = 5):
                 await ctx.send(f"No trade history found between {team1.title()} and {team2.title()}.")
             return
         
-        # Send header message
         if team2 == 'all':
-            await ctx.send(f"**Trade History for {team1.title()}** ({len(trades)} trades found)")
+            header = f"**Trade History for {team1.title()}** ({len(trades)} trades found)"
         else:
-            await ctx.send(f"**Trade History between {team1.title()} and {team2.title()}** ({len(trades)} trades found)")
+            header = f"**Trade History between {team1.title()} and {team2.title()}** ({len(trades)} trades found)"
         
-        # Send each trade as a separate message
-        for i, trade in enumerate(trades, 1):
-            trade_message = TradeManager.format_single_trade(trade, i)
-            await ctx.send(trade_message)
+        # Pack as many trades as fit into each message, further pages on reactions
+        await MessagePaginator(header, trades, TradeManager.format_single_trade).send(ctx)
             
     except Exception as e:
+        PerfMonitor.mark_error()
         await ctx.send(f"Error retrieving trade history: {str(e)}")
 
 
@@ -1720,7 +3057,7 @@ async def trades_by_team(ctx, team1: str, team2: str = 'all', limit: int = 5):
 #                 season_id = arg2
 #         
 #         # Get award winners
-#         award_winners = AwardsManager.get_award_winners(award_name, season_id)
+#         award_winners = await AwardsManager.get_award_winners(award_name, season_id)
 #         
 #         if not award_winners:
 #             if season_id == "all":
@@ -1730,7 +3067,7 @@ async def trades_by_team(ctx, team1: str, team2: str = 'all', limit: int = 5):
 #             return
 #         
 #         # Format and display
-#         awards_formatted = AwardsManager.format_awards(award_winners, award_name, season_id)
+#         awards_formatted = await AwardsManager.format_awards(award_winners, award_name, season_id)
 #         
 #         # Check if we need to split into multiple messages due to Discord limits
 #         if len(awards_formatted) > 1900:
@@ -1752,6 +3089,22 @@ async def trades_by_team(ctx, team1: str, team2: str = 'all', limit: int = 5):
 
 
 # New command: Farm scores
+async def render_farm_scores(selecteddate: str) -> Dict[str, Any]:
+    """Build the farm scores message for a date."""
+    games, game_date = await ScoresManager.get_farm_games_for_date(selecteddate)
+    
+    if not games:
+        return {'content': "No farm games found for the specified date."}
+    
+    game_scores = ScoresManager.format_game_scores(games)
+    title_score = f"the farm scores for {game_date}"
+    scores_formatted = f"```{game_scores}```"
+    
+    embed = discord.Embed(title=title_score, url='http://mrfhl.com/farm_scores.php', color=0xeee657)
+    embed.add_field(name="Farm Scores", value=scores_formatted)
+    return {'embed': embed}
+
+
 @bot.command(name='scores_farm', help="type $scores_farm followed by the date(ie. $scores_farm 2020/03/29) to get the farm scores for a specific date")
 async def scores_farm(ctx, selecteddate: str = None):
     """Display farm scores for a specific date."""
@@ -1760,25 +3113,70 @@ async def scores_farm(ctx, selecteddate: str = None):
         selecteddate = str(date.today())
 
     try:
-        games, game_date = ScoresManager.get_farm_games_for_date(selecteddate)
+        # Normalize the date so 2020/03/29 and 2020-03-29 share a cache entry
+        selecteddate = str(ScoresManager.parse_date(selecteddate))
+        payload = await RenderCache.get_or_render(('scores_farm', selecteddate), functools.partial(render_farm_scores, selecteddate))
+        await ctx.send(**payload)
+    except Exception as e:
+        PerfMonitor.mark_error()
+        await ctx.send(f"Error retrieving farm scores: {str(e)}")
 
-        if not games:
-            await ctx.send("No farm games found for the specified date.")
-            return
 
-        game_scores = ScoresManager.format_game_scores(games)
-        title_score = f"the farm scores for {game_date}"
-        scores_formatted = f"```{game_scores}```"
+@bot.command(name='perf', help="Owner only. Usage: $perf [command]. Shows p50/p95/p99 latency per phase (db, processing, format, send) and error counts for recent commands")
+@commands.is_owner()
+async def perf(ctx, command_name: str = None):
+    """Display command latency percentiles and error counts."""
+    blocks = PerfMonitor.format_report(command_name.lstrip('$') if command_name else None)
+    if not blocks:
+        await ctx.send("No commands recorded yet.")
+        return
+    
+    async def format_block(block: str, number: int) -> str:
+        return block
+    
+    header = f"**Command latency** (last {PERF_WINDOW} runs per command)"
+    await MessagePaginator(header, blocks, format_block).send(ctx)
 
-        embed = discord.Embed(title=title_score, url='http://mrfhl.com/farm_scores.php', color=0xeee657)
-        embed.add_field(name="Farm Scores", value=scores_formatted)
-        await ctx.send(embed=embed)
 
-    except Exception as e:
-        await ctx.send(f"Error retrieving farm scores: {str(e)}")
+@bot.command(name='queries', help="Owner only. Usage: $queries [total|max|calls|rows] [limit]. Shows the most expensive SQL statements since startup, grouped by fingerprint")
+@commands.is_owner()
+async def queries(ctx, sort_by: str = 'total', limit: int = 10):
+    """Display the top query fingerprints."""
+    if sort_by not in ('total', 'max', 'calls', 'rows'):
+        await ctx.send("Sort by one of: total, max, calls, rows.")
+        return
+    
+    blocks = QueryProfiler.format_top(min(max(int(limit), 1), 50), sort_by)
+    if not blocks:
+        await ctx.send("No queries recorded yet.")
+        return
+    
+    async def format_block(block: str, number: int) -> str:
+        return f"**{number}.** ```{block}```"
+    
+    header = f"**Top queries by {sort_by}** (threshold for the slow-query log: {SLOW_QUERY_THRESHOLD * 1000:.0f} ms)"
+    await MessagePaginator(header, blocks, format_block).send(ctx)
 
 
 # Run the bot
 if __name__ == "__main__":
-    print("Starting Discord bot... (press Ctrl+C to quit)")
-    bot.run(TOKEN)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="MRFHL Discord bot")
+    parser.add_argument('--ensure-indexes', action='store_true',
+                        help="create the recommended database indexes, check query plans and exit")
+    parser.add_argument('--check-queries', action='store_true',
+                        help="EXPLAIN every query the bot issues, report full scans and exit")
+    args = parser.parse_args()
+    
+    log_listener = setup_logging()
+    try:
+        if args.ensure_indexes or args.check_queries:
+            if args.ensure_indexes:
+                SchemaMaintenance.ensure_indexes()
+            full_scans = asyncio.run(SchemaMaintenance.check_query_plans())
+            sys.exit(1 if full_scans else 0)
+        
+        log.info("Starting Discord bot... (press Ctrl+C to quit)")
+        bot.run(TOKEN)
+    finally:
+        QueryProfiler.log_top()
+        log_listener.stop()
\ No newline at end of file
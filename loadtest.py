@@ -0,0 +1,227 @@
+"""Concurrent load test for the bot's commands.
+
+Loads a generated league the same way bench.py does, then fires a mix of
+command invocations ($scores, $standings, $scoring_leaders, $goalie_leaders,
+$scores_by_team, $trades_by_player, $trades_by_team, $scores_farm) at the
+command callbacks concurrently. Each invocation gets a stub context whose
+send() records the message instead of talking to Discord, and goes through
+the same before/after invoke hooks as a real command.
+
+Reports throughput, latency percentiles overall and per command, errors, and
+how long the event loop was stalled (measured by a ticker that should wake
+every --tick milliseconds).
+
+    python loadtest.py
+    python loadtest.py --invocations 5000 --concurrency 500 --seasons 20
+    python loadtest.py --data-change-every 0.5   # new sim data mid-run
+"""
+import argparse
+import asyncio
+import random
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+
+import bench
+import bot
+
+
+class StubMessage:
+    """Stands in for a sent discord.Message."""
+
+    def __init__(self, content: str = ''):
+        self.id = id(self)
+        self.content = content
+
+    async def add_reaction(self, emoji: str) -> None:
+        pass
+
+    async def edit(self, **kwargs) -> None:
+        pass
+
+    async def remove_reaction(self, emoji: str, user: Any) -> None:
+        pass
+
+    async def clear_reactions(self) -> None:
+        pass
+
+
+class StubContext:
+    """Stands in for commands.Context, recording every send."""
+
+    def __init__(self, command_name: str, args: Tuple):
+        self.command = bot.bot.get_command(command_name)
+        self.message = StubMessage(' '.join(['$' + command_name] + [str(arg) for arg in args]))
+        self.command_failed = False
+        self.sent: List[Dict[str, Any]] = []
+
+    async def send(self, content: str = None, **kwargs) -> StubMessage:
+        self.sent.append(dict(kwargs, content=content))
+        return StubMessage(content or '')
+
+
+def command_mix(tables: Dict[str, List[Tuple]], rng: random.Random) -> List[Tuple[int, Callable[[], Tuple[str, Tuple]]]]:
+    """(weight, make invocation) pairs; each call returns (command name, args)."""
+    teams = [team[1].replace(' ', '_') for team in tables['proteam']]
+    days = sorted({str(game[0].date()) for game in tables['todaysgame']})
+    recent_days = days[-30:]
+    players = [entry for trade in tables['transactions'][-200:] for entry in trade[4].split('<br>') if entry]
+    views = [None, 'Western', 'Eastern', 'Pacific', 'Central', 'Western_wildcard', 'Eastern_wildcard']
+    stats = ['Points', 'Goals', 'Assists', 'Hits', 'Pims', '+/-', 'Shots', 'ShotsBlocked', 'GWG', 'P/G']
+
+    return [
+        (20, lambda: ('scores', (rng.choice(recent_days),))),
+        (5, lambda: ('scores_farm', (rng.choice(recent_days),))),
+        (20, lambda: ('standings', (rng.choice(views),))),
+        (15, lambda: ('scoring_leaders', (rng.choice(['all'] * 3 + teams), rng.choice(['all', 'C', 'LW', 'RW', 'D', 'F']), rng.choice(stats)))),
+        (10, lambda: ('goalie_leaders', (rng.choice(['SV%', 'GAA', 'W', 'SO']), 10, rng.choice([0, 5, 10])))),
+        (15, lambda: ('scores_by_team', (rng.choice(teams), rng.choice(['all', 'all', rng.choice(teams)]), rng.choice([10, 20, 82])))),
+        (8, lambda: ('trades_by_team', (rng.choice(teams), 'all', rng.choice([5, 20, 50])))),
+        (7, lambda: ('trades_by_player', (rng.choice(players).replace(' ', '_'), 5))),
+    ]
+
+
+async def invoke(command_name: str, args: Tuple) -> Tuple[str, float, bool, int]:
+    """Run one command like discord.py would. Returns (command, seconds, failed, sends)."""
+    ctx = StubContext(command_name, args)
+    started = time.perf_counter()
+    failed = False
+
+    await bot.start_command_trace(ctx)
+    try:
+        await ctx.command.callback(ctx, *[arg for arg in args if arg is not None])
+    except Exception:
+        failed = ctx.command_failed = True
+    finally:
+        await bot.finish_command_trace(ctx)
+
+    # Commands report handled errors to the channel instead of raising
+    failed = failed or any(str(message['content']).startswith('Error ') for message in ctx.sent)
+    return command_name, time.perf_counter() - started, failed, len(ctx.sent)
+
+
+async def measure_loop_lag(tick: float, lags: List[float], stop: asyncio.Event) -> None:
+    """Record how late each tick wakes up; lateness is time the loop was blocked."""
+    while not stop.is_set():
+        expected = time.perf_counter() + tick
+        await asyncio.sleep(tick)
+        lags.append(max(time.perf_counter() - expected, 0.0))
+
+
+async def publish_data_changes(interval: float, stop: asyncio.Event) -> None:
+    """Move the game watermarks as if the simulator wrote new results."""
+    while not stop.is_set():
+        await asyncio.sleep(interval)
+        watermarks = bot.DataVersion.watermarks
+        bot.DataVersion.watermarks = dict(watermarks, games_played=(watermarks.get('games_played') or 0) + 1)
+
+
+async def run_load(tables: Dict[str, List[Tuple]], args: argparse.Namespace) -> Dict[str, Any]:
+    """Fire the invocations and collect latencies, errors and loop lag."""
+    rng = random.Random(args.seed)
+    mix = command_mix(tables, rng)
+    weights = [weight for weight, _ in mix]
+    makers = [make for _, make in mix]
+    invocations = [rng.choices(makers, weights)[0]() for _ in range(args.invocations)]
+
+    # Start from a warm bot, as after on_ready
+    await bot.TeamDataManager.warm_up()
+    await bot.DataVersion.poll()
+    await asyncio.gather(bot.SnapshotManager.get_snapshot(), bot.StandingsManager.get_model(), bot.TradeIndex.refresh(),
+                         bot.RecordBook.get_seasons(None))
+
+    limit = asyncio.Semaphore(args.concurrency)
+
+    async def limited(command_name: str, command_args: Tuple):
+        async with limit:
+            return await invoke(command_name, command_args)
+
+    stop = asyncio.Event()
+    lags: List[float] = []
+    background = [asyncio.ensure_future(measure_loop_lag(args.tick / 1000, lags, stop))]
+    if args.data_change_every:
+        background.append(asyncio.ensure_future(publish_data_changes(args.data_change_every, stop)))
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(limited(name, command_args) for name, command_args in invocations))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    for task in background:
+        task.cancel()
+    await asyncio.gather(*background, return_exceptions=True)
+
+    return {'results': results, 'elapsed': elapsed, 'lags': lags}
+
+
+def percentiles_ms(values: List[float]) -> str:
+    """Format p50/p95/p99/max of a list of seconds in milliseconds."""
+    if not values:
+        return f"{'-':>9}{'-':>9}{'-':>9}{'-':>9}"
+    p50, p95, p99 = np.percentile(values, [50, 95, 99]) * 1000
+    return f"{p50:>9.1f}{p95:>9.1f}{p99:>9.1f}{max(values) * 1000:>9.1f}"
+
+
+def format_report(run: Dict[str, Any], args: argparse.Namespace, summary: str) -> str:
+    """Format throughput, latency per command and loop stall figures."""
+    results = run['results']
+    by_command: Dict[str, List[Tuple[float, bool, int]]] = {}
+    for command_name, seconds, failed, sends in results:
+        by_command.setdefault(command_name, []).append((seconds, failed, sends))
+
+    lines = [summary, '']
+    lines.append(f"{len(results)} invocations in {run['elapsed']:.2f} s = {len(results) / run['elapsed']:.0f}/s "
+                 f"(concurrency {args.concurrency}), {sum(r[3] for r in results)} sends, "
+                 f"{sum(r[2] for r in results)} errors")
+    lines.append('')
+    lines.append(f"{'command':<20}{'calls':>7}{'errors':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}")
+    lines.append(f"{'all':<20}{len(results):>7}{sum(r[2] for r in results):>8}{percentiles_ms([r[1] for r in results])}")
+    for command_name, rows in sorted(by_command.items()):
+        errors = sum(failed for _, failed, _ in rows)
+        lines.append(f"{command_name:<20}{len(rows):>7}{errors:>8}{percentiles_ms([seconds for seconds, _, _ in rows])}")
+
+    lags = run['lags']
+    stalled = sum(lag for lag in lags if lag > args.tick / 1000)
+    lines.append('')
+    lines.append(f"event loop lag over {len(lags)} ticks of {args.tick:.0f} ms: "
+                 f"p50/p95/p99/max{percentiles_ms(lags)} ms, {stalled * 1000:.0f} ms stalled in total")
+    return '\n'.join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fire concurrent bot commands at a generated league")
+    parser.add_argument('--invocations', type=int, default=2000, help="commands to run (default 2000)")
+    parser.add_argument('--concurrency', type=int, default=200, help="commands in flight at once (default 200)")
+    parser.add_argument('--tick', type=float, default=10, help="event loop lag probe interval in ms (default 10)")
+    parser.add_argument('--data-change-every', type=float, default=0,
+                        help="publish new game watermarks every this many seconds (default never)")
+    parser.add_argument('--teams', type=int, default=32, help="teams in the league (default 32)")
+    parser.add_argument('--seasons', type=int, default=10, help="seasons of history (default 10)")
+    parser.add_argument('--seed', type=int, default=1, help="random seed for the league and the command mix")
+    parser.add_argument('--backend', choices=('sqlite', 'mysql'), default='sqlite')
+    parser.add_argument('--sqlite-path', help="SQLite file to build (default: a temporary file)")
+    parser.add_argument('--mysql-database', default='simbot_bench', help="scratch MySQL database (dropped and recreated)")
+    parser.add_argument('--no-indexes', action='store_true', help="skip the indexes from --ensure-indexes")
+    args = parser.parse_args()
+
+    tables = bench.generate_league(args.teams, args.seasons, 82, 25, 3, 60, args.seed)
+    connect, disconnect_errors = bench.connect_backend(args)
+    connection = connect()
+    bench.load_league(connection, tables, not args.no_indexes)
+    connection.close()
+    bot.DatabaseManager.set_pool(bot.ConnectionPool(connect, disconnect_errors=disconnect_errors))
+
+    # Nobody reacts to paged output during a load test
+    async def no_reactions(*args, **kwargs):
+        raise asyncio.TimeoutError
+
+    bot.bot.wait_for = no_reactions
+
+    run = asyncio.run(run_load(tables, args))
+    summary = f"{args.backend}: {args.teams} teams, {args.seasons} seasons, {bot.DB_POOL_SIZE} pooled connections"
+    print(format_report(run, args, summary))
+
+
+if __name__ == "__main__":
+    main()